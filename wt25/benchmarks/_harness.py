@@ -0,0 +1,87 @@
+"""
+Shared setup for the benchmarks that drive the app headless
+
+Runs the app on the toga_dummy backend (pip install toga-dummy) with its
+database and cache in a temporary directory.
+"""
+
+import asyncio
+import contextlib
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+os.environ.setdefault('TOGA_BACKEND', 'toga_dummy')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import toga
+
+from wt25.app import WorkoutTracker
+
+_bench_dir = tempfile.TemporaryDirectory()
+
+
+# app paths with data and cache moved into the benchmark directory
+class BenchPaths:
+
+    def __init__(self, paths):
+
+        self._paths = paths
+        self.data = Path(_bench_dir.name)
+        self.cache = Path(_bench_dir.name) / 'cache'
+
+    def __getattr__(self, name):
+
+        return getattr(self._paths, name)
+
+
+class BenchTracker(WorkoutTracker):
+
+    # keep the benchmark database out of the user's data directory
+    @property
+    def paths(self):
+
+        return BenchPaths(super().paths)
+
+
+# start the app and let its own on_running build the calendar screen,
+# returns the app and a runner for coroutines on its loop
+def start_app() -> tuple[BenchTracker, Callable[[Awaitable], Any]]:
+
+    app = BenchTracker('Workout-Tracker', 'com.example.wt25')
+    run = app.loop.run_until_complete
+
+    while getattr(app, 'calendar_box', None) is None or app.calendar_box.window is None:
+
+        run(asyncio.sleep(0.01))
+
+    return app, run
+
+
+def stop_app(app: BenchTracker) -> None:
+
+    WorkoutTracker.on_exit(app)
+
+
+# count every widget constructed while the block runs
+@contextlib.contextmanager
+def counting_widgets(counter: list[int]):
+
+    original = toga.Widget.__init__
+
+    def counted(self, *args, **kwargs):
+
+        counter[0] += 1
+        original(self, *args, **kwargs)
+
+    toga.Widget.__init__ = counted
+
+    try:
+
+        yield
+
+    finally:
+
+        toga.Widget.__init__ = original
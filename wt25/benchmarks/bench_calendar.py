@@ -0,0 +1,43 @@
+"""
+Widgets created and time spent per month change on the calendar screen
+
+Runs the app headless on the toga_dummy backend (pip install toga-dummy).
+
+Run with: python benchmarks/bench_calendar.py
+"""
+
+import time
+
+from _harness import counting_widgets, start_app, stop_app
+
+FLIPS = 24
+
+
+def main():
+
+    app, run = start_app()
+
+    created = [0]
+
+    with counting_widgets(created):
+
+        start = time.perf_counter()
+
+        for _ in range(FLIPS // 2):
+
+            run(app.next_month(None))
+
+        for _ in range(FLIPS // 2):
+
+            run(app.prev_month(None))
+
+        elapsed = time.perf_counter() - start
+
+    print(f"{created[0] / FLIPS:6.1f} widgets created per month change")
+    print(f"{elapsed / FLIPS * 1000:6.2f} ms per month change ({FLIPS} changes, toga_dummy)")
+
+    stop_app(app)
+
+
+if __name__ == "__main__":
+    main()
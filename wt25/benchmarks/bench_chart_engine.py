@@ -0,0 +1,121 @@
+"""
+Repeated renders: a new pyplot figure per chart vs. the persistent ChartEngine
+
+Reports renders/s and how much traced memory is left behind after each
+batch of renders, in one thread like a chart worker.
+
+Run with: python benchmarks/bench_chart_engine.py
+"""
+
+import io
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import matplotlib
+matplotlib.use('Agg')
+
+import matplotlib.dates as mdates
+import matplotlib.pyplot as plt
+
+from wt25.chart_engine import get_engine
+from wt25.charts import CHART_DPI, CHART_SIZE
+
+RENDERS = 30
+BATCHES = 4
+TRACED_RENDERS = 5
+
+COLORS = {
+    'prime_background': '#1E1E1E',
+    'second_background': '#2D2D2D',
+    'text': '#E0E0E0',
+    'primary': '#BB86FC'
+}
+
+DATA_POINTS = [
+    {'date': (date(2025, 1, 1) + timedelta(days=i * 2)).isoformat(), 'max_weight': 60.0 + i * 0.25}
+    for i in range(150)
+]
+
+
+# the pre-engine renderer, a fresh pyplot figure per chart
+def pyplot_render(data_points: list[dict], colors: dict[str, str]) -> bytes:
+
+    dates = [datetime.strptime(d['date'], '%Y-%m-%d') for d in data_points]
+    weights = [d['max_weight'] for d in data_points]
+
+    fig, ax = plt.subplots(figsize=(CHART_SIZE[0] / CHART_DPI, CHART_SIZE[1] / CHART_DPI))
+    fig.patch.set_facecolor(colors['prime_background'])
+    ax.set_facecolor(colors['second_background'])
+    ax.plot(dates, weights, marker='o', linestyle='-', linewidth=2, markersize=6, color=colors['primary'])
+    ax.set_xlabel('Date', color=colors['text'])
+    ax.set_ylabel('Weight (kg)', color=colors['text'])
+    ax.set_title('Progress Over Time', color=colors['text'])
+    ax.grid(True, alpha=0.3, color=colors['text'])
+    ax.tick_params(color=colors['text'])
+
+    for spine in ax.spines.values():
+
+        spine.set_color(colors['text'])
+
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+    plt.xticks(rotation=45)
+    plt.tight_layout()
+
+    buf = io.BytesIO()
+    plt.savefig(buf, format='png', dpi=CHART_DPI, facecolor=colors['prime_background'])
+    plt.close(fig)
+
+    return buf.getvalue()
+
+
+def engine_render(data_points: list[dict], colors: dict[str, str]) -> bytes:
+
+    return get_engine(CHART_SIZE, CHART_DPI).render(data_points, colors)
+
+
+def run(label: str, render) -> None:
+
+    # one render outside the measurement for imports and caches
+    render(DATA_POINTS, COLORS)
+
+    # speed, untraced, a different exercise each time like flicking through the selector
+    start = time.perf_counter()
+
+    for i in range(RENDERS):
+
+        render(DATA_POINTS[i:], COLORS)
+
+    renders_per_s = RENDERS / (time.perf_counter() - start)
+
+    # memory left behind, tracemalloc slows rendering down a lot
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    growth = []
+
+    for batch in range(BATCHES):
+
+        for i in range(TRACED_RENDERS):
+
+            render(DATA_POINTS[batch + i:], COLORS)
+
+        growth.append((tracemalloc.get_traced_memory()[0] - baseline) / 1024)
+
+    tracemalloc.stop()
+
+    print(f"{label:8} {renders_per_s:8.1f} renders/s   retained KiB after each batch of {TRACED_RENDERS}: "
+          + ", ".join(f"{kib:.0f}" for kib in growth))
+
+
+def main():
+
+    run('pyplot', pyplot_render)
+    run('engine', engine_render)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Progress chart renders per second: inline on the caller vs. the ChartRenderer pools
+
+Run with: python benchmarks/bench_chart_render.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from wt25.charts import ChartRenderer, render_progress_chart
+
+RENDERS = 24
+WORKERS = os.cpu_count() or 1
+
+COLORS = {
+    'prime_background': '#1E1E1E',
+    'second_background': '#2D2D2D',
+    'text': '#E0E0E0',
+    'primary': '#BB86FC'
+}
+
+# about a year of training, three sessions a week
+DATA_POINTS = [
+    {'date': (date(2025, 1, 1) + timedelta(days=i * 2)).isoformat(), 'max_weight': 60.0 + i * 0.25}
+    for i in range(150)
+]
+
+# ten years of daily training, downsampled before plotting
+LONG_HISTORY = [
+    {'date': (date(2015, 1, 1) + timedelta(days=i)).isoformat(), 'max_weight': 60.0 + (i % 97) * 0.5}
+    for i in range(3650)
+]
+
+
+def inline(data_points: list[dict]) -> float:
+
+    start = time.perf_counter()
+
+    for _ in range(RENDERS):
+
+        render_progress_chart(data_points, COLORS)
+
+    return RENDERS / (time.perf_counter() - start)
+
+
+def pooled(use_processes: bool, workers: int) -> float:
+
+    renderer = ChartRenderer(max_workers=workers, use_processes=use_processes)
+
+    async def burst():
+
+        await asyncio.gather(*(renderer.render(DATA_POINTS, COLORS) for _ in range(RENDERS)))
+
+    # first round starts the workers and imports matplotlib in them
+    asyncio.run(renderer.render(DATA_POINTS, COLORS))
+
+    start = time.perf_counter()
+    asyncio.run(burst())
+    renders_per_s = RENDERS / (time.perf_counter() - start)
+
+    renderer.close()
+
+    return renders_per_s
+
+
+def main():
+
+    print(f"{'inline':16} {inline(DATA_POINTS):8.1f} renders/s ({len(DATA_POINTS)} points)")
+    print(f"{'inline':16} {inline(LONG_HISTORY):8.1f} renders/s ({len(LONG_HISTORY)} points)")
+
+    for label, use_processes in (('threads', False), ('processes', True)):
+
+        for workers in sorted({1, WORKERS}):
+
+            renders_per_s = pooled(use_processes, workers)
+            print(f"{label + ' x' + str(workers):16} {renders_per_s:8.1f} renders/s ({RENDERS} charts, {len(DATA_POINTS)} points)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Per-query latency: connect-per-call vs. the persistent WorkoutDB connection
+
+Run with: python benchmarks/bench_connection.py
+"""
+
+import sqlite3
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from wt25.database import WorkoutDB
+
+ROUNDS = 2000
+
+
+# the old access pattern, one fresh connection per query
+def connect_per_call(db_path: str) -> None:
+
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("SELECT value FROM settings WHERE key = ?", ('theme',)).fetchone()
+    conn.close()
+
+
+def main():
+
+    with tempfile.TemporaryDirectory() as tmp:
+
+        db_path = str(Path(tmp) / 'workouts.db')
+
+        db = WorkoutDB(db_path)
+        db.set_setting('theme', 'Dark')
+
+        per_call = timeit.timeit(lambda: connect_per_call(db_path), number=ROUNDS)
+        persistent = timeit.timeit(lambda: db.get_setting('theme'), number=ROUNDS)
+
+        db.close()
+
+    print(f"connect per call: {per_call / ROUNDS * 1e6:8.1f} us/query")
+    print(f"persistent:       {persistent / ROUNDS * 1e6:8.1f} us/query")
+    print(f"speedup:          {per_call / persistent:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Widgets created and time spent per navigation between the main screens
+
+Walks calendar -> day -> workout -> day -> calendar repeatedly on the
+toga_dummy backend (pip install toga-dummy) and reports the screen
+cache counters.
+
+Run with: python benchmarks/bench_navigation.py
+"""
+
+import time
+from datetime import date
+
+from _harness import counting_widgets, start_app, stop_app
+
+ROUNDS = 10
+DAY = date(2025, 11, 19)
+
+
+def main():
+
+    app, run = start_app()
+
+    # a day with a workout of 5 exercises x 4 sets
+    workout_id = app.db.add_workout('Push', DAY.isoformat())
+
+    for name in ('Bench Press', 'Incline Press', 'Dips', 'Flyes', 'Pushdowns'):
+
+        link = app.db.link_exercise_to_workout(workout_id, app.db.add_new_exercise(name))
+        app.db.add_sets_bulk(link, [(8, 60.0)] * 4)
+
+    workout = app.db.get_workouts_by_date(DAY.isoformat())[0]
+
+    created = [0]
+    navigations = 0
+
+    with counting_widgets(created):
+
+        start = time.perf_counter()
+
+        for _ in range(ROUNDS):
+
+            for step in (
+                app.show_day_details(DAY),
+                app.show_workout_detail(workout),
+                app.show_day_details(DAY),
+                app.show_calendar_view()
+            ):
+
+                run(step)
+                navigations += 1
+
+        elapsed = time.perf_counter() - start
+
+    print(f"{created[0] / navigations:6.1f} widgets created per navigation")
+    print(f"{elapsed / navigations * 1000:6.2f} ms per navigation ({navigations} navigations, toga_dummy)")
+
+    views = getattr(app, 'views', None)
+
+    if views is not None:
+
+        print(f"screens built {views.built}, refreshed {views.refreshed}, reused {views.reused}")
+
+    stop_app(app)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Insert throughput and read latency: SQLite defaults vs. the tuned PRAGMA profile
+
+Run with: python benchmarks/bench_pragmas.py
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from wt25.database import DEFAULT_PRAGMAS, WorkoutDB
+
+INSERTS = 500
+READS = 2000
+
+
+def run(db_path: Path, pragmas: dict) -> tuple[float, float]:
+
+    db = WorkoutDB(db_path, pragmas=pragmas)
+
+    workout_id = db.add_workout('Benchmark', '2025-11-19')
+    exercise_id = db.add_new_exercise('Bench Press')
+    workout_exercise_id = db.link_exercise_to_workout(workout_id, exercise_id)
+
+    # one commit per set, like pressing "Add set"
+    start = time.perf_counter()
+
+    for i in range(INSERTS):
+
+        db.add_set(workout_exercise_id, 5, 80.0 + i)
+
+    inserts_per_s = INSERTS / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+
+    for _ in range(READS):
+
+        db.get_workout_exercises(workout_id)
+
+    read_us = (time.perf_counter() - start) / READS * 1e6
+
+    db.close()
+
+    return inserts_per_s, read_us
+
+
+def main():
+
+    with tempfile.TemporaryDirectory() as tmp:
+
+        for label, pragmas in (('defaults', {}), ('tuned', DEFAULT_PRAGMAS)):
+
+            inserts_per_s, read_us = run(Path(tmp) / f'{label}.db', pragmas)
+            print(f"{label:8} {inserts_per_s:10.0f} inserts/s {read_us:10.1f} us/read ({READS} reads of {INSERTS} sets)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Stepping through days and months with and without prefetching
+
+Steps day by day and month by month with a pause between presses, like a
+user would, on the toga_dummy backend (pip install toga-dummy). Reports
+the time per step and the reads that missed the WorkoutDB cache.
+
+Each mode runs in its own interpreter. An app started earlier in the same
+process leaves objects behind that slow every later step down, which made
+whichever mode ran second look slower.
+
+Run with: python benchmarks/bench_prefetch.py
+"""
+
+import asyncio
+import subprocess
+import sys
+import time
+from datetime import date, timedelta
+from functools import partial
+
+from _harness import start_app, stop_app
+
+STEPS = 30
+MONTH_STEPS = 24
+# time between two presses of "<" or ">"
+PAUSE = 0.3
+FIRST_DAY = date(2025, 1, 1)
+
+
+# seed a year with a workout every other day, 5 exercises x 4 sets each
+def seed(db):
+
+    exercise_ids = [db.add_new_exercise(name) for name in ('Squat', 'Bench Press', 'Row', 'Press', 'Deadlift')]
+
+    with db.transaction():
+
+        for offset in range(0, 365, 2):
+
+            workout_id = db.add_workout('Full Body', (FIRST_DAY + timedelta(days=offset)).isoformat())
+
+            for exercise_id in exercise_ids:
+
+                db.add_sets_bulk(db.link_exercise_to_workout(workout_id, exercise_id), [(5, 100.0)] * 4)
+
+
+# ms to read a day's workouts with their exercises and first page of sets
+def read_ms(db, day):
+
+    start = time.perf_counter()
+    for workout in db.get_workouts_by_date(day.isoformat()):
+
+        db.get_workout_overview(workout['id'])
+        db.get_workout_sets(workout['id'], 0)
+
+    return (time.perf_counter() - start) * 1000
+
+
+# ms per step and foreground cache misses per step
+def step(app, steps, prefetch):
+
+    run = app.loop.run_until_complete
+
+    if not prefetch:
+
+        app.prefetch.around_day = app.prefetch.around_month = lambda *args: None
+
+    elapsed = 0.0
+    misses = 0
+
+    for press in steps:
+
+        before = app.db.cache_info()['misses']
+        start = time.perf_counter()
+        run(press())
+        elapsed += time.perf_counter() - start
+        misses += app.db.cache_info()['misses'] - before
+
+        # the user looks at the screen, prefetching runs meanwhile
+        run(asyncio.sleep(PAUSE))
+
+    return elapsed / len(steps) * 1000, misses / len(steps)
+
+
+# one mode on a fresh database, prints its line of results
+def measure(prefetch: bool) -> None:
+
+    app, run = start_app()
+    seed(app.db)
+
+    days = [partial(app.show_day_details, FIRST_DAY + timedelta(days=i)) for i in range(STEPS)]
+    day_ms, day_misses = step(app, days, prefetch)
+
+    run(app.show_calendar_view())
+    run(asyncio.sleep(PAUSE))
+    app.current_year, app.current_month = FIRST_DAY.year, FIRST_DAY.month
+    months = [partial(app.next_month, None) for _ in range(MONTH_STEPS)]
+    month_ms, month_misses = step(app, months, prefetch)
+
+    label = 'with prefetch' if prefetch else 'no prefetch  '
+    print(f"{label}: days {day_ms:6.2f} ms/step, {day_misses:.1f} misses/step"
+          f" | months {month_ms:6.2f} ms/step, {month_misses:.1f} misses/step")
+
+    # what a step's reads cost, cold and from the cache
+    if not prefetch:
+
+        cold_ms = read_ms(app.db, FIRST_DAY + timedelta(days=200))
+        cached_ms = read_ms(app.db, FIRST_DAY + timedelta(days=200))
+        print(f"day read with exercises and sets: {cold_ms:.2f} ms cold, {cached_ms:.2f} ms cached")
+
+    stop_app(app)
+
+
+def main():
+
+    if len(sys.argv) > 1:
+
+        measure(sys.argv[1] == 'prefetch')
+        return
+
+    for mode in ('none', 'prefetch'):
+
+        subprocess.run([sys.executable, __file__, mode], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Import cost of wt25.app and of the deferred chart warm-up
+
+Run with: python benchmarks/bench_startup.py
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / 'src'
+
+ROUNDS = 5
+TOP = 10
+
+
+# {module: cumulative microseconds} of one fresh interpreter
+def import_times(code: str) -> dict[str, int]:
+
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, env=env, check=True
+    )
+    times = {}
+
+    for line in result.stderr.splitlines():
+
+        if not line.startswith('import time:') or 'cumulative' in line:
+
+            continue
+
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def main():
+
+    runs = [import_times('import wt25.app') for _ in range(ROUNDS)]
+    best = min(runs, key=lambda times: times['wt25.app'])
+
+    print(f"wt25.app import      {best['wt25.app'] / 1000:8.1f} ms (best of {ROUNDS})")
+
+    for name, cumulative in sorted(best.items(), key=lambda item: -item[1])[1:TOP + 1]:
+
+        print(f"  {name:40} {cumulative / 1000:8.1f} ms")
+
+    # what the chart workers pay once, in the background
+    sys.path.insert(0, str(SRC))
+    from wt25.charts import warm_up
+
+    start = time.perf_counter()
+    warm_up()
+    print(f"chart warm-up        {(time.perf_counter() - start) * 1000:8.1f} ms (off the startup path)")
+
+
+if __name__ == "__main__":
+    main()
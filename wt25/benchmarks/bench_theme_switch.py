@@ -0,0 +1,70 @@
+"""
+Theme switch latency and screen build cost
+
+Opens the calendar, a day, a workout and the settings on the toga_dummy
+backend (pip install toga-dummy), then switches themes back and forth
+and builds the screens from scratch.
+
+Run with: python benchmarks/bench_theme_switch.py
+"""
+
+import time
+from datetime import date
+
+from _harness import counting_widgets, start_app, stop_app
+
+SWITCHES = 10
+BUILDS = 10
+DAY = date(2025, 11, 19)
+
+
+def main():
+
+    app, run = start_app()
+
+    # a day with a workout of 5 exercises x 4 sets
+    workout_id = app.db.add_workout('Push', DAY.isoformat())
+
+    for name in ('Bench Press', 'Incline Press', 'Dips', 'Flyes', 'Pushdowns'):
+
+        link = app.db.link_exercise_to_workout(workout_id, app.db.add_new_exercise(name))
+        app.db.add_sets_bulk(link, [(8, 60.0)] * 4)
+
+    workout = app.db.get_workouts_by_date(DAY.isoformat())[0]
+
+    run(app.show_day_details(DAY))
+    run(app.show_workout_detail(workout))
+    run(app.show_settings())
+
+    created = [0]
+
+    with counting_widgets(created):
+
+        start = time.perf_counter()
+
+        for i in range(SWITCHES):
+
+            run(app.change_theme('Light' if i % 2 == 0 else 'Dark'))
+
+        elapsed = time.perf_counter() - start
+
+    print(f"{created[0] / SWITCHES:6.1f} widgets created per theme switch")
+    print(f"{elapsed / SWITCHES * 1000:6.2f} ms per theme switch (toga_dummy)")
+
+    start = time.perf_counter()
+
+    for _ in range(BUILDS):
+
+        run(app.build_calendar_view())
+        run(app.build_day_details(DAY))
+        run(app.build_workout_detail(workout))
+
+    elapsed = time.perf_counter() - start
+
+    print(f"{elapsed / BUILDS * 1000:6.2f} ms to build calendar, day and workout screens")
+
+    stop_app(app)
+
+
+if __name__ == "__main__":
+    main()
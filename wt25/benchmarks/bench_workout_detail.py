@@ -0,0 +1,58 @@
+"""
+Widgets created and time to open a workout as its set count grows
+
+Opens workouts of 10 up to 3000 sets on the toga_dummy backend
+(pip install toga-dummy), each one for the first time.
+
+Run with: python benchmarks/bench_workout_detail.py
+"""
+
+import time
+from datetime import date
+
+from _harness import counting_widgets, start_app, stop_app
+
+SET_COUNTS = (10, 100, 1000, 3000)
+EXERCISES = 5
+DAY = date(2025, 11, 19)
+
+
+def main():
+
+    app, run = start_app()
+
+    exercise_ids = [app.db.add_new_exercise(f'Exercise {i}') for i in range(EXERCISES)]
+
+    # one workout per size, sets spread over the exercises
+    for set_count in SET_COUNTS:
+
+        workout_id = app.db.add_workout(f'{set_count} sets', DAY.isoformat())
+
+        for exercise_id in exercise_ids:
+
+            link = app.db.link_exercise_to_workout(workout_id, exercise_id)
+            app.db.add_sets_bulk(link, [(8, 60.0)] * (set_count // EXERCISES))
+
+    workouts = app.db.get_workouts_by_date(DAY.isoformat())
+    run(app.show_day_details(DAY))
+
+    for set_count in SET_COUNTS:
+
+        workout = next(w for w in workouts if w['name'] == f'{set_count} sets')
+        created = [0]
+
+        with counting_widgets(created):
+
+            start = time.perf_counter()
+            run(app.show_workout_detail(workout))
+            elapsed = time.perf_counter() - start
+
+            run(app.show_day_details(DAY))
+
+        print(f"{set_count:5d} sets: {created[0]:5d} widgets, {elapsed * 1000:8.1f} ms to open (toga_dummy)")
+
+    stop_app(app)
+
+
+if __name__ == "__main__":
+    main()
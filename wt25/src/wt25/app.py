@@ -4,14 +4,19 @@ Tracker for workouts and exercise progressions
 
 import calendar
 from datetime import datetime, date, timedelta
-import io
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+from functools import partial
 import toga
-from toga.style import Pack
-from toga.style.pack import COLUMN, ROW
+from toga.handlers import simple_handler
 
+from wt25.async_db import AsyncWorkoutDB
+from wt25.chart_backends import CanvasChartBackend, MatplotlibChartBackend
+from wt25.charts import ChartCache, ChartRenderer
 from wt25.database import WorkoutDB
+from wt25.prefetch import Prefetcher, month_bounds
+from wt25.scheduler import LatestWins
+from wt25.sources import WorkoutSetSource
+from wt25.styles import StyleRegistry
+from wt25.views import Screen, ViewController
 
 # color schemes
 THEMES = {
@@ -80,77 +85,97 @@ class WorkoutTracker(toga.App):
 
         db_path = self.paths.data / 'workouts.db'
         self.db = WorkoutDB(db_path)
+
+        # handlers go through the async facade, so SQLite never blocks the event loop
+        self.adb = AsyncWorkoutDB(self.db)
+
+        # progress charts are drawn on a worker pool
+        self.charts = ChartRenderer()
+        self.chart_cache = ChartCache(self.paths.cache / 'charts')
+
+        # chart backends usable on this install, matplotlib is optional
+        self.chart_backends = {
+            backend.name: backend
+            for backend in (MatplotlibChartBackend(self.charts, self.chart_cache), CanvasChartBackend())
+            if backend.available()
+        }
+        self.chart_backend = self.db.get_setting('chart_backend', next(iter(self.chart_backends)))
+
+        if self.chart_backend not in self.chart_backends:
+
+            self.chart_backend = next(iter(self.chart_backends))
+
+        # flicking through exercises only loads the one that stays selected
+        self.progress_loads = LatestWins(delay=0.15)
+
+        # neighbouring days and months are read ahead while the user looks at one
+        self.prefetch = Prefetcher(self.adb)
         
         # set default dark theme
+        # read once before the first window is built
         self.current_theme = self.db.get_setting('theme', 'Dark')
+        self.styles = StyleRegistry(THEMES, self.current_theme)
 
         # setting current  day in calendar
         today = datetime.today()
         self.current_month = today.month
         self.current_year = today.year
 
-        # main window
+        # main window, the calendar is filled in on_running
         self.main_window = toga.MainWindow(title=self.formal_name)
-        self.show_calendar_view()
         self.main_window.show()
 
+        # built screens are kept and only refreshed when their data changed
+        self.views = ViewController(self.main_window)
+        self.db.subscribe(self.data_changed)
+
+
+    # first screen, loaded once the event loop runs
+    async def on_running(self):
+
+        await self.show_calendar_view()
+
+        # calendar is up, get the chart workers ready meanwhile
+        if self.chart_backend == MatplotlibChartBackend.name:
+
+            self.charts.prewarm()
+
+
+    # WorkoutDB subscriber, runs on the db thread
+    # queued before the write's result, so screens are marked stale before the handler resumes
+    def data_changed(self, events):
+
+        self.loop.call_soon_threadsafe(self.views.invalidate, events)
+
+
+    # whether a change event falls into the month the calendar shows
+    def in_shown_month(self, event):
+
+        return event.date.startswith(f'{self.current_year}-{self.current_month:02d}-')
+
 
     # build month navigation bar
     def build_navigation(self) -> toga.Box:
 
             
         # Previous month button
-        prev_btn = toga.Button(
-            "<",
-            on_press=self.prev_month,
-            style=Pack(
-                width=50,
-                padding=5,
-                background_color=self.theme('primary'),
-                color=self.theme('text')
-            )
-        )
+        prev_btn = self.styles.create(toga.Button, 'nav_button', "<", on_press=self.prev_month)
         
         # Current month/year label
         month_name = calendar.month_name[self.current_month]
-        self.month_label = toga.Label(
-            f"{month_name} {self.current_year}",
-            style=Pack(
-                flex=1,
-                text_align='center',
-                font_size=16,
-                padding=5,
-                color=self.theme('text')
-            )
-        )
+        self.month_label = self.styles.create(toga.Label, 'title', f"{month_name} {self.current_year}")
         
         # Next month button
-        next_btn = toga.Button(
-            ">",
-            on_press=self.next_month,
-            style=Pack(
-                width=50,
-                padding=5,
-                background_color=self.theme('primary'),
-                color=self.theme('text')
-            )
-        )
+        next_btn = self.styles.create(toga.Button, 'nav_button', ">", on_press=self.next_month)
 
-        settings_btn = toga.Button(
+        settings_btn = self.styles.create(
+            toga.Button,
+            'icon_button',
             '\u2699\uFE0F',
-            on_press=lambda w: self.show_settings(),
-            style=Pack(
-                width=40,
-                height=40,
-                background_color=self.theme('accent'),
-                color=self.theme('text'))
+            on_press=simple_handler(self.show_settings)
         )
         
-        nav_box = toga.Box(style=Pack(
-            direction=ROW,
-            padding=5,
-            background_color=self.theme('second_background')
-        ))
+        nav_box = self.styles.create(toga.Box, 'header')
         nav_box.add(prev_btn)
         nav_box.add(self.month_label)
         nav_box.add(next_btn)
@@ -159,101 +184,103 @@ class WorkoutTracker(toga.App):
         return nav_box
 
 
-    # build calendar grid for desired month and year
-    def build_calendar(self) -> toga.Box:
+    # build the calendar grid once: weekday header and a fixed 6x7 pool of day buttons
+    # month changes only update this pool in place, see fill_calendar
+    def build_calendar(self):
 
         self.calendar_box.clear()
 
-        workouts = self.db.get_all_workouts()
-        workout_dates = set()
+        # header (weekdays)
+        header_box = self.styles.create(toga.Box, 'calendar_header')
+        header_box.add(self.styles.create(toga.Label, 'week_header', "WK"))
 
-        # collect workout dates in currently selected month
-        for workout in workouts:
+        for day_name in ["Mo", "Tu", "We", "Th", "Fr", "Sa", "Su"]:
 
-            workout_date = datetime.strptime(workout['date'], "%Y-%m-%d").date()
+            header_box.add(self.styles.create(toga.Label, 'weekday', day_name))
+        self.calendar_box.add(header_box)
 
-            if workout_date.month == self.current_month and workout_date.year == self.current_year:
+        self.week_boxes = []
+        self.week_labels = []
+        self.day_buttons = []
 
-                workout_dates.add(workout_date.day)
+        # a month spans at most 6 weeks
+        for _ in range(6):
 
-        # header (weekdays)
-        header_box = toga.Box(style=Pack(
-            direction=ROW,
-            padding=2,
-            background_color=self.theme('second_background')
-            ))
-        header_box.add(toga.Label(
-            "WK",
-            style=Pack(
-                width=40,
-                padding=2,
-                font_weight='bold',
-                color=self.theme('text')
-            )
-        ))
+            week_box = self.styles.create(toga.Box, 'week_row')
 
-        for day_name in ["Mo", "Tu", "We", "Th", "Fr", "Sa", "Su"]:
+            week_label = self.styles.create(toga.Label, 'week_number', "")
+            week_box.add(week_label)
 
-            header_box.add(toga.Label(
-                day_name,
-                style=Pack(
-                    width=50,
-                    padding=2,
-                    text_align='center',
-                    font_weight='bold',
-                    color=self.theme('text')
-                )
-            ))
-        self.calendar_box.add(header_box)
+            week_buttons = []
+
+            for _ in range(7):
+
+                # cells outside the month are hidden but keep their space
+                day_btn = self.styles.create(toga.Button, 'day', "", visibility='hidden')
+
+                week_box.add(day_btn)
+                week_buttons.append(day_btn)
+
+            self.calendar_box.add(week_box)
+            self.week_boxes.append(week_box)
+            self.week_labels.append(week_label)
+            self.day_buttons.append(week_buttons)
+
+
+    # show the selected month and year in the widget pool of build_calendar
+    async def fill_calendar(self):
+
+        # collect workout dates in currently selected month
+        workout_counts = await self.adb.get_workout_counts(*month_bounds(self.current_year, self.current_month))
+        workout_dates = {int(workout_date[8:10]) for workout_date in workout_counts}
 
         cal = calendar.monthcalendar(self.current_year, self.current_month)
 
-        for week in cal:
+        # every change below relayouts the whole window while the grid is attached,
+        # so it is detached for the update and laid out once when put back
+        container = self.calendar_box.parent
+
+        if container is not None:
+
+            position = container.index(self.calendar_box)
+            container.remove(self.calendar_box)
+
+        for row, week_box in enumerate(self.week_boxes):
+
+            # rows past the month's last week are left out of the layout
+            if row >= len(cal):
 
-            week_box = toga.Box(style=Pack(direction=ROW, padding=2, alignment='center'))
+                _set_style(week_box, display='none')
+                continue
+
+            week = cal[row]
+            _set_style(week_box, display='pack')
 
             first_day = next((d for d in week if d != 0), 1)
             week_date = date(self.current_year, self.current_month, first_day)
-            week_number = week_date.isocalendar()[1]
-
-            week_box.add(toga.Label(
-                str(week_number),
-                style=Pack(
-                    width=40,
-                    padding=2,
-                    text_align='center',
-                    color=self.theme('text')
-                )
-            ))
+            _set_text(self.week_labels[row], str(week_date.isocalendar()[1]))
 
-            for day in week:
+            for day, day_btn in zip(week, self.day_buttons[row]):
 
                 if day == 0:
 
-                    week_box.add(toga.Box(style=Pack(width=50, height=50, padding=2)))
+                    _set_style(day_btn, visibility='hidden')
 
                 else:
 
                     has_workout = day in workout_dates
-                    day_btn = toga.Button(
-                        str(day),
-                        on_press=lambda widget, d=day: self.day_clicked(d),
-                        style=Pack(
-                            width=50,
-                            height=50,
-                            padding=2,
-                            background_color=self.theme('primary') if has_workout else self.theme('second_background'),
-                            color=self.theme('text'),
-                        )
-                    )
-                    
-                    week_box.add(day_btn)
+                    _set_text(day_btn, str(day))
+                    _set_style(day_btn, visibility='visible')
+                    self.styles.apply(day_btn, 'workout_day' if has_workout else 'day')
+                    day_btn.on_press = simple_handler(self.day_clicked, day)
 
-            self.calendar_box.add(week_box)
+        if container is not None:
+
+            container.insert(position, self.calendar_box)
 
 
     # scroll to the previous month and update calendar
-    def prev_month(self, widget):
+    async def prev_month(self, widget):
 
         if self.current_month == 1:
             
@@ -264,11 +291,11 @@ class WorkoutTracker(toga.App):
 
             self.current_month -= 1
 
-        self.update_calendar()
+        await self.update_calendar()
 
 
     # scroll to the next month and update calendar
-    def next_month(self, widget):
+    async def next_month(self, widget):
 
         if self.current_month == 12:
             
@@ -279,87 +306,66 @@ class WorkoutTracker(toga.App):
 
             self.current_month += 1
 
-        self.update_calendar()
+        await self.update_calendar()
 
 
     # update the calendar to show the right month
-    def update_calendar(self):
+    async def update_calendar(self):
 
         month_name = calendar.month_name[self.current_month]
         self.month_label.text = f"{month_name} {self.current_year}"
-        self.build_calendar()
+        await self.fill_calendar()
+        self.prefetch.around_month(self.current_year, self.current_month)
 
 
     # handles display of details of a clicked day in the calendar
-    def day_clicked(self, day):
+    async def day_clicked(self, day):
 
         clicked_date = date(self.current_year, self.current_month, day)
-        self.show_day_details(clicked_date)
+        await self.show_day_details(clicked_date)
 
     
     # displays the workout detils for a specific selected day
-    def show_day_details(self, selected_date):
+    async def show_day_details(self, selected_date):
 
         self.selected_date = selected_date
 
+        await self.views.show(('day', selected_date), partial(self.build_day_details, selected_date))
+        self.prefetch.around_day(selected_date)
+
+
+    # day screen, the workout list is refreshed in place when workouts change
+    async def build_day_details(self, selected_date):
+
         # main container for details view
-        detail_box = toga.Box(style=Pack(
-            direction=COLUMN,
-            padding=10,
-            background_color=self.theme('prime_background')
-        ))
+        detail_box = self.styles.create(toga.Box, 'screen')
     
         # box for navigation tools
-        header_box = toga.Box(style=Pack(
-            direction=ROW,
-            padding=5,
-            background_color=self.theme('second_background')
-        ))
+        header_box = self.styles.create(toga.Box, 'header')
 
         # button to return to calendar grid
-        back_btn = toga.Button(
+        back_btn = self.styles.create(
+            toga.Button,
+            'back_button',
             "Back",
-            on_press=lambda widget: self.show_calendar_view(),
-            style=Pack(
-                width=80,
-                padding=5,
-                background_color=self.theme('primary'),
-                color=self.theme('text')
-            )
+            on_press=simple_handler(self.show_calendar_view)
         )
 
         # label displaying selected day
-        date_label = toga.Label(
-            selected_date.strftime("%A, %B %d, %Y"),
-            style=Pack(
-                flex=1,
-                text_align='center',
-                font_size=16,
-                padding=5,
-                color=self.theme('text')
-            )
-        )
+        date_label = self.styles.create(toga.Label, 'title', selected_date.strftime("%A, %B %d, %Y"))
 
-        prev_day_btn = toga.Button(
+        prev_day_btn = self.styles.create(
+            toga.Button,
+            'nav_button',
             "<",
-            on_press=lambda widget: self.show_day_details(selected_date - timedelta(days=1)),
-            style=Pack(
-                width=50,
-                padding=5,
-                background_color=self.theme('primary'),
-                color=self.theme('text')
-            )
+            on_press=simple_handler(self.show_day_details, selected_date - timedelta(days=1))
         )
 
-        next_day_btn = toga.Button(
+        next_day_btn = self.styles.create(
+            toga.Button,
+            'nav_button',
             ">",
-            on_press=lambda widget: self.show_day_details(selected_date + timedelta(days=1)),
-            style=Pack(
-                width=50,
-                padding=5,
-                background_color=self.theme('primary'),
-                color=self.theme('text')
-            )
+            on_press=simple_handler(self.show_day_details, selected_date + timedelta(days=1))
         )
 
         # building header
@@ -368,29 +374,48 @@ class WorkoutTracker(toga.App):
         header_box.add(date_label)
         header_box.add(next_day_btn)
 
-        # fetch workouts of selected day from db
-        workouts = self.db.get_workouts_by_date(selected_date.strftime("%Y-%m-%d"))
         # box to list workouts of the day
-        workout_list_box = toga.Box(style=Pack(
-            direction=COLUMN,
-            padding=5,
-            flex=1,
-            background_color=self.theme('second_background')
-        ))
+        workout_list_box = self.styles.create(toga.Box, 'list')
+        await self.fill_day_workouts(workout_list_box, selected_date)
+
+        # button to add workout for selected day
+        create_workout_btn = self.styles.create(
+            toga.Button,
+            'plain_button',
+            "Add Workout",
+            on_press=lambda widget: self.create_workout(selected_date)
+        )
+
+        # building whole scene
+        detail_box.add(header_box)
+        detail_box.add(workout_list_box)
+        detail_box.add(create_workout_btn)
+
+        return Screen(
+            detail_box,
+            refresh=partial(self.fill_day_workouts, workout_list_box, selected_date),
+            topics={'workouts'},
+            affected=lambda event: event.date == selected_date.isoformat()
+        )
+
+
+    # list the workouts of a day
+    async def fill_day_workouts(self, workout_list_box, selected_date):
+
+        # fetch workouts of selected day from db
+        workouts = await self.adb.get_workouts_by_date(selected_date.strftime("%Y-%m-%d"))
+
+        workout_list_box.clear()
 
         if workouts:
 
             for workout in workouts:
 
-                workout_btn = toga.Button(
+                workout_btn = self.styles.create(
+                    toga.Button,
+                    'workout_button',
                     workout['name'],
-                    on_press=lambda widget, w=workout: self.show_workout_detail(w),
-                    style=Pack(
-                        width=300,
-                        padding=5,
-                        background_color=self.theme('accent'),
-                        color=self.theme('text')
-                    )
+                    on_press=simple_handler(self.show_workout_detail, workout)
                 )
 
                 # add button for workout into list box
@@ -400,75 +425,48 @@ class WorkoutTracker(toga.App):
 
         else:
 
-            none_label = toga.Label(
-                "No workouts logged for this day yet.",
-                style=Pack(
-                    padding=20,
-                    text_align='center',
-                    color=self.theme('text')
-                )
+            none_label = self.styles.create(
+                toga.Label,
+                'empty_notice',
+                "No workouts logged for this day yet."
             )
 
             # display message if no workouts logged for selected day
             workout_list_box.add(none_label)
 
-        # button to add workout for selected day
-        create_workout_btn = toga.Button(
-            "Add Workout",
-            on_press=lambda widget: self.create_workout(selected_date),
-            style=Pack(
-                background_color=self.theme('primary'),
-                color=self.theme('text')
-            )
-        )
-
-        # building whole scene
-        detail_box.add(header_box)
-        detail_box.add(workout_list_box)
-        detail_box.add(create_workout_btn)
-
-        self.main_window.content = detail_box
-
 
     # builds and displays calendar view
     # uses build_navigation for nav buttons
     # uses build_calendar for calendar grid
-    def show_calendar_view(self):
+    async def show_calendar_view(self):
 
-        main_box = toga.Box(style=Pack(
-            direction=COLUMN,
-            padding=10,
-            alignment='center',
-            background_color=self.theme('prime_background')
-        ))
+        await self.views.show(('calendar',), self.build_calendar_view)
+        self.prefetch.around_month(self.current_year, self.current_month)
+
+
+    # calendar screen, the grid is refilled in place when workouts change
+    async def build_calendar_view(self):
+
+        main_box = self.styles.create(toga.Box, 'calendar_screen')
 
         nav_box = self.build_navigation()
 
         # Fixed width container for the calender grid
-        calendar_container = toga.Box(style=Pack(
-            direction=COLUMN,
-            width=420,
-            height=400,
-            padding=5,
-            background_color=self.theme('second_background')           
-        ))
+        calendar_container = self.styles.create(toga.Box, 'calendar_frame')
 
-        self.calendar_box = toga.Box(style=Pack(direction=COLUMN))
+        self.calendar_box = self.styles.create(toga.Box, 'column')
         self.build_calendar()
+        await self.fill_calendar()
         calendar_container.add(self.calendar_box)
 
         # Spacer to push progress button to the bottom
-        spacer = toga.Box(style=Pack(flex=1))
+        spacer = self.styles.create(toga.Box, 'spacer')
 
-        progress_btn = toga.Button(
+        progress_btn = self.styles.create(
+            toga.Button,
+            'primary_button',
             "Progress Charts",
-            on_press=lambda w: self.show_progress(),
-            style=Pack(
-                alignment='center',
-                padding=10,
-                background_color=self.theme('primary'),
-                color=self.theme('text')
-            )
+            on_press=simple_handler(self.show_progress)
         )
 
         main_box.add(nav_box)
@@ -476,63 +474,38 @@ class WorkoutTracker(toga.App):
         main_box.add(spacer)
         main_box.add(progress_btn)
 
-        self.main_window.content = main_box
+        return Screen(main_box, refresh=self.fill_calendar, topics={'workouts'}, affected=self.in_shown_month)
 
 
     # workout creation form and logic for selected day 
     def create_workout(self, workout_date):
 
         # main display box
-        form_box = toga.Box(style=Pack(
-            direction=COLUMN,
-            padding=10,
-            background_color=self.theme('prime_background')
-        ))
+        form_box = self.styles.create(toga.Box, 'screen')
 
-        header_label = toga.Label(
-            f"New Workout - {workout_date.strftime('%d, %m, %Y')}",
-            style=Pack(
-                padding=10,
-                font_size=16,
-                font_weight='bold',
-                text_align='center',
-                color=self.theme('text')
-            )
+        header_label = self.styles.create(
+            toga.Label,
+            'centered_form_title',
+            f"New Workout - {workout_date.strftime('%d, %m, %Y')}"
         )
 
         # input and display of workout name
-        name_label = toga.Label("Workout Name:", style=Pack(padding=5))
-        self.name_input = toga.TextInput(
-            placeholder="e.g. Leg Day",
-            style=Pack(
-                padding=5,
-                width=300,
-                background_color=self.theme('second_background'),
-                color=self.theme('text')
-            )
-        )
+        name_label = self.styles.create(toga.Label, 'label', "Workout Name:")
+        self.name_input = self.styles.create(toga.TextInput, 'input', placeholder="e.g. Leg Day")
 
         # buttons to save/cancel workout creation
-        button_box = toga.Box(style=Pack(direction=ROW, padding=10))
-        cancel_btn = toga.Button(
+        button_box = self.styles.create(toga.Box, 'button_row')
+        cancel_btn = self.styles.create(
+            toga.Button,
+            'form_cancel_button',
             "Cancel",
-            on_press=lambda widget: self.show_day_details(workout_date),
-            style=Pack(
-                padding=5,
-                width=100,
-                background_color=self.theme('danger'),
-                color=self.theme('text')
-            )
+            on_press=simple_handler(self.show_day_details, workout_date)
         )
-        save_btn = toga.Button(
+        save_btn = self.styles.create(
+            toga.Button,
+            'form_button',
             "Save",
-            on_press=lambda widget: self.save_workout(workout_date),
-            style=Pack(
-                padding=5,
-                width=100,
-                background_color=self.theme('primary'),
-                color=self.theme('text')
-            )
+            on_press=simple_handler(self.save_workout, workout_date)
         )
         # build button box
         button_box.add(cancel_btn)
@@ -548,272 +521,208 @@ class WorkoutTracker(toga.App):
 
     
     # saves workout to db
-    def save_workout(self, workout_date):
+    async def save_workout(self, workout_date):
 
         name = self.name_input.value.strip()
 
         if not name:
 
-            self.main_window.error_dialog(
+            await self.main_window.dialog(toga.ErrorDialog(
                 "Error",
                 "Workout name cannot be empty."
-            )
+            ))
 
             return
 
-        self.db.add_workout(
+        await self.adb.add_workout(
             name = name,
             date = workout_date.strftime("%Y-%m-%d")
         )
 
-        self.show_day_details(workout_date)
+        await self.show_day_details(workout_date)
 
 
     # expands workout details when a workout button is clicked
     # shows button to add exercises to workout
-    def show_workout_detail(self, workout):
+    async def show_workout_detail(self, workout):
+
+        await self.views.show(('workout', workout['id']), partial(self.build_workout_detail, workout))
+
+
+    # workout screen, the exercise list is refreshed in place when exercises or sets change
+    async def build_workout_detail(self, workout):
         
         # workout details display
-        detail_box = toga.Box(style=Pack(
-            direction=COLUMN,
-            padding=10,
-            background_color=self.theme('prime_background')
-        ))
+        detail_box = self.styles.create(toga.Box, 'screen')
 
         # header with workout name, date and return button
-        header_box = toga.Box(style=Pack(
-            direction=ROW,
-            padding=5,
-            background_color=self.theme('second_background')
-        ))
+        header_box = self.styles.create(toga.Box, 'header')
 
         # return
-        back_btn = toga.Button(
+        back_btn = self.styles.create(
+            toga.Button,
+            'back_button',
             "Back",
-            on_press=lambda widget: self.show_day_details(self.selected_date),
-            style=Pack(
-                width=80,
-                padding=5,
-                background_color=self.theme('primary'),
-                color=self.theme('text')
-            )
+            on_press=simple_handler(self.show_day_details, self.selected_date)
         )
 
         # workout name and date
-        workout_label = toga.Label(
-            f"{workout['name']} - {workout['date']}",
-            style=Pack(
-                flex=1,
-                text_align='center',
-                font_size=16,
-                font_weight='bold',
-                padding=5,
-                color=self.theme('text')
-            )
-        )
+        workout_label = self.styles.create(toga.Label, 'bold_title', f"{workout['name']} - {workout['date']}")
 
         # build header
         header_box.add(back_btn)
         header_box.add(workout_label)
 
-        # fetch exercises of workout
-        exercises = self.db.get_workout_exercises(workout['id'])
+        # exercises of the workout, one row each
+        exercises_box = self.styles.create(toga.Box, 'panel')
 
-        # display exercises and sets of workout
-        exercises_box = toga.Box(style=Pack(
-            direction=COLUMN,
-            padding=10,
-            flex=1,
-            background_color=self.theme('second_background')
-        ))
+        # all sets in one table, loaded a page at a time however many there are
+        sets_table = self.styles.create(
+            toga.Table,
+            'table',
+            headings=['Exercise', 'Set', 'Reps', 'Weight (kg)'],
+            accessors=['exercise', 'set', 'reps', 'weight']
+        )
+        await self.fill_workout_exercises(exercises_box, sets_table, workout)
+
+        # button for workout deletion
+        delete_btn = self.styles.create(
+            toga.Button,
+            'danger_button',
+            "Delete Workout",
+            on_press=simple_handler(self.confirm_delete_workout, workout)
+        )
+
+        # button to add exercise to workout
+        add_exercise_btn = self.styles.create(
+            toga.Button,
+            'primary_button',
+            "Add Exercise",
+            on_press=simple_handler(self.add_exercise, workout)
+        )
+
+        # build whole display
+        detail_box.add(header_box)
+        detail_box.add(exercises_box)
+        detail_box.add(sets_table)
+        detail_box.add(delete_btn)
+        detail_box.add(add_exercise_btn)
+
+        return Screen(
+            detail_box,
+            refresh=partial(self.fill_workout_exercises, exercises_box, sets_table, workout),
+            topics={'workout_exercises', 'sets'},
+            affected=lambda event: event.workout_id == workout['id']
+        )
+
+
+    # list the exercises of a workout and hand its sets to the table
+    # widgets are created per exercise only, never per set
+    async def fill_workout_exercises(self, exercises_box, sets_table, workout):
+
+        # exercises with their set counts, the sets are paged in by the table's source
+        exercises = await self.adb.get_workout_overview(workout['id'])
+        sets = WorkoutSetSource(self.adb, workout['id'], exercises)
+
+        # the first page is there when the screen shows
+        await sets.load_page(0)
+
+        exercises_box.clear()
 
         if exercises:
 
             for exercise in exercises:
 
-                # row for each exercise with name and delete button
-                exercise_row = toga.Box(style=Pack(direction=ROW, padding=5))
-
-                exercise_label = toga.Label(
-                    exercise['exercise_name'],
-                    style=Pack(
-                        padding=5,
-                        font_size=14,
-                        font_weight='bold',
-                        color=self.theme('text')
-                    )
+                # row for each exercise with name, number of sets and delete button
+                exercise_row = self.styles.create(toga.Box, 'row')
+
+                exercise_label = self.styles.create(toga.Label, 'exercise_name', exercise['exercise_name'])
+
+                count = exercise['set_count']
+                count_label = self.styles.create(
+                    toga.Label,
+                    'label',
+                    f"{count} set{'s' if count != 1 else ''}" if count else "No sets logged yet."
                 )
 
-                delete_exercise_btn = toga.Button(
+                delete_exercise_btn = self.styles.create(
+                    toga.Button,
+                    'delete_icon_button',
                     "X",
-                    on_press=lambda w, ex=exercise: self.confirm_delete_exercise(workout, ex),
-                    style=Pack(
-                        width=40,
-                        background_color=self.theme('danger'),
-                        color=self.theme('text')
-                    )
+                    on_press=simple_handler(self.confirm_delete_exercise, workout, exercise)
                 )
 
                 # build exercise row
                 exercise_row.add(exercise_label)
+                exercise_row.add(count_label)
                 exercise_row.add(delete_exercise_btn)
 
                 # add exercise row per exercise to exercises box
                 exercises_box.add(exercise_row)
 
-                if exercise['sets']:
-
-                    for set_data in exercise['sets']:
-
-                        set_label = toga.Label(
-                            f" {set_data['reps']} reps x {set_data['weight']} kg",
-                            style=Pack(
-                                padding_left=20,
-                                padding_top=2,
-                                color=self.theme('text')
-                            )
-                        )
-                        exercises_box.add(set_label)
-
-                # no sets logged for exercise yet
-                else:
-
-                    none_label = toga.Label(
-                        " No sets logged yet. ",
-                        style=Pack(
-                            padding_left=20,
-                            padding_top=2,
-                            color=self.theme('text')
-                        )
-                    )
-                    exercises_box.add(none_label)
-
         # no exercises logged for workout yet
         else:
 
-            no_exercise_label = toga.Label(
-                    " No exercises logged yet. ",
-                    style=Pack(
-                        padding_left=20,
-                        text_align='center',
-                        color=self.theme('text')
-                    )
-                )
+            no_exercise_label = self.styles.create(toga.Label, 'empty_sets', " No exercises logged yet. ")
             exercises_box.add(no_exercise_label)
 
-        # button for workout deletion
-        delete_btn = toga.Button(
-            "Delete Workout",
-            on_press=lambda widget: self.confirm_delete_workout(workout),
-            style=Pack(
-                padding=10,
-                background_color=self.theme('danger'),
-                color=self.theme('text')
-            )
-        )
+        # the previous source stops loading pages into a table that moved on
+        if isinstance(sets_table.data, WorkoutSetSource):
 
-        # button to add exercise to workout
-        add_exercise_btn = toga.Button(
-            "Add Exercise",
-            on_press=lambda widget: self.add_exercise(workout),
-             style=Pack(
-                padding=10,
-                background_color=self.theme('primary'),
-                color=self.theme('text'))
-        )
+            sets_table.data.detach()
 
-        # build whole display
-        detail_box.add(header_box)
-        detail_box.add(exercises_box)
-        detail_box.add(delete_btn)
-        detail_box.add(add_exercise_btn)
-
-        self.main_window.content = detail_box
+        sets_table.data = sets
 
 
     # adding exercise to workout
-    def add_exercise(self, workout):
+    async def add_exercise(self, workout):
         
         # main display
-        form_box = toga.Box(style=Pack(
-            direction=COLUMN,
-            padding=10,
-            background_color=self.theme('prime_background')
-        ))
+        form_box = self.styles.create(toga.Box, 'screen')
 
         # header with selected workout name
-        header_label = toga.Label(
-            f"Add Exercise to {workout['name']}",
-            style=Pack(
-                padding=10,
-                font_size=16,
-                font_weight='bold',
-                color=self.theme('text')
-            )
-        )
+        header_label = self.styles.create(toga.Label, 'form_title', f"Add Exercise to {workout['name']}")
 
         # input to select existing or enter new exercise
-        exercise_label = toga.Label(
-            "Select Exercise:",
-            style=Pack(
-                padding=5,
-                color=self.theme('text')
-            )
-        )
+        exercise_label = self.styles.create(toga.Label, 'switch', "Select Exercise:")
 
         # fetch existing exercises from db to display
-        existing_exercises = self.db.get_all_exercises()
+        existing_exercises = await self.adb.get_all_exercises()
 
         exercise_items = [ex['name'] for ex in existing_exercises]
         exercise_items.append("--Add new exercise--")
 
         # display for existing exercises
-        self.exercise_select = toga.Selection(
+        self.exercise_select = self.styles.create(
+            toga.Selection,
+            'input',
             items=exercise_items,
-            on_change=lambda widget: self.toggle_new_exercise_input(widget),
-            style=Pack(
-                padding=5,
-                width=300,
-                background_color=self.theme('second_background'),
-                color=self.theme('text')
-            )
+            on_change=lambda widget: self.toggle_new_exercise_input(widget)
         )
 
         # input window for new exercise
-        self.new_exercise_input = toga.TextInput(
-            placeholder="Enter new exercise name",
-            style=Pack(
-                padding=5,
-                width=300,
-                background_color=self.theme('second_background'),
-                color=self.theme('text')
-            )
+        self.new_exercise_input = self.styles.create(
+            toga.TextInput,
+            'input',
+            placeholder="Enter new exercise name"
         )
-        self.new_exercise_box = toga.Box(style=Pack(direction=COLUMN))
+        self.new_exercise_box = self.styles.create(toga.Box, 'column')
 
         # box for cancel and save buttons
-        button_box = toga.Box(style=Pack(direction=ROW, padding=10))
+        button_box = self.styles.create(toga.Box, 'button_row')
 
-        cancel_btn = toga.Button(
+        cancel_btn = self.styles.create(
+            toga.Button,
+            'form_cancel_button',
             "Cancel",
-            on_press=lambda widget: self.show_workout_detail(workout),
-            style=Pack(
-                padding=5,
-                width=100,
-                background_color=self.theme('danger'),
-                color=self.theme('text')
-            )
+            on_press=simple_handler(self.show_workout_detail, workout)
         )
 
-        save_btn = toga.Button(
+        save_btn = self.styles.create(
+            toga.Button,
+            'form_button',
             "Save",
-            on_press=lambda widget: self.save_exercise(workout),
-            style=Pack(
-                padding=5,
-                width=100,
-                background_color=self.theme('primary'),
-                color=self.theme('text')
-            )
+            on_press=simple_handler(self.save_exercise, workout)
         )
 
         # build button box
@@ -847,7 +756,7 @@ class WorkoutTracker(toga.App):
 
 
     # save exercise to workout in db
-    def save_exercise(self, workout):
+    async def save_exercise(self, workout):
         
         selected = self.exercise_select.value
 
@@ -857,124 +766,81 @@ class WorkoutTracker(toga.App):
 
             if not new_name:
 
-                self.main_window.error_dialog(
+                await self.main_window.dialog(toga.ErrorDialog(
                     "Error",
                     "Exercise name cannot be empty."
-                )
+                ))
 
                 return
 
-            exercise_id = self.db.add_new_exercise(new_name)
+            exercise_name = new_name
 
         else:
 
-            all_exercises = self.db.get_all_exercises()
-            exercise_id = next(ex['id'] for ex in all_exercises if ex['name'] == selected)
-
-        workout_exercise_id = self.db.link_exercise_to_workout(workout['id'], exercise_id)
+            exercise_name = selected
 
-        self.add_sets(workout, workout_exercise_id)
+        # nothing is written yet, creating and linking the exercise
+        # happens together with its first sets in log_sets
+        await self.add_sets(workout, exercise_name)
 
 
     # add set to exercise form/logic
-    def add_sets(self, workout, workout_exercise_id):
+    async def add_sets(self, workout, exercise_name):
         
         # main display box
-        form_box = toga.Box(style=Pack(
-            direction=COLUMN,
-            padding=10,
-            background_color=self.theme('prime_background')
-        ))
+        form_box = self.styles.create(toga.Box, 'screen')
 
-        header_label = toga.Label(
-            "Add sets",
-            style=Pack(
-                padding=10,
-                font_size=16,
-                font_weight='bold',
-                color=self.theme('text')
-            )
-        )
+        header_label = self.styles.create(toga.Label, 'form_title', "Add sets")
 
         # reps section for a set
-        reps_label = toga.Label(
-            "Reps:",
-            style=Pack(
-                padding=5,
-                color=self.theme('text')
-            )
-        )
+        reps_label = self.styles.create(toga.Label, 'switch', "Reps:")
 
-        self.reps_input = toga.NumberInput(
-            min=0,
-            max=999,
-            step=1,
-            style=Pack(
-                padding=5,
-                width=300,
-                background_color=self.theme('second_background'),
-                color=self.theme('text')
-            )
-        )
+        self.reps_input = self.styles.create(toga.NumberInput, 'input', min=0, max=999, step=1)
 
         # weight section for a set
-        weight_label = toga.Label(
-            "Weight (kg):",
-            style=Pack(
-                padding=5,
-                color=self.theme('text')
-            )
-        )
+        weight_label = self.styles.create(toga.Label, 'switch', "Weight (kg):")
 
-        self.weight_input = toga.NumberInput(
-            min=0,
-            max=999,
-            step=0.125,
-            style=Pack(
-                padding=5,
-                width=300,
-                background_color=self.theme('second_background'),
-                color=self.theme('text')
-            )
-        )
+        self.weight_input = self.styles.create(toga.NumberInput, 'input', min=0, max=999, step=0.125)
 
         # display element for adding a set/finishing and returning to workout details
-        button_box = toga.Box(style=Pack(direction=ROW, padding=10))
+        button_box = self.styles.create(toga.Box, 'button_row')
 
         # finish adding sets and return to workout details
-        done_btn = toga.Button(
+        done_btn = self.styles.create(
+            toga.Button,
+            'form_button',
             "Done",
-            on_press=lambda widget: self.show_workout_detail(workout),
-            style=Pack(
-                padding=5,
-                width=100,
-                background_color=self.theme('primary'),
-                color=self.theme('text')
-            )
+            on_press=simple_handler(self.finish_sets, workout)
         )
 
         # add a set
-        add_set_btn = toga.Button(
+        add_set_btn = self.styles.create(
+            toga.Button,
+            'form_accent_button',
             "Add set",
-            on_press=lambda widget: self.save_set(workout, workout_exercise_id),
-            style=Pack(
-                padding=5,
-                width=100,
-                background_color=self.theme('accent'),
-                color=self.theme('text')
-            )
+            on_press=simple_handler(self.save_set, workout)
         )
 
         # build button box
         button_box.add(done_btn)
         button_box.add(add_set_btn)
+
+        # exercise being logged, linked to the workout on its first save
+        self.exercise_name = exercise_name
+        self.workout_exercise_id = None
+
+        # queue sets locally and save them in one batch on "Done"
+        self.pending_sets = []
+        self.batch_switch = self.styles.create(
+            toga.Switch,
+            'switch',
+            "Save sets on Done",
+            value=await self.adb.get_setting('batch_sets', 'off') == 'on',
+            on_change=partial(self.toggle_batch_sets, workout=workout)
+        )
             
         # added sets feedback
-        self.sets_list_box = toga.Box(style=Pack(
-            direction=COLUMN,
-            padding=10,
-            background_color=self.theme('second_background')
-        ))
+        self.sets_list_box = self.styles.create(toga.Box, 'panel')
 
         # build main display
         form_box.add(header_label)
@@ -983,36 +849,43 @@ class WorkoutTracker(toga.App):
         form_box.add(weight_label)
         form_box.add(self.weight_input)
         form_box.add(button_box)
+        form_box.add(self.batch_switch)
         form_box.add(self.sets_list_box)
 
         self.main_window.content = form_box
 
 
     # saves a set to db, allows multiple additions
-    def save_set(self, workout, workout_exercise_id):
+    async def save_set(self, workout):
 
         reps = self.reps_input.value
         weight = self.weight_input.value
 
         if reps is None or weight is None:
 
-            self.main_window.error_dialog(
+            await self.main_window.dialog(toga.ErrorDialog(
                 "Error",
                 "Reps and weight must be provided."
-            )
+            ))
             
             return
 
-        # save to db
-        self.db.add_set(workout_exercise_id, int(reps), float(weight))
+        # queue for the batch on "Done" or save to db right away
+        if self.batch_switch.value:
+
+            self.pending_sets.append((int(reps), float(weight)))
+            feedback = "Queued"
+
+        else:
+
+            await self.log_sets(workout, [(int(reps), float(weight))])
+            feedback = "Added"
 
         # feedback for added set
-        set_label = toga.Label(
-            f"Added {int(reps)} reps x {float(weight)} kg",
-            style=Pack(
-                padding=5,
-                background_color=self.theme('second_background'),
-                color=self.theme('text'))
+        set_label = self.styles.create(
+            toga.Label,
+            'feedback_label',
+            f"{feedback} {int(reps)} reps x {float(weight)} kg"
         )
         self.sets_list_box.add(set_label)
 
@@ -1021,192 +894,176 @@ class WorkoutTracker(toga.App):
         self.weight_input.value = None
 
 
+    # saves sets of the current exercise as one unit of work
+    # on the first save the exercise is created if missing and linked to the workout,
+    # so a failing step never leaves a half-logged exercise behind
+    async def log_sets(self, workout, sets):
+
+        self.workout_exercise_id = await self.adb.transaction(
+            log_exercise_sets,
+            workout['id'],
+            self.exercise_name,
+            self.workout_exercise_id,
+            sets
+        )
+
+
+    # writes queued sets in one batch
+    async def flush_pending_sets(self, workout):
+
+        if self.pending_sets:
+
+            await self.log_sets(workout, self.pending_sets)
+            self.pending_sets = []
+
+
+    # switch between saving each set and batching them until "Done"
+    async def toggle_batch_sets(self, widget, workout):
+
+        await self.adb.set_setting('batch_sets', 'on' if widget.value else 'off')
+
+        # sets queued so far are saved when batching is turned off
+        if not widget.value:
+
+            await self.flush_pending_sets(workout)
+
+
+    # save queued sets and return to workout details
+    async def finish_sets(self, workout):
+
+        await self.flush_pending_sets(workout)
+
+        # an exercise saved without sets is still added to the workout
+        if self.workout_exercise_id is None:
+
+            await self.log_sets(workout, [])
+
+        await self.show_workout_detail(workout)
+
+
     # delete workout confirmation dialog
-    def confirm_delete_workout(self, workout):
+    async def confirm_delete_workout(self, workout):
 
-        self.main_window.confirm_dialog(
+        confirmed = await self.main_window.dialog(toga.ConfirmDialog(
             "Delete Workout",
-            f"Delete '{workout['name']}' ('{workout['date']}') and all its exercises? This action cannot be undone.",
-            on_result=lambda dialog, result: self.delete_workout(workout, result)
-        )
+            f"Delete '{workout['name']}' ('{workout['date']}') and all its exercises? This action cannot be undone."
+        ))
+
+        await self.delete_workout(workout, confirmed)
 
 
     # workout deletion handling depending of final choice
-    def delete_workout(self, workout, confirmed):
+    async def delete_workout(self, workout, confirmed):
 
         if confirmed:
 
-            self.db.delete_workout(workout['id'])
+            await self.adb.delete_workout(workout['id'])
+            self.views.discard(('workout', workout['id']))
             workout_date = datetime.strptime(workout['date'], '%Y-%m-%d').date()
-            self.show_day_details(workout_date)
+            await self.show_day_details(workout_date)
 
 
     # delete exercise from workout confirmation dialog
-    def confirm_delete_exercise(self, workout, exercise):
+    async def confirm_delete_exercise(self, workout, exercise):
 
-        self.main_window.confirm_dialog(
+        confirmed = await self.main_window.dialog(toga.ConfirmDialog(
             "Delete Exercise",
-            f"Delete this exercise from the workout?",
-            on_result=lambda dialog, result: self.delete_exercise(workout, exercise, result)
-        )
+            f"Delete this exercise from the workout?"
+        ))
+
+        await self.delete_exercise(workout, exercise, confirmed)
 
 
     # exercise (from workout) deletion handling depending on final choice
-    def delete_exercise(self, workout, exercise, confirmed):
+    async def delete_exercise(self, workout, exercise, confirmed):
 
         if confirmed:
 
-            self.db.del_linked_exercise(exercise['workout_exercise_id'])
-            self.show_workout_detail(workout)
-
+            await self.adb.del_linked_exercise(exercise['workout_exercise_id'])
+            await self.show_workout_detail(workout)
 
-    # chart generator (png bytes)
-    def generate_progress_chart(self, data_points) -> bytes:
-        
-        dates = [datetime.strptime(d['date'], '%Y-%m-%d') for d in data_points['data_points']]
-        weights = [d['max_weight'] for d in data_points['data_points']]
-
-        fig, ax = plt.subplots(figsize=(8, 5))
-        fig.patch.set_facecolor(self.theme('prime_background'))
-        ax.set_facecolor(self.theme('second_background'))
-
-        ax.plot(
-            dates,
-            weights,
-            marker='o',
-            linestyle='-',
-            linewidth=2,
-            markersize=6,
-            color=self.theme('primary')
-        )
-
-        ax.set_xlabel('Date', color=self.theme('text'))
-        ax.set_ylabel('Weight (kg)', color=self.theme('text'))
-        ax.set_title('Progress Over Time', color=self.theme('text'))
-        ax.grid(True, alpha=0.3, color=self.theme('text'))
-        ax.tick_params(color=self.theme('text'))
-
-        for spine in ax.spines.values():
-
-            spine.set_color(self.theme('text'))
 
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        plt.xticks(rotation=45)
-
-        plt.tight_layout()
+    # progress chart display
+    async def show_progress(self):
 
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=100, facecolor=self.theme('prime_background'))
-        buf.seek(0)
-        chart_bytes = buf.read()
-        buf.close()
-        plt.close(fig)
+        await self.views.show(('progress',), self.build_progress)
 
-        return chart_bytes
 
-    
-    # progress chart display
-    def show_progress(self):
+    # progress screen, rebuilt when logged data changed
+    async def build_progress(self):
         
         # main display box
-        progress_box = toga.Box(style=Pack(
-            direction=COLUMN,
-            padding=10,
-            background_color=self.theme('prime_background')
-        ))
+        progress_box = self.styles.create(toga.Box, 'screen')
 
         # header row with exercise dropdown and back button
-        header_box = toga.Box(style=Pack(
-            direction=ROW,
-            padding=10,
-            background_color=self.theme('second_background')
-        ))
+        header_box = self.styles.create(toga.Box, 'wide_header')
         # Need to add header here, otherwise it gets pushed down on the screen
         progress_box.add(header_box)
 
-        exercises = self.db.all_done_exercises()
+        exercises = await self.adb.all_done_exercises()
 
         if not exercises:
 
-            progress_box.add(toga.Label(
-                "No exercises logged yet.",
-                style=Pack(
-                    padding=10,
-                    color=self.theme('text')
-                )
-            ))
+            progress_box.add(self.styles.create(toga.Label, 'notice', "No exercises logged yet."))
 
         else:
 
             # dropdown exercise selector
-            exercise_selector = toga.Selection(
+            exercise_selector = self.styles.create(
+                toga.Selection,
+                'flex_input',
                 items=[ex['name'] for ex in exercises],
-                on_change=lambda w: self.load_exercise_progress(exercises, w.value),
-                style=Pack(
-                    flex=1,
-                    padding=5,
-                    background_color=self.theme('second_background'),
-                    color=self.theme('text')
-                )
+                on_change=partial(self.exercise_selected, exercises=exercises)
             )
             header_box.add(exercise_selector)
 
-        back_btn = toga.Button(
+        back_btn = self.styles.create(
+            toga.Button,
+            'back_button',
             "Back",
-            on_press=lambda w: self.show_calendar_view(),
-            style=Pack(
-                width=80,
-                padding=5,
-                background_color=self.theme('primary'),
-                color=self.theme('text'))
+            on_press=simple_handler(self.show_calendar_view)
         )
 
         # build header
         header_box.add(back_btn)
 
         # charting and stats
-        self.chart_box = toga.Box(style=Pack(
-            direction=COLUMN,
-            padding=10,
-            alignment='center',
-            background_color=self.theme('second_background')
-        ))
-        self.stats_box = toga.Box(style=Pack(
-            direction=COLUMN,
-            padding=10,
-            background_color=self.theme('second_background')
-        ))
+        self.chart_box = self.styles.create(toga.Box, 'centered_panel')
+        self.stats_box = self.styles.create(toga.Box, 'panel')
 
         # build whole statistics display
         progress_box.add(self.chart_box)
         progress_box.add(self.stats_box)
 
-        self.main_window.content = progress_box
-
         # default loadout
         if exercises:
 
-            self.load_exercise_progress(exercises, exercises[0]['name'])
+            await self.progress_loads.run(self.load_exercise_progress, exercises, exercises[0]['name'], delay=0)
+
+        # a new, still empty workout changes nothing here
+        return Screen(progress_box, topics={'workout_exercises', 'sets'})
+
+
+    # selection handler of the exercise dropdown
+    # debounced, a newer selection cancels the load still in flight
+    async def exercise_selected(self, widget, exercises):
+
+        await self.progress_loads.run(self.load_exercise_progress, exercises, widget.value)
 
 
     # loads and displays progress for selected exercise
-    def load_exercise_progress(self, exercises, exercise_name):
+    async def load_exercise_progress(self, exercises, exercise_name):
         
         # fetch exercise id and related stats from db
+        # the summary is computed by the db, the series is only loaded for the chart
         exercise_id = next(ex['id'] for ex in exercises if ex['name'] == exercise_name)
-        progress_data = self.db.get_exercise_stats(exercise_id)
+        stats = await self.adb.get_exercise_summary(exercise_id)
 
-        if not progress_data:
+        if not stats:
 
             self.chart_box.clear()
             self.stats_box.clear()
-            self.chart_box.add(toga.Label(
-                "No data for this exercise.",
-                style=Pack(
-                    padding=10,
-                    color=self.theme('text')
-                )
-            ))
+            self.chart_box.add(self.styles.create(toga.Label, 'notice', "No data for this exercise."))
 
             return
 
@@ -1214,30 +1071,9 @@ class WorkoutTracker(toga.App):
         self.chart_box.clear()
         self.stats_box.clear()
 
-        # bytes for chart
-        chart_bytes = self.generate_progress_chart(progress_data)
-
-        # for chart byte writing to temporary file
-        import tempfile
-
-        # write chart bytes to temporary file to load into Toga ImageView
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as f:
-
-            f.write(chart_bytes)
-            chart_path = f.name
-
-        # form graph from bytes
-        chart_image = toga.ImageView(
-            toga.Image(chart_path),
-            style=Pack(width=600, height=400, padding=10)
-        )
-
-        # stats dict
-        stats = progress_data['stats']
-
         # 2x2 grid for stats display
-        row1 = toga.Box(style=Pack(direction=ROW, padding=5))
-        row2 = toga.Box(style=Pack(direction=ROW, padding=5))
+        row1 = self.styles.create(toga.Box, 'row')
+        row2 = self.styles.create(toga.Box, 'row')
 
         # feed data for 2x2 grid
         row1.add(self._stat_box("Start Weight", f"{stats['start_weight']:.3f} kg"))
@@ -1245,34 +1081,35 @@ class WorkoutTracker(toga.App):
         row2.add(self._stat_box("Last Weight", f"{stats['last_weight']:.3f} kg"))
         row2.add(self._stat_box("Average Weight", f"{stats['average_weight']:.3f} kg"))
 
-        # build graph and 2x2 grid display
-        self.chart_box.add(chart_image)
         self.stats_box.add(row1)
-        self.stats_box.add(row2)   
+        self.stats_box.add(row2)
+
+        chart = await self.chart_backends[self.chart_backend].create_widget(
+            self.adb,
+            exercise_id,
+            self.current_theme,
+            THEMES[self.current_theme],
+            show_placeholder=self.show_chart_placeholder
+        )
+
+        # build graph display
+        self.chart_box.clear()
+        self.chart_box.add(chart)
+
+
+    # shown while a chart backend renders
+    def show_chart_placeholder(self):
+
+        self.chart_box.add(self.styles.create(toga.Label, 'notice', "Rendering chart..."))
 
     
     # helper for stat box creation
     def _stat_box(self, label, value):
         
-        box = toga.Box(style=Pack(
-            direction=COLUMN,
-            padding=10,
-            flex=1,
-            alignment='center',
-            background_color=self.theme('prime_background')
-        ))
+        box = self.styles.create(toga.Box, 'stat_tile')
 
-        label_widget = toga.Label(label, style=Pack(
-            font_size=10,
-            padding=5,
-            color=self.theme('text')
-        ))
-        value_widget = toga.Label(value, style=Pack(
-            font_size=16,
-            padding=5,
-            font_weight='bold',
-            color=self.theme('accent')
-        ))
+        label_widget = self.styles.create(toga.Label, 'stat_label', label)
+        value_widget = self.styles.create(toga.Label, 'stat_value', value)
 
         box.add(label_widget)
         box.add(value_widget)
@@ -1281,79 +1118,120 @@ class WorkoutTracker(toga.App):
 
 
     # display settings screen with selector
-    def show_settings(self):
+    async def show_settings(self):
+
+        await self.views.show(('settings',), self.build_settings)
+
+
+    async def build_settings(self):
         
-        main_box = toga.Box(style=Pack(
-            direction=COLUMN,
-            padding=10,
-            align_items='center',
-            background_color=self.theme('prime_background')
-        ))
+        main_box = self.styles.create(toga.Box, 'settings_screen')
 
-        header = toga.Label(
-            'Settings',
-            style=Pack(
-                padding=10,
-                font_size=18,
-                font_weight='bold',
-                text_align='center',
-                color=self.theme('text')
-            )
-        )
+        header = self.styles.create(toga.Label, 'settings_title', 'Settings')
 
-        theme_label = toga.Label(
-            'Colour Theme:',
-            style=Pack(
-                padding=5,
-                text_align='center',
-                color=self.theme('text')
-            )
-        )
+        theme_label = self.styles.create(toga.Label, 'centered_label', 'Colour Theme:')
 
-        theme_select = toga.Selection(
+        theme_select = self.styles.create(
+            toga.Selection,
+            'short_input',
             items=list(THEMES.keys()),
             value=self.current_theme,
-            on_change=lambda w: self.change_theme(w.value),
-            style=Pack(
-                padding=5,
-                width=200,
-                background_color=self.theme('second_background'),
-                color=self.theme('text')
-            )
+            on_change=self.theme_selected
         )
 
-        back_btn = toga.Button(
+        chart_label = self.styles.create(toga.Label, 'centered_label', 'Progress Charts:')
+
+        chart_select = self.styles.create(
+            toga.Selection,
+            'short_input',
+            items=list(self.chart_backends),
+            value=self.chart_backend,
+            on_change=self.chart_backend_selected
+        )
+
+        back_btn = self.styles.create(
+            toga.Button,
+            'wide_form_button',
             'Back',
-            on_press=lambda w: self.show_calendar_view(),
-            style=Pack(
-                padding=10,
-                width=100,
-                background_color=self.theme('primary'),
-                color=self.theme('text')
-            )
+            on_press=simple_handler(self.show_calendar_view)
         )
 
         main_box.add(header)
         main_box.add(theme_label)
         main_box.add(theme_select)
+        main_box.add(chart_label)
+        main_box.add(chart_select)
         main_box.add(back_btn)
 
-        self.main_window.content = main_box
+        return Screen(main_box)
+
+
+    # selection handler of the theme dropdown
+    async def theme_selected(self, widget):
+
+        await self.change_theme(widget.value)
+
+
+    # switch how progress charts are drawn
+    async def chart_backend_selected(self, widget):
+
+        self.chart_backend = widget.value
+        await self.adb.set_setting('chart_backend', widget.value)
+
+        # the kept progress screen still shows the old backend's chart
+        self.views.discard(('progress',))
 
 
     # apply selected theme to app
-    def change_theme(self, theme_name):
+    async def change_theme(self, theme_name):
 
         self.current_theme = theme_name
-        self.db.set_setting('theme', theme_name)
+        await self.adb.set_setting('theme', theme_name)
+
+        # live widgets are recoloured in place, only the chart has the old colours drawn in
+        self.styles.switch(theme_name)
+        self.views.discard(('progress',))
+
+
+    # close db connections before the app exits
+    def on_exit(self):
+
+        self.prefetch.cancel()
+        self.charts.close()
+        self.adb.close()
+
+        return True
+
+
+# widget updates that skip unchanged values, a no-op assignment can still trigger a relayout
+def _set_text(widget, text):
+
+    if widget.text != text:
+
+        widget.text = text
+
+
+def _set_style(widget, **properties):
+
+    for name, value in properties.items():
+
+        if getattr(widget.style, name) != value:
+
+            setattr(widget.style, name, value)
+
+
+# unit of work behind log_sets, runs on the db thread
+# creates the exercise if missing and links it on the first save, returns the workout_exercise_id
+def log_exercise_sets(db, workout_id, exercise_name, workout_exercise_id, sets):
 
-        self.show_calendar_view()
+    if workout_exercise_id is None:
 
+        exercise_id = db.add_new_exercise(exercise_name)
+        workout_exercise_id = db.link_exercise_to_workout(workout_id, exercise_id)
 
-    # helper to select colors from theme
-    def theme(self, key: str) -> str:
+    db.add_sets_bulk(workout_exercise_id, sets)
 
-        return THEMES[self.current_theme][key]
+    return workout_exercise_id
 
 
 def main():
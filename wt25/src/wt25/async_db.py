@@ -0,0 +1,65 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from wt25.database import WorkoutDB
+
+
+class AsyncWorkoutDB:
+
+
+    # awaitable facade over a WorkoutDB
+    # every call runs on one dedicated worker thread, so event handlers
+    # never block on disk and calls still reach SQLite one at a time
+    def __init__(self, db: WorkoutDB):
+
+        self.db = db
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='wt25-db')
+
+
+    # awaitable version of any public WorkoutDB method, e.g. await adb.get_setting('theme')
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+
+        method = getattr(self.db, name)
+
+        if name.startswith('_') or not callable(method):
+
+            raise AttributeError(name)
+
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+
+            return await self.run(method, *args, **kwargs)
+
+        # later lookups skip __getattr__
+        setattr(self, name, call)
+
+        return call
+
+
+    # run any callable on the db thread
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+
+    # run fn(db, *args) as one unit of work on the db thread
+    async def transaction(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+
+        def unit_of_work():
+
+            with self.db.transaction():
+
+                return fn(self.db, *args, **kwargs)
+
+        return await self.run(unit_of_work)
+
+
+    # let queued calls finish, then close the connections
+    def close(self) -> None:
+
+        self._executor.shutdown(wait=True)
+        self.db.close()
@@ -0,0 +1,102 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class LRUCache:
+
+
+    # bounded mapping that evicts the least recently used entry
+    # safe to share between threads
+    def __init__(self, max_entries: int = 256):
+
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def __len__(self) -> int:
+
+        return len(self._entries)
+
+
+    def __contains__(self, key: Hashable) -> bool:
+
+        return key in self._entries
+
+
+    # returns (found, value), a cached None still counts as found
+    def lookup(self, key: Hashable) -> tuple[bool, Any]:
+
+        with self._lock:
+
+            if key in self._entries:
+
+                self._entries.move_to_end(key)
+                self.hits += 1
+
+                return True, self._entries[key]
+
+            self.misses += 1
+
+            return False, None
+
+
+    # store a value, evicting the oldest entries beyond max_entries
+    def put(self, key: Hashable, value: Any) -> None:
+
+        with self._lock:
+
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+
+                self._entries.popitem(last=False)
+
+
+    # drop one entry if present
+    def discard(self, key: Hashable) -> None:
+
+        with self._lock:
+
+            self._entries.pop(key, None)
+
+
+    # drop every entry whose key matches
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> None:
+
+        with self._lock:
+
+            for key in [key for key in self._entries if predicate(key)]:
+
+                del self._entries[key]
+
+
+    # snapshot of the cached values, least recently used first
+    def values(self) -> list[Any]:
+
+        with self._lock:
+
+            return list(self._entries.values())
+
+
+    def clear(self) -> None:
+
+        with self._lock:
+
+            self._entries.clear()
+
+
+    # counters for tuning and tests
+    def info(self) -> dict[str, int]:
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries
+        }
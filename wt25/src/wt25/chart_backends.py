@@ -0,0 +1,181 @@
+"""
+Interchangeable progress chart backends
+"""
+
+import asyncio
+import importlib.util
+from typing import Any, Callable
+
+import toga
+from toga.style import Pack
+
+from wt25.async_db import AsyncWorkoutDB
+from wt25.chart_layout import MARGIN_LEFT, MARGIN_RIGHT, layout_progress_chart
+from wt25.charts import CHART_SIZE, ChartCache, ChartRenderer
+
+# on-screen size of the chart widget
+DISPLAY_SIZE = (600, 400)
+
+
+class MatplotlibChartBackend:
+
+
+    # png rendered by matplotlib on the chart workers, cached per data revision
+    name = 'Matplotlib'
+
+    def __init__(self, renderer: ChartRenderer, cache: ChartCache):
+
+        self.renderer = renderer
+        self.cache = cache
+
+
+    @staticmethod
+    def available() -> bool:
+
+        return importlib.util.find_spec('matplotlib') is not None
+
+
+    async def create_widget(
+        self,
+        adb: AsyncWorkoutDB,
+        exercise_id: int,
+        theme_name: str,
+        colors: dict[str, str],
+        show_placeholder: Callable[[], None]
+    ) -> toga.Widget:
+
+        # reopening an unchanged chart is served from the cache
+        revision = await adb.get_exercise_revision(exercise_id)
+        chart_key = (exercise_id, theme_name, CHART_SIZE, revision)
+        chart_bytes = await asyncio.to_thread(self.cache.get, chart_key)
+
+        if chart_bytes is None:
+
+            show_placeholder()
+
+            data_points = await adb.get_exercise_series(exercise_id)
+            chart_bytes = await self.renderer.render(data_points, colors, CHART_SIZE)
+            await asyncio.to_thread(self.cache.put, chart_key, chart_bytes)
+
+        # form graph from bytes, no temporary file needed
+        return toga.ImageView(
+            toga.Image(chart_bytes),
+            style=Pack(width=DISPLAY_SIZE[0], height=DISPLAY_SIZE[1], padding=10)
+        )
+
+
+class CanvasChartBackend:
+
+
+    # drawn straight onto a toga.Canvas, needs no matplotlib
+    # drawing takes milliseconds, so there is nothing worth caching
+    name = 'Canvas'
+
+    @staticmethod
+    def available() -> bool:
+
+        return True
+
+
+    async def create_widget(
+        self,
+        adb: AsyncWorkoutDB,
+        exercise_id: int,
+        theme_name: str,
+        colors: dict[str, str],
+        show_placeholder: Callable[[], None]
+    ) -> toga.Widget:
+
+        data_points = await adb.get_exercise_series(exercise_id)
+        data_points = await asyncio.to_thread(reduce_series, data_points, DISPLAY_SIZE[0] - MARGIN_LEFT - MARGIN_RIGHT)
+
+        canvas = toga.Canvas(style=Pack(width=DISPLAY_SIZE[0], height=DISPLAY_SIZE[1], padding=10))
+        draw_progress_chart(canvas, layout_progress_chart(data_points, *DISPLAY_SIZE), colors)
+
+        return canvas
+
+
+# downsample a series to what width_px pixels can show
+# runs off the event loop, the first call pays for importing numpy
+def reduce_series(data_points: list[dict[str, Any]], width_px: int) -> list[dict[str, Any]]:
+
+    from wt25.downsample import downsample_series, target_points
+
+    return downsample_series(data_points, target_points(width_px))
+
+
+# paint a layout from chart_layout onto a canvas
+def draw_progress_chart(canvas: toga.Canvas, layout: dict[str, Any], colors: dict[str, str]) -> None:
+
+    width, height = DISPLAY_SIZE
+    plot_x, plot_y, plot_width, plot_height = layout['plot']
+    context = canvas.context
+    context.clear()
+
+    with context.Fill(color=colors['prime_background']) as background:
+
+        background.rect(0, 0, width, height)
+
+    with context.Fill(color=colors['second_background']) as plot_area:
+
+        plot_area.rect(plot_x, plot_y, plot_width, plot_height)
+
+    # grid
+    with context.Stroke(color=colors['text'], line_width=0.5, line_dash=[2, 4]) as grid:
+
+        for x, _ in layout['x_ticks']:
+
+            grid.move_to(x, plot_y)
+            grid.line_to(x, plot_y + plot_height)
+
+        for y, _ in layout['y_ticks']:
+
+            grid.move_to(plot_x, y)
+            grid.line_to(plot_x + plot_width, y)
+
+    # axes
+    with context.Stroke(color=colors['text'], line_width=1) as axes:
+
+        axes.rect(plot_x, plot_y, plot_width, plot_height)
+
+    # tick labels and titles
+    with context.Fill(color=colors['text']) as text:
+
+        for x, label in layout['x_ticks']:
+
+            label_width, _ = canvas.measure_text(label)
+            text.write_text(label, x - label_width / 2, plot_y + plot_height + 18)
+
+        for y, label in layout['y_ticks']:
+
+            label_width, _ = canvas.measure_text(label)
+            text.write_text(label, plot_x - label_width - 6, y + 4)
+
+        title = 'Progress Over Time'
+        title_width, _ = canvas.measure_text(title)
+        text.write_text(title, (width - title_width) / 2, plot_y - 14)
+        text.write_text('Weight (kg)', 4, plot_y - 14)
+
+        date_width, _ = canvas.measure_text('Date')
+        text.write_text('Date', plot_x + (plot_width - date_width) / 2, height - 6)
+
+    # the series, a line with round markers
+    points = layout['points']
+
+    if points:
+
+        with context.Stroke(color=colors['primary'], line_width=2) as line:
+
+            line.move_to(*points[0])
+
+            for x, y in points[1:]:
+
+                line.line_to(x, y)
+
+        with context.Fill(color=colors['primary']) as markers:
+
+            for x, y in points:
+
+                markers.move_to(x + 3, y)
+                markers.arc(x, y, 3)
+
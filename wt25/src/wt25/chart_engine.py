@@ -0,0 +1,111 @@
+"""
+Persistent matplotlib figures for progress charts
+
+Works on the object API only, never on pyplot's global state, so engines
+are safe to use from worker threads. Imported lazily by wt25.charts.
+"""
+
+import io
+import threading
+from datetime import date
+from typing import Any
+
+import matplotlib.dates as mdates
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# fixed margins in pixels, room for the rotated date labels and the titles.
+# tight_layout would cost a second draw on every render
+MARGINS = {'left': 70, 'right': 20, 'top': 40, 'bottom': 100}
+
+
+class ChartEngine:
+
+
+    # one figure with its axes and line, drawn again for every chart.
+    # only the data, and the colours when the theme changed, are updated in place
+    def __init__(self, size: tuple[int, int], dpi: int):
+
+        width, height = size
+        self.size = size
+        self.dpi = dpi
+
+        self.figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        self.figure.subplots_adjust(
+            left=MARGINS['left'] / width,
+            right=1 - MARGINS['right'] / width,
+            top=1 - MARGINS['top'] / height,
+            bottom=MARGINS['bottom'] / height
+        )
+
+        self.ax = self.figure.add_subplot()
+        self.line, = self.ax.plot([], [], marker='o', linestyle='-', linewidth=2, markersize=6)
+
+        self.ax.xaxis_date()
+        self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+        self.ax.tick_params(axis='x', labelrotation=45)
+        self.ax.set_xlabel('Date')
+        self.ax.set_ylabel('Weight (kg)')
+        self.ax.set_title('Progress Over Time')
+
+        self._colors: dict[str, str] | None = None
+
+
+    def _apply_colors(self, colors: dict[str, str]) -> None:
+
+        self.figure.patch.set_facecolor(colors['prime_background'])
+        self.ax.set_facecolor(colors['second_background'])
+        self.line.set_color(colors['primary'])
+
+        self.ax.xaxis.label.set_color(colors['text'])
+        self.ax.yaxis.label.set_color(colors['text'])
+        self.ax.title.set_color(colors['text'])
+        self.ax.grid(True, alpha=0.3, color=colors['text'])
+        self.ax.tick_params(color=colors['text'])
+
+        for spine in self.ax.spines.values():
+
+            spine.set_color(colors['text'])
+
+        self._colors = dict(colors)
+
+
+    # png bytes of the progress chart
+    def render(self, data_points: list[dict[str, Any]], colors: dict[str, str]) -> bytes:
+
+        if colors != self._colors:
+
+            self._apply_colors(colors)
+
+        days = np.fromiter(
+            (mdates.date2num(date.fromisoformat(d['date'])) for d in data_points),
+            dtype=np.float64,
+            count=len(data_points)
+        )
+        weights = np.fromiter((d['max_weight'] for d in data_points), dtype=np.float64, count=len(data_points))
+
+        self.line.set_data(days, weights)
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+        buf = io.BytesIO()
+        self.figure.savefig(buf, format='png', dpi=self.dpi, facecolor=colors['prime_background'])
+
+        return buf.getvalue()
+
+
+# engines of the current thread, one per (size, dpi)
+_local = threading.local()
+
+
+def get_engine(size: tuple[int, int], dpi: int) -> ChartEngine:
+
+    engines = _local.__dict__.setdefault('engines', {})
+
+    if (size, dpi) not in engines:
+
+        engines[(size, dpi)] = ChartEngine(size, dpi)
+
+    return engines[(size, dpi)]
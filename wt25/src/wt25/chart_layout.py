@@ -0,0 +1,113 @@
+"""
+Layout math for the native progress chart, free of any GUI toolkit
+"""
+
+import math
+from datetime import date
+from typing import Any
+
+# space around the plot area for the axis labels and the title
+MARGIN_LEFT = 64
+MARGIN_RIGHT = 16
+MARGIN_TOP = 36
+MARGIN_BOTTOM = 48
+
+# horizontal room a '2025-11-19' tick label needs
+DATE_LABEL_WIDTH = 90
+Y_TICKS = 5
+
+
+# round a raw step up to 1, 2, 2.5 or 5 times a power of ten
+def nice_step(raw_step: float) -> float:
+
+    if raw_step <= 0:
+
+        return 1.0
+
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+
+    for factor in (1, 2, 2.5, 5, 10):
+
+        if raw_step <= factor * magnitude:
+
+            return factor * magnitude
+
+    return 10 * magnitude
+
+
+# evenly spaced tick values covering [low, high]
+def value_ticks(low: float, high: float, count: int = Y_TICKS) -> list[float]:
+
+    step = nice_step((high - low) / max(count - 1, 1))
+    first = math.floor(low / step) * step
+    ticks = []
+    value = first
+
+    while value <= high + step * 1e-9:
+
+        if value >= low - step * 1e-9:
+
+            ticks.append(round(value, 10))
+
+        value += step
+
+    return ticks
+
+
+# pixel positions of the series, grid and tick labels for a width x height chart
+def layout_progress_chart(data_points: list[dict[str, Any]], width: int, height: int) -> dict[str, Any]:
+
+    plot_x = MARGIN_LEFT
+    plot_y = MARGIN_TOP
+    plot_width = max(width - MARGIN_LEFT - MARGIN_RIGHT, 1)
+    plot_height = max(height - MARGIN_TOP - MARGIN_BOTTOM, 1)
+
+    days = [date.fromisoformat(d['date']).toordinal() for d in data_points]
+    weights = [d['max_weight'] for d in data_points]
+
+    if not days:
+
+        return {
+            'plot': (plot_x, plot_y, plot_width, plot_height),
+            'points': [],
+            'x_ticks': [],
+            'y_ticks': []
+        }
+
+    # a single day or a flat series still gets a visible range
+    first_day, last_day = min(days), max(days)
+
+    if first_day == last_day:
+
+        first_day, last_day = first_day - 1, last_day + 1
+
+    y_ticks = value_ticks(min(weights), max(weights))
+    low, high = min(y_ticks[0], min(weights)), max(y_ticks[-1], max(weights))
+
+    if low == high:
+
+        low, high = low - 1, high + 1
+        y_ticks = value_ticks(low, high)
+
+    def x_of(day: int) -> float:
+
+        return plot_x + (day - first_day) / (last_day - first_day) * plot_width
+
+    def y_of(weight: float) -> float:
+
+        return plot_y + plot_height - (weight - low) / (high - low) * plot_height
+
+    # as many date ticks as fit without overlapping labels
+    max_x_ticks = max(plot_width // DATE_LABEL_WIDTH, 2)
+    step_days = max(math.ceil((last_day - first_day) / (max_x_ticks - 1)), 1)
+    x_ticks = [
+        (x_of(day), date.fromordinal(day).isoformat())
+        for day in range(first_day, last_day + 1, step_days)
+    ]
+
+    return {
+        'plot': (plot_x, plot_y, plot_width, plot_height),
+        'points': [(x_of(day), y_of(weight)) for day, weight in zip(days, weights)],
+        'x_ticks': x_ticks,
+        'y_ticks': [(y_of(value), f'{value:g}') for value in y_ticks if low <= value <= high]
+    }
@@ -0,0 +1,222 @@
+"""
+Progress chart rendering off the GUI thread
+"""
+
+import asyncio
+import multiprocessing
+import os
+import re
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+
+from wt25.cache import LRUCache
+
+# platforms where the app cannot start worker processes
+NO_SUBPROCESS_PLATFORMS = ('ios', 'android', 'emscripten', 'wasi')
+
+# rendered chart size in pixels
+CHART_SIZE = (800, 500)
+CHART_DPI = 100
+
+
+# import matplotlib, load its font cache and build the default chart figure
+# ahead of the first chart. matplotlib is only ever imported on the chart
+# workers, so launching the app does not pay for it
+def warm_up() -> None:
+
+    from matplotlib import font_manager
+
+    from wt25.chart_engine import get_engine
+
+    font_manager.findfont(font_manager.FontProperties())
+    get_engine(CHART_SIZE, CHART_DPI)
+
+
+# chart generator (png bytes)
+# module level and fed only plain data, so it can be pickled to a worker process
+def render_progress_chart(
+    data_points: list[dict[str, Any]],
+    colors: dict[str, str],
+    size: tuple[int, int] = CHART_SIZE
+) -> bytes:
+
+    from wt25.chart_engine import get_engine
+    from wt25.downsample import downsample_series, target_points
+
+    # years of history still plot a bounded number of points
+    data_points = downsample_series(data_points, target_points(size[0]))
+
+    return get_engine(size, CHART_DPI).render(data_points, colors)
+
+
+class ChartRenderer:
+
+
+    # renders charts on a worker pool so the event loop stays responsive
+    # matplotlib holds the GIL while drawing, so processes are used where the
+    # platform allows them and a thread pool everywhere else
+    def __init__(self, max_workers: int = 1, use_processes: bool | None = None):
+
+        if use_processes is None:
+
+            use_processes = sys.platform not in NO_SUBPROCESS_PLATFORMS
+
+        self.max_workers = max_workers
+        self._executor = self._create_executor(use_processes)
+
+
+    @property
+    def uses_processes(self) -> bool:
+
+        return isinstance(self._executor, ProcessPoolExecutor)
+
+
+    def _create_executor(self, use_processes: bool) -> Executor:
+
+        if use_processes:
+
+            try:
+
+                # spawn, a forked child would inherit the db worker thread's locks
+                return ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+
+            except (NotImplementedError, OSError, ValueError):
+
+                pass
+
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='wt25-chart')
+
+
+    # start the workers and import matplotlib in the background
+    # so the first progress chart does not wait for it
+    def prewarm(self) -> None:
+
+        self._executor.submit(warm_up)
+
+
+    # png bytes of the progress chart, rendered off the event loop
+    async def render(
+        self,
+        data_points: list[dict[str, Any]],
+        colors: dict[str, str],
+        size: tuple[int, int] = CHART_SIZE
+    ) -> bytes:
+
+        loop = asyncio.get_running_loop()
+
+        try:
+
+            return await loop.run_in_executor(self._executor, render_progress_chart, data_points, colors, size)
+
+        except BrokenProcessPool:
+
+            # workers could not start (e.g. a sandboxed bundle), keep rendering on threads
+            self._executor.shutdown(wait=False)
+            self._executor = self._create_executor(use_processes=False)
+
+            return await loop.run_in_executor(self._executor, render_progress_chart, data_points, colors, size)
+
+
+    def close(self) -> None:
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ChartCache:
+
+
+    # rendered charts in memory and on disk, keyed by
+    # (exercise_id, theme, size, revision). the revision comes from
+    # WorkoutDB.get_exercise_revision, so new data never hits an old chart.
+    # disk entries are evicted least recently used first beyond max_disk_bytes
+    def __init__(self, directory: str | Path, max_memory_entries: int = 16, max_disk_bytes: int = 32 * 1024 * 1024):
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory = LRUCache(max_entries=max_memory_entries)
+
+
+    def _path(self, key: tuple) -> Path:
+
+        exercise_id, theme, (width, height), revision = key
+        theme = re.sub(r'[^A-Za-z0-9_-]', '_', theme)
+
+        return self.directory / f'{exercise_id}-{theme}-{width}x{height}-r{revision}.png'
+
+
+    # png bytes of a cached chart, or None
+    def get(self, key: tuple) -> bytes | None:
+
+        found, chart = self._memory.lookup(key)
+
+        if found:
+
+            return chart
+
+        path = self._path(key)
+
+        try:
+
+            chart = path.read_bytes()
+
+        except FileNotFoundError:
+
+            return None
+
+        # the mtime is the disk LRU order
+        os.utime(path)
+        self._memory.put(key, chart)
+
+        return chart
+
+
+    # store a chart and drop the older revisions of the same exercise
+    def put(self, key: tuple, chart: bytes) -> None:
+
+        exercise_id, _, _, revision = key
+
+        self._memory.discard_where(lambda cached: cached[0] == exercise_id and cached[3] != revision)
+        self._memory.put(key, chart)
+
+        for stale in self.directory.glob(f'{exercise_id}-*.png'):
+
+            if not stale.name.endswith(f'-r{revision}.png'):
+
+                stale.unlink(missing_ok=True)
+
+        # write then rename, a crash never leaves a truncated png behind
+        path = self._path(key)
+        partial = path.with_suffix('.tmp')
+        partial.write_bytes(chart)
+        os.replace(partial, path)
+
+        self._evict()
+
+
+    def _evict(self) -> None:
+
+        files = sorted(self.directory.glob('*.png'), key=lambda path: path.stat().st_mtime)
+        total = sum(path.stat().st_size for path in files)
+
+        while files and total > self.max_disk_bytes:
+
+            oldest = files.pop(0)
+            total -= oldest.stat().st_size
+            oldest.unlink(missing_ok=True)
+
+
+    def clear(self) -> None:
+
+        self._memory.clear()
+
+        for path in self.directory.glob('*.png'):
+
+            path.unlink(missing_ok=True)
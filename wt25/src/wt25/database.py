@@ -1,94 +1,374 @@
+import copy
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Callable, Any, Literal, TypedDict
-import os
+from typing import Callable, Any, Iterator, Literal, TypedDict
+
+from wt25.cache import LRUCache
+from wt25.events import (
+    ChangeEvent,
+    ExerciseAdded,
+    ExerciseLinked,
+    ExerciseUnlinked,
+    SetsAdded,
+    SettingChanged,
+    WorkoutAdded,
+    WorkoutDeleted,
+)
+from wt25.migrations import REBUILD_EXERCISE_DAILY, migrate
+
+# upper bound for "IN (?, ?, ...)" lists, SQLite builds before 3.32 allow 999
+MAX_QUERY_PARAMS = 500
+
+# sets per page of get_workout_sets
+SET_PAGE_SIZE = 100
+
+# PRAGMAs applied to every new connection, pass pragmas={} for SQLite's defaults
+# WAL lets readers run during writes and, with synchronous=NORMAL,
+# only fsyncs on checkpoints instead of on every commit
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'foreign_keys': 'ON',
+    'temp_store': 'MEMORY',
+    # negative values are KiB, so 8 MiB of page cache
+    'cache_size': -8192,
+    'mmap_size': 64 * 1024 * 1024,
+}
+
+
+# receives the events of one committed write or unit of work
+Subscriber = Callable[[tuple[ChangeEvent, ...]], None]
+
 
 class WorkoutDB:
 
 
     # initialize database
-    def __init__(self, db_path: str):
+    # one connection per thread is opened lazily and kept until close()
+    # reads are cached in up to cache_size entries, 0 turns the cache off
+    def __init__(
+        self,
+        db_path: str,
+        statement_cache_size: int = 256,
+        pragmas: dict[str, Any] | None = None,
+        cache_size: int = 256
+    ):
 
         self.db_path = str(db_path)
+        self.statement_cache_size = statement_cache_size
+        self.pragmas = DEFAULT_PRAGMAS if pragmas is None else pragmas
+        self._cache = LRUCache(cache_size) if cache_size else None
+        self._subscribers: list[tuple[Subscriber, tuple[type[ChangeEvent], ...]]] = []
+
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
         self._create_tables()
 
 
-    # establish connection to db
+    # context manager support, closes all connections on exit
+    def __enter__(self) -> 'WorkoutDB':
+
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+
+        self.close()
+
+
+    # establish connection to db, reused for every call from the same thread
     def _get_connection(self) -> sqlite3.Connection:
 
-        # debug
-        print(f"DEBUG: Database at: {os.path.abspath(self.db_path)}")
-        
-        conn = sqlite3.connect(self.db_path)
+        conn = getattr(self._local, 'conn', None)
+
+        if conn is not None:
+
+            return conn
+
+        # check_same_thread is disabled only so close() can reach
+        # connections opened by other threads, each thread still uses its own
+        conn = sqlite3.connect(
+            self.db_path,
+            cached_statements=self.statement_cache_size,
+            check_same_thread=False
+        )
         conn.row_factory = sqlite3.Row
 
+        for name, value in self.pragmas.items():
+
+            conn.execute(f'PRAGMA {name} = {value}')
+
+        self._local.conn = conn
+
+        with self._lock:
+
+            self._connections.append(conn)
+
         return conn
 
 
-    # create necessary tables if not existent
-    def _create_tables(self) -> None:
+    # close every connection opened by this instance
+    # a later call reopens lazily, so the instance stays usable
+    def close(self) -> None:
+
+        with self._lock:
+
+            connections = self._connections
+            self._connections = []
+
+        for conn in connections:
+
+            conn.close()
+
+        self._local = threading.local()
+
+
+    # unit of work, writes inside the block share one transaction and one commit
+    # an exception rolls the whole block back, nested blocks become savepoints
+    @contextmanager
+    def transaction(self) -> Iterator['WorkoutDB']:
 
         conn = self._get_connection()
-        cursor = conn.cursor()
+        depth = getattr(self._local, 'depth', 0)
+        savepoint = f'unit_of_work_{depth}'
 
-        # create workouts table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS workouts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT NOT NULL,
-                name TEXT NOT NULL
-            )
-        ''')
+        if depth:
 
-        # create exercises master table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS exercises (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE COLLATE NOCASE
-            )
-        ''')
-
-        # junction for exercise/workout linking
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS workout_exercises (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                workout_id INTEGER NOT NULL,
-                exercise_id INTEGER NOT NULL,
-                FOREIGN KEY (workout_id) REFERENCES workouts(id) ON DELETE CASCADE,
-                FOREIGN KEY (exercise_id) REFERENCES exercises(id) ON DELETE CASCADE
-                )
-        ''')
-
-        # create sets table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS sets (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                workout_exercise_id INTEGER NOT NULL,
-                reps INTEGER NOT NULL,
-                weight REAL NOT NULL,
-                FOREIGN KEY (workout_exercise_id) REFERENCES workout_exercises(id) ON DELETE CASCADE
-            )
-        ''')
-
-        # settings table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
-                )
-            ''')
-
-        # color theme table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
+            conn.execute(f'SAVEPOINT {savepoint}')
+
+        else:
+
+            # take the write lock up front so the block cannot fail half way on SQLITE_BUSY
+            conn.execute('BEGIN IMMEDIATE')
+            self._local.invalidations = []
+            self._local.events = []
+
+        # events of a savepoint that is rolled back are dropped with it
+        published = len(self._local.events)
+        self._local.depth = depth + 1
+
+        try:
+
+            yield self
+
+        except BaseException:
+
+            self._local.depth = depth
+
+            if depth:
+
+                conn.execute(f'ROLLBACK TO {savepoint}')
+                conn.execute(f'RELEASE {savepoint}')
+                del self._local.events[published:]
+
+            else:
+
+                conn.rollback()
+
+            raise
+
+        self._local.depth = depth
+
+        if depth:
+
+            conn.execute(f'RELEASE {savepoint}')
+
+        else:
+
+            conn.commit()
+
+            # other threads may have cached the old rows until now
+            for keys, where in self._local.invalidations:
+
+                self._invalidate(*keys, where=where)
+
+            if self._local.events:
+
+                self._publish(*self._local.events)
+
+
+    # commit unless the write is part of a unit of work
+    def _commit(self, conn: sqlite3.Connection) -> None:
+
+        if not getattr(self._local, 'depth', 0):
+
+            conn.commit()
+
+
+    # roll back a failed write, inside a unit of work the block's rollback takes care of it
+    def _rollback(self, conn: sqlite3.Connection) -> None:
+
+        if not getattr(self._local, 'depth', 0):
+
+            conn.rollback()
+
+
+    # connection for a single write, committed at the end of the block.
+    # a failed write is rolled back, the reused connection must not be left
+    # inside an open transaction holding the write lock
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+
+        conn = self._get_connection()
+
+        try:
+
+            yield conn
+            self._commit(conn)
+
+        except BaseException:
+
+            self._rollback(conn)
+            raise
+
+
+    # read-through cache lookup, returns (found, value)
+    # reads inside a unit of work may see uncommitted rows, so they bypass the cache
+    def _cache_get(self, key: tuple) -> tuple[bool, Any]:
+
+        if self._cache is None or getattr(self._local, 'depth', 0):
+
+            return False, None
+
+        found, value = self._cache.lookup(key)
+
+        # callers get their own copy to mutate
+        return found, copy.deepcopy(value)
+
+
+    def _cache_put(self, key: tuple, value: Any) -> None:
+
+        if self._cache is not None and not getattr(self._local, 'depth', 0):
+
+            self._cache.put(key, copy.deepcopy(value))
+
+
+    # return the cached result for key or load and cache it
+    def _read_through(self, key: tuple, load: Callable[[], Any]) -> Any:
+
+        found, value = self._cache_get(key)
+
+        if not found:
+
+            value = load()
+            self._cache_put(key, value)
+
+        return value
+
+
+    # drop cached reads made stale by a write, by key and/or by predicate on the key
+    def _invalidate(self, *keys: tuple, where: Callable[[tuple], bool] | None = None) -> None:
+
+        if self._cache is None:
+
+            return
+
+        for key in keys:
+
+            self._cache.discard(key)
+
+        if where is not None:
+
+            self._cache.discard_where(where)
+
+        # repeated on commit of the unit of work
+        if getattr(self._local, 'depth', 0):
+
+            self._local.invalidations.append((keys, where))
+
+
+    # drop cached calendar counts whose range contains date
+    def _invalidate_date(self, date: str, *keys: tuple) -> None:
+
+        self._invalidate(
+            ('get_workouts_by_date', date),
+            *keys,
+            where=lambda key: key[0] == 'get_workout_counts' and key[1] <= date <= key[2]
+        )
+
+
+    # drop cached exercises and set pages of a workout
+    def _invalidate_workout(self, workout_id: int, *keys: tuple) -> None:
+
+        self._invalidate(
+            ('get_workout_exercises', workout_id),
+            ('get_workout_overview', workout_id),
+            *keys,
+            where=lambda key: key[0] == 'get_workout_sets' and key[1] == workout_id
+        )
+
+
+    # workout, exercise and date of a workout_exercise, for invalidation and events
+    def _link_info(self, workout_exercise_id: int) -> sqlite3.Row | None:
+
+        return self._get_connection().execute("""
+        SELECT we.workout_id, we.exercise_id, w.date
+        FROM workout_exercises we
+        JOIN workouts w ON w.id = we.workout_id
+        WHERE we.id = ?
+        """, (workout_exercise_id,)).fetchone()
+
+
+    # call subscriber(events) after every committed write with the ChangeEvents it made,
+    # a unit of work is delivered in one call. with event_types given, only those
+    # events are passed on and writes without any of them are skipped.
+    # subscribers run on the writing thread and must not block
+    def subscribe(self, subscriber: Subscriber, *event_types: type[ChangeEvent]) -> None:
+
+        with self._lock:
+
+            self._subscribers.append((subscriber, event_types))
+
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+
+        with self._lock:
+
+            self._subscribers = [entry for entry in self._subscribers if entry[0] != subscriber]
+
+
+    # publish the events of a write, inside a unit of work once it commits
+    def _publish(self, *events: ChangeEvent) -> None:
+
+        if getattr(self._local, 'depth', 0):
+
+            self._local.events.extend(events)
+            return
+
+        with self._lock:
+
+            subscribers = list(self._subscribers)
+
+        for subscriber, event_types in subscribers:
+
+            wanted = events if not event_types else tuple(
+                event for event in events if isinstance(event, event_types)
             )
-        ''')
 
-        conn.commit()
-        conn.close()
+            if wanted:
+
+                subscriber(wanted)
+
+
+    # hit/miss counters of the read cache
+    def cache_info(self) -> dict[str, int]:
+
+        if self._cache is None:
+
+            return {'hits': 0, 'misses': 0, 'entries': 0, 'max_entries': 0}
+
+        return self._cache.info()
+
+
+    # create or upgrade tables, a no-op when the schema is current
+    def _create_tables(self) -> None:
+
+        migrate(self._get_connection())
 
 # -- Workout Methods --
 
@@ -101,14 +381,17 @@ class WorkoutDB:
         cursor.execute('SELECT * FROM workouts ORDER BY date DESC')
         workouts = cursor.fetchall()
 
-        conn.close()
-
         return [dict(row) for row in workouts]
 
 
     # queries workouts for specific date
     def get_workouts_by_date(self, date: str) -> list[dict[str, Any]]:
 
+        return self._read_through(('get_workouts_by_date', date), lambda: self._load_workouts_by_date(date))
+
+
+    def _load_workouts_by_date(self, date: str) -> list[dict[str, Any]]:
+
         conn = self._get_connection()
         cursor = conn.cursor()
 
@@ -125,25 +408,48 @@ class WorkoutDB:
 
             workouts.append(dict(row))
 
-        conn.close()
-
         return workouts
 
-    
-    # adds new workout to db, return id for exefcise linking
-    def add_workout(self, name: str, date:str) -> int:
+
+    # counts workouts per day between two dates (inclusive, YYYY-MM-DD)
+    # used by the calendar to mark days with workouts
+    def get_workout_counts(self, start_date: str, end_date: str) -> dict[str, int]:
+
+        return self._read_through(
+            ('get_workout_counts', start_date, end_date),
+            lambda: self._load_workout_counts(start_date, end_date)
+        )
+
+
+    def _load_workout_counts(self, start_date: str, end_date: str) -> dict[str, int]:
 
         conn = self._get_connection()
         cursor = conn.cursor()
 
         cursor.execute("""
-        INSERT INTO workouts (name, date)
-        VALUES (?, ?)
-        """, (name, date))
-        
-        workout_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        SELECT date, COUNT(*) AS workout_count
+        FROM workouts
+        WHERE date BETWEEN ? AND ?
+        GROUP BY date
+        """, (start_date, end_date))
+
+        return {row['date']: row['workout_count'] for row in cursor.fetchall()}
+
+    
+    # adds new workout to db, return id for exefcise linking
+    def add_workout(self, name: str, date:str) -> int:
+
+        with self._write() as conn:
+
+            cursor = conn.execute("""
+            INSERT INTO workouts (name, date)
+            VALUES (?, ?)
+            """, (name, date))
+
+            workout_id = cursor.lastrowid
+
+        self._invalidate_date(date)
+        self._publish(WorkoutAdded(workout_id, name, date))
 
         return workout_id
 
@@ -151,27 +457,41 @@ class WorkoutDB:
     # delete a workout and all linked exercises/sets
     def delete_workout(self, workout_id: int) -> None:
 
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._write() as conn:
+
+            cursor = conn.cursor()
+
+            cursor.execute('SELECT date FROM workouts WHERE id = ?', (workout_id,))
+            row = cursor.fetchone()
 
-        cursor.execute('DELETE FROM workouts WHERE id = ?', (workout_id,))
+            # exercises whose history loses this workout, for the event
+            cursor.execute('SELECT DISTINCT exercise_id FROM workout_exercises WHERE workout_id = ?', (workout_id,))
+            exercise_ids = tuple(exercise['exercise_id'] for exercise in cursor.fetchall())
 
-        conn.commit()
-        conn.close()
+            cursor.execute('DELETE FROM workouts WHERE id = ?', (workout_id,))
+
+        if row:
+
+            self._invalidate_date(row['date'], ('all_done_exercises',))
+            self._invalidate_workout(workout_id)
+            self._publish(WorkoutDeleted(workout_id, row['date'], exercise_ids))
 
 # -- Exercise Methods --
 
     # queries all exercises from db
     def get_all_exercises(self) -> list[dict[str, Any]]:
 
+        return self._read_through(('get_all_exercises',), self._load_all_exercises)
+
+
+    def _load_all_exercises(self) -> list[dict[str, Any]]:
+
         conn = self._get_connection()
         cursor = conn.cursor()
 
         cursor.execute('SELECT id, name FROM exercises ORDER BY name')
         exercises = [dict(row) for row in cursor.fetchall()]
 
-        conn.close()
-
         return exercises
 
 
@@ -179,24 +499,33 @@ class WorkoutDB:
     # case insensitivity achieved by COLLATE NOCASE in table creation
     def add_new_exercise(self, name: str) -> int:
 
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._write() as conn:
 
-        try:
+            cursor = conn.cursor()
 
-            cursor.execute('INSERT INTO exercises (name) VALUES (?)', (name,))
-            exercise_id = cursor.lastrowid
-            conn.commit()
-        
-        except sqlite3.IntegrityError:
-            
-            conn.rollback()
-            cursor.execute('SELECT id FROM exercises WHERE name = ?', (name,))
-            exercise_id = cursor.fetchone()[0]
+            # a duplicate name is skipped instead of raising,
+            # so an open unit of work does not have to be rolled back
+            cursor.execute("""
+            INSERT INTO exercises (name)
+            VALUES (?)
+            ON CONFLICT(name) DO NOTHING
+            """, (name,))
 
-        finally:
+            added = cursor.rowcount > 0
 
-            conn.close()
+            if added:
+
+                exercise_id = cursor.lastrowid
+
+            else:
+
+                cursor.execute('SELECT id FROM exercises WHERE name = ?', (name,))
+                exercise_id = cursor.fetchone()[0]
+
+        if added:
+
+            self._invalidate(('get_all_exercises',))
+            self._publish(ExerciseAdded(exercise_id, name))
 
         return exercise_id
 
@@ -204,87 +533,243 @@ class WorkoutDB:
     # delete exercise from a workout
     def del_linked_exercise(self, workout_exercise_id: int) -> None:
 
-        conn = self._get_connection()
-        cursor = conn. cursor()
+        with self._write() as conn:
+
+            link = self._link_info(workout_exercise_id)
+            conn.execute('DELETE FROM workout_exercises WHERE id = ?', (workout_exercise_id,))
 
-        cursor.execute('DELETE FROM workout_exercises WHERE id = ?', (workout_exercise_id,))
+        if link:
 
-        conn.commit()
-        conn.close()
+            self._invalidate_workout(link['workout_id'], ('all_done_exercises',))
+            self._publish(ExerciseUnlinked(workout_exercise_id, *link))
 
 # -- Set Methods --
 
     # adds new set to db, linked to an exercise in a workout
     def add_set(self, workout_exercise_id: int, reps: int, weight: float) -> int:
 
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._write() as conn:
 
-        cursor.execute("""
-        INSERT INTO sets (workout_exercise_id, reps, weight)
-        VALUES (?, ?, ?)
-        """, (workout_exercise_id, reps, weight))
+            cursor = conn.execute("""
+            INSERT INTO sets (workout_exercise_id, reps, weight)
+            VALUES (?, ?, ?)
+            """, (workout_exercise_id, reps, weight))
+
+            set_id = cursor.lastrowid
+            link = self._link_info(workout_exercise_id)
 
-        set_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        self._sets_added((set_id,), workout_exercise_id, link)
 
         return set_id
 
+
+    # adds many (reps, weight) sets to one exercise with a single commit
+    # returns the new set ids in input order
+    def add_sets_bulk(self, workout_exercise_id: int, sets: list[tuple[int, float]]) -> list[int]:
+
+        if not sets:
+
+            return []
+
+        # a unit of work of its own, or a savepoint inside the caller's,
+        # so a failed insert leaves no part of the batch behind either way
+        with self.transaction():
+
+            conn = self._get_connection()
+            conn.executemany("""
+            INSERT INTO sets (workout_exercise_id, reps, weight)
+            VALUES (?, ?, ?)
+            """, [(workout_exercise_id, reps, weight) for reps, weight in sets])
+
+            # AUTOINCREMENT hands out consecutive ids while this transaction holds the write lock
+            last_id = conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+            set_ids = list(range(last_id - len(sets) + 1, last_id + 1))
+            self._sets_added(tuple(set_ids), workout_exercise_id, self._link_info(workout_exercise_id))
+
+        return set_ids
+
+
+    # invalidation and event shared by add_set and add_sets_bulk
+    def _sets_added(self, set_ids: tuple[int, ...], workout_exercise_id: int, link: sqlite3.Row | None) -> None:
+
+        # without foreign keys a set can point at a missing link
+        if link:
+
+            self._invalidate_workout(link['workout_id'])
+            self._publish(SetsAdded(set_ids, workout_exercise_id, *link))
+
 # -- Combi Methods --
 
     # queries exercises and sets for a given workout
     def get_workout_exercises(self, workout_id: int) -> list[dict[str, Any]]:
 
+        return self.get_exercises_for_workouts([workout_id])[workout_id]
+
+
+    # queries exercises and sets for many workouts at once
+    # cached workouts are served from memory, the rest is loaded together
+    def get_exercises_for_workouts(self, workout_ids: list[int]) -> dict[int, list[dict[str, Any]]]:
+
+        workouts = {}
+        missing = []
+
+        for workout_id in workout_ids:
+
+            found, exercises = self._cache_get(('get_workout_exercises', workout_id))
+
+            if found:
+
+                workouts[workout_id] = exercises
+
+            else:
+
+                missing.append(workout_id)
+
+        if missing:
+
+            loaded = self._load_exercises_for_workouts(missing)
+
+            for workout_id, exercises in loaded.items():
+
+                self._cache_put(('get_workout_exercises', workout_id), exercises)
+
+            workouts.update(loaded)
+
+        return {workout_id: workouts[workout_id] for workout_id in workout_ids}
+
+
+    # one joined query per chunk of ids, rows are grouped in a single pass
+    def _load_exercises_for_workouts(self, workout_ids: list[int]) -> dict[int, list[dict[str, Any]]]:
+
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        # query workout exercises
-        cursor.execute("""
+        workouts = {workout_id: [] for workout_id in workout_ids}
+        ids = list(workouts)
+
+        # stay below SQLite's bound parameter limit on older builds
+        for start in range(0, len(ids), MAX_QUERY_PARAMS):
+
+            chunk = ids[start:start + MAX_QUERY_PARAMS]
+            placeholders = ', '.join('?' * len(chunk))
+
+            cursor.execute(f"""
+            SELECT
+            w.workout_id,
+            w.id AS workout_exercise_id,
+            e.id AS exercise_id,
+            e.name AS exercise_name,
+            s.id AS set_id,
+            s.reps,
+            s.weight
+            FROM workout_exercises w
+            JOIN exercises e ON w.exercise_id = e.id
+            LEFT JOIN sets s ON s.workout_exercise_id = w.id
+            WHERE w.workout_id IN ({placeholders})
+            ORDER BY w.id, s.id
+            """, chunk)
+
+            exercise = None
+
+            for row in cursor:
+
+                # rows arrive ordered by workout_exercise_id, so a new id starts a new exercise
+                if exercise is None or exercise['workout_exercise_id'] != row['workout_exercise_id']:
+
+                    exercise = {
+                        'workout_exercise_id': row['workout_exercise_id'],
+                        'exercise_id': row['exercise_id'],
+                        'exercise_name': row['exercise_name'],
+                        'sets': []
+                    }
+                    workouts[row['workout_id']].append(exercise)
+
+                # exercises without sets come back with a NULL set row
+                if row['set_id'] is not None:
+
+                    exercise['sets'].append({
+                        'id': row['set_id'],
+                        'reps': row['reps'],
+                        'weight': row['weight']
+                    })
+
+        return workouts
+
+
+    # exercises of a workout with their set counts, without the sets themselves
+    def get_workout_overview(self, workout_id: int) -> list[dict[str, Any]]:
+
+        return self._read_through(('get_workout_overview', workout_id), lambda: self._load_workout_overview(workout_id))
+
+
+    def _load_workout_overview(self, workout_id: int) -> list[dict[str, Any]]:
+
+        cursor = self._get_connection().execute("""
         SELECT
         w.id AS workout_exercise_id,
         e.id AS exercise_id,
-        e.name AS exercise_name
+        e.name AS exercise_name,
+        COUNT(s.id) AS set_count
         FROM workout_exercises w
         JOIN exercises e ON w.exercise_id = e.id
+        LEFT JOIN sets s ON s.workout_exercise_id = w.id
         WHERE w.workout_id = ?
+        GROUP BY w.id
         ORDER BY w.id
         """, (workout_id,))
 
-        exercises = [dict(row) for row in cursor.fetchall()]
+        return [dict(row) for row in cursor.fetchall()]
 
-        # query details for each exercise
-        for exercise in exercises:
 
-            cursor.execute("""
-            SELECT id, reps, weight
-            FROM sets
-            WHERE workout_exercise_id = ?
-            ORDER BY id
-            """, (exercise['workout_exercise_id'],))
+    # one page of a workout's sets, SET_PAGE_SIZE at most,
+    # in the order of get_workout_overview and by set within an exercise
+    def get_workout_sets(self, workout_id: int, page: int) -> list[dict[str, Any]]:
 
-            exercise['sets'] = [dict(row) for row in cursor.fetchall()]
+        return self._read_through(
+            ('get_workout_sets', workout_id, page),
+            lambda: self._load_workout_sets(workout_id, page)
+        )
 
-        conn.close()
 
-        return exercises
+    def _load_workout_sets(self, workout_id: int, page: int) -> list[dict[str, Any]]:
+
+        cursor = self._get_connection().execute("""
+        SELECT
+        s.id,
+        s.workout_exercise_id,
+        e.name AS exercise_name,
+        s.reps,
+        s.weight
+        FROM sets s
+        JOIN workout_exercises w ON s.workout_exercise_id = w.id
+        JOIN exercises e ON w.exercise_id = e.id
+        WHERE w.workout_id = ?
+        ORDER BY w.id, s.id
+        LIMIT ? OFFSET ?
+        """, (workout_id, SET_PAGE_SIZE, page * SET_PAGE_SIZE))
+
+        return [dict(row) for row in cursor.fetchall()]
 
 
     # links exercise to workout, returns workout_exercise_id
     def link_exercise_to_workout(self, workout_id: int, exercise_id: int) -> int:
 
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._write() as conn:
 
-        cursor.execute("""
-        INSERT INTO workout_exercises (workout_id, exercise_id)
-        VALUES (?, ?)
-        """, (workout_id, exercise_id))
+            cursor = conn.execute("""
+            INSERT INTO workout_exercises (workout_id, exercise_id)
+            VALUES (?, ?)
+            """, (workout_id, exercise_id))
+
+            workout_exercise_id = cursor.lastrowid
+            link = self._link_info(workout_exercise_id)
+
+        self._invalidate_workout(workout_id, ('all_done_exercises',))
 
-        workout_exercise_id = cursor.lastrowid
+        # without foreign keys the link can point at a missing workout
+        if link:
 
-        conn.commit()
-        conn.close()
+            self._publish(ExerciseLinked(workout_exercise_id, *link))
 
         return workout_exercise_id
 
@@ -292,6 +777,11 @@ class WorkoutDB:
     # get a list of all done exercises over all workouts
     def all_done_exercises(self) -> list[dict[str, Any]]:
 
+        return self._read_through(('all_done_exercises',), self._load_all_done_exercises)
+
+
+    def _load_all_done_exercises(self) -> list[dict[str, Any]]:
+
         conn = self._get_connection()
         cursor = conn.cursor()
 
@@ -303,83 +793,131 @@ class WorkoutDB:
         """)
 
         exercises = cursor.fetchall()
-        conn.close()
 
         return [dict(ex) for ex in exercises]
 
 
-    # get stats for workout exercises for progress plotting
-    def get_exercise_stats(self, exercise_id: int) -> dict:
+    # per-day max weight of an exercise, oldest first, for progress plotting
+    # read from the exercise_daily rollup, so the cost follows training days, not sets
+    def get_exercise_series(self, exercise_id: int) -> list[dict[str, Any]]:
 
         conn = self._get_connection()
         cursor = conn.cursor()
 
         cursor.execute("""
-        SELECT 
-            w.date,
-            MAX(s.weight) AS max_weight
-        FROM workouts w
-        JOIN workout_exercises we ON w.id = we.workout_id
-        JOIN sets s ON we.id = s.workout_exercise_id
-        WHERE we.exercise_id = ?
-        GROUP BY w.date
-        ORDER BY w.date
+        SELECT date, max_weight
+        FROM exercise_daily
+        WHERE exercise_id = ?
+        ORDER BY date
         """, (exercise_id,))
 
-        data_points = [dict(row) for row in cursor.fetchall()]
+        return [dict(row) for row in cursor.fetchall()]
 
-        if not data_points:
 
-            conn.close()
+    # data revision of an exercise's progress series, bumped by triggers on exercise_daily
+    # 0 until the exercise has sets; cached charts are keyed by it
+    def get_exercise_revision(self, exercise_id: int) -> int:
 
-            return None
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT revision FROM exercise_revisions WHERE exercise_id = ?",
+            (exercise_id,)
+        ).fetchone()
 
-        weights = [d['max_weight'] for d in data_points]
+        return row['revision'] if row else 0
 
-        stats = {
 
-            'start_weight': weights[0],
-            'personal_best': max(weights),
-            'last_weight': weights[-1],
-            'average_weight': sum(weights) / len(weights)
+    # summary of the per-day max weights, computed in one query
+    # returns None if the exercise has no sets yet
+    def get_exercise_summary(self, exercise_id: int) -> dict[str, Any] | None:
 
-        }
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+        WITH daily AS (
+            SELECT date, max_weight
+            FROM exercise_daily
+            WHERE exercise_id = ?
+        )
+        SELECT
+            FIRST_VALUE(max_weight) OVER days AS start_weight,
+            MAX(max_weight) OVER days AS personal_best,
+            LAST_VALUE(max_weight) OVER days AS last_weight,
+            AVG(max_weight) OVER days AS average_weight,
+            COUNT(*) OVER days AS training_days
+        FROM daily
+        WINDOW days AS (ORDER BY date ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING)
+        LIMIT 1
+        """, (exercise_id,))
+
+        row = cursor.fetchone()
+
+        return dict(row) if row else None
+
+
+    # get stats for workout exercises for progress plotting
+    # the series is only fetched when asked for
+    def get_exercise_stats(self, exercise_id: int, include_series: bool = True) -> dict | None:
+
+        stats = self.get_exercise_summary(exercise_id)
 
-        conn.close()
+        if stats is None:
+
+            return None
 
         return {
 
-        'data_points': data_points,
+        'data_points': self.get_exercise_series(exercise_id) if include_series else None,
         'stats': stats
 
         }
 
+# -- Maintenance Methods --
+
+    # recompute the exercise_daily rollup from scratch
+    # triggers keep it current, this repairs it should it ever drift
+    def rebuild_exercise_daily(self) -> None:
+
+        with self.transaction() as db:
+
+            conn = db._get_connection()
+
+            for statement in REBUILD_EXERCISE_DAILY:
+
+                conn.execute(statement)
+
 # -- Settings Methods --
 
     # retrieve a setting value by key
     def get_setting(self, key: str, default=None) -> str:
 
+        value = self._read_through(('get_setting', key), lambda: self._load_setting(key))
+
+        return default if value is None else value
+
+
+    def _load_setting(self, key: str) -> str | None:
+
         conn = self._get_connection()
         cursor = conn.cursor()
 
         cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
 
         row = cursor.fetchone()
-        conn.close()
 
-        return row['value'] if row else default
+        return row['value'] if row else None
 
     # sets new setting values to db
     def set_setting(self, key: str, value: str) -> None:
 
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._write() as conn:
 
-        cursor.execute("""
-        INSERT INTO settings (key, value)
-        VALUES (?, ?)
-        ON CONFLICT(key) DO UPDATE SET value = ?
-        """, (key, value, value))
-        
-        conn.commit()
-        conn.close()
+            conn.execute("""
+            INSERT INTO settings (key, value)
+            VALUES (?, ?)
+            ON CONFLICT(key) DO UPDATE SET value = ?
+            """, (key, value, value))
+
+        self._invalidate(('get_setting', key))
+        self._publish(SettingChanged(key, value))
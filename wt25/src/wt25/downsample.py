@@ -0,0 +1,87 @@
+"""
+Series reduction for progress charts
+
+Imported lazily by the chart backends, numpy stays out of app startup.
+"""
+
+from datetime import date
+from typing import Any
+
+import numpy as np
+
+# horizontal pixels per plotted point, finer gets unreadable with markers
+PIXELS_PER_POINT = 4
+
+
+# how many points a plot of the given pixel width can show
+def target_points(width_px: int, pixels_per_point: int = PIXELS_PER_POINT) -> int:
+
+    return max(width_px // pixels_per_point, 3)
+
+
+# indices picked by Largest-Triangle-Three-Buckets, first and last point included.
+# the loop runs once per bucket, the work inside each bucket is vectorised
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+
+    n = len(x)
+
+    if threshold >= n or threshold < 3:
+
+        return np.arange(n)
+
+    # scale both axes to [0, 1] so triangle areas match what the plot shows
+    x = (x - x.min()) / (np.ptp(x) or 1.0)
+    y = (y - y.min()) / (np.ptp(y) or 1.0)
+
+    # threshold - 2 buckets between the fixed first and last point
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.intp)
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+    previous = 0
+
+    for bucket in range(threshold - 2):
+
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+
+        # the triangle's third corner is the average of the next bucket
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        areas = np.abs(
+            (x[previous] - avg_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (avg_y - y[previous])
+        )
+        previous = start + int(areas.argmax())
+        selected[bucket + 1] = previous
+
+    return selected
+
+
+# indices of the days that set a new personal best, the first day of each new max
+def personal_best_indices(weights: np.ndarray) -> np.ndarray:
+
+    best_before = np.maximum.accumulate(weights)[:-1]
+
+    return np.flatnonzero(weights > np.concatenate(([-np.inf], best_before)))
+
+
+# reduce a get_exercise_series result to at most `target` points for plotting.
+# every personal best is kept so the chart's PR progression stays intact, LTTB picks
+# the rest from the room left. a history with more personal bests than that keeps
+# all of them and exceeds `target`
+def downsample_series(data_points: list[dict[str, Any]], target: int) -> list[dict[str, Any]]:
+
+    if len(data_points) <= target:
+
+        return data_points
+
+    days = np.fromiter((date.fromisoformat(d['date']).toordinal() for d in data_points), dtype=np.float64, count=len(data_points))
+    weights = np.fromiter((d['max_weight'] for d in data_points), dtype=np.float64, count=len(data_points))
+
+    bests = personal_best_indices(weights)
+    keep = lttb_indices(days, weights, max(target - len(bests), 3))
+    keep = np.union1d(keep, bests)
+
+    return [data_points[i] for i in keep]
@@ -0,0 +1,89 @@
+"""
+Change events published by WorkoutDB once a write is committed
+"""
+
+from dataclasses import dataclass
+from typing import ClassVar
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+
+    # tables the change touches, for subscribers that only need to know what kind of data changed:
+    # 'workouts', 'exercises', 'workout_exercises', 'sets' or 'settings'
+    topics: ClassVar[frozenset[str]] = frozenset()
+
+
+@dataclass(frozen=True)
+class WorkoutAdded(ChangeEvent):
+
+    topics = frozenset({'workouts'})
+
+    workout_id: int
+    name: str
+    date: str
+
+
+@dataclass(frozen=True)
+class WorkoutDeleted(ChangeEvent):
+
+    # the workout's exercise links and sets went with it
+    topics = frozenset({'workouts', 'workout_exercises', 'sets'})
+
+    workout_id: int
+    date: str
+    exercise_ids: tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class ExerciseAdded(ChangeEvent):
+
+    topics = frozenset({'exercises'})
+
+    exercise_id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class ExerciseLinked(ChangeEvent):
+
+    topics = frozenset({'workout_exercises'})
+
+    workout_exercise_id: int
+    workout_id: int
+    exercise_id: int
+    date: str
+
+
+@dataclass(frozen=True)
+class ExerciseUnlinked(ChangeEvent):
+
+    # the link's sets went with it
+    topics = frozenset({'workout_exercises', 'sets'})
+
+    workout_exercise_id: int
+    workout_id: int
+    exercise_id: int
+    date: str
+
+
+@dataclass(frozen=True)
+class SetsAdded(ChangeEvent):
+
+    # one event per add_set or add_sets_bulk call
+    topics = frozenset({'sets'})
+
+    set_ids: tuple[int, ...]
+    workout_exercise_id: int
+    workout_id: int
+    exercise_id: int
+    date: str
+
+
+@dataclass(frozen=True)
+class SettingChanged(ChangeEvent):
+
+    topics = frozenset({'settings'})
+
+    key: str
+    value: str
@@ -0,0 +1,28 @@
+"""
+Maintenance commands for a workouts.db file
+
+Usage: python -m wt25.maintenance rebuild-rollups path/to/workouts.db
+"""
+
+import argparse
+
+from wt25.database import WorkoutDB
+
+
+def main(argv: list[str] | None = None) -> None:
+
+    parser = argparse.ArgumentParser(prog='python -m wt25.maintenance')
+    parser.add_argument('command', choices=['rebuild-rollups'])
+    parser.add_argument('db_path', help='path to workouts.db')
+    args = parser.parse_args(argv)
+
+    with WorkoutDB(args.db_path) as db:
+
+        if args.command == 'rebuild-rollups':
+
+            db.rebuild_exercise_daily()
+            print("exercise_daily rebuilt")
+
+
+if __name__ == "__main__":
+    main()
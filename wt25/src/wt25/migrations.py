@@ -0,0 +1,277 @@
+import sqlite3
+
+# recompute the whole exercise_daily rollup from the base tables
+REBUILD_EXERCISE_DAILY: tuple[str, ...] = (
+    'DELETE FROM exercise_daily',
+    '''
+    INSERT INTO exercise_daily (exercise_id, date, max_weight, total_reps, volume, set_count)
+    SELECT we.exercise_id, w.date, MAX(s.weight), SUM(s.reps), SUM(s.reps * s.weight), COUNT(*)
+    FROM workouts w
+    JOIN workout_exercises we ON we.workout_id = w.id
+    JOIN sets s ON s.workout_exercise_id = we.id
+    GROUP BY we.exercise_id, w.date
+    ''',
+)
+
+# ordered schema migrations for workouts.db
+# PRAGMA user_version holds the number of steps already applied,
+# so step n brings a database from version n - 1 to version n.
+# only ever append new steps, never edit a released one.
+# every statement must be idempotent (IF NOT EXISTS ...), as files created
+# before versioning existed report version 0 but already have the base tables
+MIGRATIONS: list[tuple[str, ...]] = [
+
+    # 1: base layout
+    (
+        '''
+        CREATE TABLE IF NOT EXISTS workouts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date TEXT NOT NULL,
+            name TEXT NOT NULL
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS exercises (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE COLLATE NOCASE
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS workout_exercises (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            workout_id INTEGER NOT NULL,
+            exercise_id INTEGER NOT NULL,
+            FOREIGN KEY (workout_id) REFERENCES workouts(id) ON DELETE CASCADE,
+            FOREIGN KEY (exercise_id) REFERENCES exercises(id) ON DELETE CASCADE
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS sets (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            workout_exercise_id INTEGER NOT NULL,
+            reps INTEGER NOT NULL,
+            weight REAL NOT NULL,
+            FOREIGN KEY (workout_exercise_id) REFERENCES workout_exercises(id) ON DELETE CASCADE
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS settings (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+        ''',
+    ),
+
+    # 2: date lookups for calendar and day view
+    (
+        'CREATE INDEX IF NOT EXISTS idx_workouts_date ON workouts (date)',
+    ),
+
+    # 3: covering indexes for the hot read paths
+    # (date, name) also covers the day view, so it replaces the plain date index
+    (
+        'DROP INDEX IF EXISTS idx_workouts_date',
+        'CREATE INDEX IF NOT EXISTS idx_workouts_date_name ON workouts (date, name)',
+        'CREATE INDEX IF NOT EXISTS idx_workout_exercises_workout ON workout_exercises (workout_id, exercise_id)',
+        'CREATE INDEX IF NOT EXISTS idx_workout_exercises_exercise ON workout_exercises (exercise_id, workout_id)',
+        'CREATE INDEX IF NOT EXISTS idx_sets_workout_exercise ON sets (workout_exercise_id, weight, reps)',
+    ),
+
+    # 4: drop rows orphaned while foreign keys were not enforced,
+    # deleting a workout used to leave its exercises and sets behind
+    (
+        'DELETE FROM workout_exercises WHERE workout_id NOT IN (SELECT id FROM workouts)',
+        'DELETE FROM workout_exercises WHERE exercise_id NOT IN (SELECT id FROM exercises)',
+        'DELETE FROM sets WHERE workout_exercise_id NOT IN (SELECT id FROM workout_exercises)',
+    ),
+
+    # 5: per exercise and day rollup for progress stats, kept current by triggers
+    (
+        '''
+        CREATE TABLE IF NOT EXISTS exercise_daily (
+            exercise_id INTEGER NOT NULL,
+            date TEXT NOT NULL,
+            max_weight REAL NOT NULL,
+            total_reps INTEGER NOT NULL,
+            volume REAL NOT NULL,
+            set_count INTEGER NOT NULL,
+            PRIMARY KEY (exercise_id, date),
+            FOREIGN KEY (exercise_id) REFERENCES exercises(id) ON DELETE CASCADE
+        ) WITHOUT ROWID
+        ''',
+        # a new set only ever raises the day's values
+        '''
+        CREATE TRIGGER IF NOT EXISTS exercise_daily_set_insert
+        AFTER INSERT ON sets
+        BEGIN
+            INSERT INTO exercise_daily (exercise_id, date, max_weight, total_reps, volume, set_count)
+            SELECT we.exercise_id, w.date, NEW.weight, NEW.reps, NEW.reps * NEW.weight, 1
+            FROM workout_exercises we
+            JOIN workouts w ON w.id = we.workout_id
+            WHERE we.id = NEW.workout_exercise_id
+            ON CONFLICT (exercise_id, date) DO UPDATE SET
+                max_weight = MAX(max_weight, excluded.max_weight),
+                total_reps = total_reps + excluded.total_reps,
+                volume = volume + excluded.volume,
+                set_count = set_count + 1;
+        END
+        ''',
+        # deletes can lower the max, so the affected days are recomputed without the doomed rows.
+        # these are BEFORE triggers because cascaded deletes remove the parent rows first,
+        # inside a cascade the child triggers find no parent and leave the work to the parent's trigger
+        '''
+        CREATE TRIGGER IF NOT EXISTS exercise_daily_set_delete
+        BEFORE DELETE ON sets
+        BEGIN
+            DELETE FROM exercise_daily
+            WHERE (exercise_id, date) IN (
+                SELECT we.exercise_id, w.date
+                FROM workout_exercises we
+                JOIN workouts w ON w.id = we.workout_id
+                WHERE we.id = OLD.workout_exercise_id
+            );
+            INSERT INTO exercise_daily (exercise_id, date, max_weight, total_reps, volume, set_count)
+            SELECT we.exercise_id, w.date, MAX(s.weight), SUM(s.reps), SUM(s.reps * s.weight), COUNT(*)
+            FROM workouts w
+            JOIN workout_exercises we ON we.workout_id = w.id
+            JOIN sets s ON s.workout_exercise_id = we.id
+            WHERE (we.exercise_id, w.date) IN (
+                SELECT we.exercise_id, w.date
+                FROM workout_exercises we
+                JOIN workouts w ON w.id = we.workout_id
+                WHERE we.id = OLD.workout_exercise_id
+            )
+            AND s.id != OLD.id
+            GROUP BY we.exercise_id, w.date;
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS exercise_daily_link_delete
+        BEFORE DELETE ON workout_exercises
+        BEGIN
+            DELETE FROM exercise_daily
+            WHERE exercise_id = OLD.exercise_id
+            AND date IN (SELECT date FROM workouts WHERE id = OLD.workout_id);
+            INSERT INTO exercise_daily (exercise_id, date, max_weight, total_reps, volume, set_count)
+            SELECT we.exercise_id, w.date, MAX(s.weight), SUM(s.reps), SUM(s.reps * s.weight), COUNT(*)
+            FROM workouts w
+            JOIN workout_exercises we ON we.workout_id = w.id
+            JOIN sets s ON s.workout_exercise_id = we.id
+            WHERE we.exercise_id = OLD.exercise_id
+            AND w.date IN (SELECT date FROM workouts WHERE id = OLD.workout_id)
+            AND we.id != OLD.id
+            GROUP BY we.exercise_id, w.date;
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS exercise_daily_workout_delete
+        BEFORE DELETE ON workouts
+        BEGIN
+            DELETE FROM exercise_daily
+            WHERE date = OLD.date
+            AND exercise_id IN (SELECT exercise_id FROM workout_exercises WHERE workout_id = OLD.id);
+            INSERT INTO exercise_daily (exercise_id, date, max_weight, total_reps, volume, set_count)
+            SELECT we.exercise_id, w.date, MAX(s.weight), SUM(s.reps), SUM(s.reps * s.weight), COUNT(*)
+            FROM workouts w
+            JOIN workout_exercises we ON we.workout_id = w.id
+            JOIN sets s ON s.workout_exercise_id = we.id
+            WHERE w.date = OLD.date
+            AND we.exercise_id IN (SELECT exercise_id FROM workout_exercises WHERE workout_id = OLD.id)
+            AND w.id != OLD.id
+            GROUP BY we.exercise_id, w.date;
+        END
+        ''',
+    ) + REBUILD_EXERCISE_DAILY,
+
+    # 6: per exercise data revision, bumped whenever its daily rollup changes.
+    # cached progress charts are keyed by it. no foreign key, a revision must
+    # survive the exercise so a reused id never matches an old chart
+    (
+        '''
+        CREATE TABLE IF NOT EXISTS exercise_revisions (
+            exercise_id INTEGER PRIMARY KEY,
+            revision INTEGER NOT NULL
+        )
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS exercise_revisions_daily_insert
+        AFTER INSERT ON exercise_daily
+        BEGIN
+            INSERT INTO exercise_revisions (exercise_id, revision) VALUES (NEW.exercise_id, 1)
+            ON CONFLICT (exercise_id) DO UPDATE SET revision = revision + 1;
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS exercise_revisions_daily_update
+        AFTER UPDATE OF max_weight ON exercise_daily
+        WHEN NEW.max_weight IS NOT OLD.max_weight
+        BEGIN
+            INSERT INTO exercise_revisions (exercise_id, revision) VALUES (NEW.exercise_id, 1)
+            ON CONFLICT (exercise_id) DO UPDATE SET revision = revision + 1;
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS exercise_revisions_daily_delete
+        AFTER DELETE ON exercise_daily
+        BEGIN
+            INSERT INTO exercise_revisions (exercise_id, revision) VALUES (OLD.exercise_id, 1)
+            ON CONFLICT (exercise_id) DO UPDATE SET revision = revision + 1;
+        END
+        ''',
+        '''
+        INSERT OR IGNORE INTO exercise_revisions (exercise_id, revision)
+        SELECT DISTINCT exercise_id, 1 FROM exercise_daily
+        ''',
+    ),
+
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+# read the schema version stored in the database file
+def get_schema_version(conn: sqlite3.Connection) -> int:
+
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+# bring the database up to SCHEMA_VERSION
+# each step runs in its own transaction together with its version bump
+def migrate(conn: sqlite3.Connection) -> None:
+
+    version = get_schema_version(conn)
+
+    # fast path, nothing to do on a current schema
+    if version == SCHEMA_VERSION:
+
+        return
+
+    if version > SCHEMA_VERSION:
+
+        raise RuntimeError(
+            f"Database schema version {version} is newer than supported version {SCHEMA_VERSION}"
+        )
+
+    for step in range(version + 1, SCHEMA_VERSION + 1):
+
+        # take the write lock before re-checking, another process may have migrated meanwhile
+        conn.execute('BEGIN IMMEDIATE')
+
+        try:
+
+            if get_schema_version(conn) >= step:
+
+                conn.rollback()
+                continue
+
+            for statement in MIGRATIONS[step - 1]:
+
+                conn.execute(statement)
+
+            conn.execute(f'PRAGMA user_version = {step}')
+            conn.commit()
+
+        except Exception:
+
+            conn.rollback()
+            raise
@@ -0,0 +1,117 @@
+"""
+Background loading of the days and months next to the one on screen
+"""
+
+import asyncio
+import calendar
+import logging
+from datetime import date, timedelta
+
+from wt25.async_db import AsyncWorkoutDB
+from wt25.database import WorkoutDB
+from wt25.scheduler import LatestWins
+
+logger = logging.getLogger(__name__)
+
+
+# first and last day of a month as the iso dates the calendar queries with
+def month_bounds(year: int, month: int) -> tuple[str, str]:
+
+    last_day = calendar.monthrange(year, month)[1]
+
+    return date(year, month, 1).isoformat(), date(year, month, last_day).isoformat()
+
+
+# the month `offset` months away from year/month
+def shift_month(year: int, month: int, offset: int) -> tuple[int, int]:
+
+    year, month = divmod(year * 12 + month - 1 + offset, 12)
+
+    return year, month + 1
+
+
+# nearest first, alternating sides: 1, -1, 2, -2, ...
+def _around(radius: int) -> list[int]:
+
+    return [step * side for step in range(1, radius + 1) for side in (1, -1)]
+
+
+# read a day's workouts with what their workout screens show first into the cache,
+# runs on the db thread
+def load_day(db: WorkoutDB, day: str) -> None:
+
+    for workout in db.get_workouts_by_date(day):
+
+        db.get_workout_overview(workout['id'])
+        db.get_workout_sets(workout['id'], 0)
+
+
+# read a month's workout counts into the cache, runs on the db thread
+def load_month(db: WorkoutDB, year: int, month: int) -> None:
+
+    db.get_workout_counts(*month_bounds(year, month))
+
+
+class Prefetcher:
+
+
+    # warms the WorkoutDB read cache around the day or month on screen,
+    # so stepping with "<" and ">" is served from memory.
+    # waits for `delay` seconds of quiet first and loads one day or month per db call,
+    # a foreground query never waits behind more than one of them.
+    # a newer prefetch cancels the older one, rapid stepping only prefetches where it stops
+    def __init__(self, adb: AsyncWorkoutDB, delay: float = 0.1, days: int = 2, months: int = 1):
+
+        self.adb = adb
+        self.days = days
+        self.months = months
+        self.loaded = 0
+
+        self._loads = LatestWins(delay=delay)
+        self._task: asyncio.Task | None = None
+
+
+    # the day's own workouts first, they are the next thing tapped
+    def around_day(self, day: date) -> None:
+
+        days = [day] + [day + timedelta(days=offset) for offset in _around(self.days)]
+        self._start(load_day, [(d.isoformat(),) for d in days])
+
+
+    def around_month(self, year: int, month: int) -> None:
+
+        self._start(load_month, [shift_month(year, month, offset) for offset in _around(self.months)])
+
+
+    def _start(self, load, items: list[tuple]) -> None:
+
+        self._task = asyncio.ensure_future(self._loads.run(self._load, load, items))
+
+
+    # prefetching is best effort, a failed load is logged and ends this prefetch
+    # instead of surfacing in whoever waits on it next
+    async def _load(self, load, items: list[tuple]) -> None:
+
+        try:
+
+            for item in items:
+
+                await self.adb.run(load, self.adb.db, *item)
+                self.loaded += 1
+
+        except Exception:
+
+            logger.exception('prefetch with %s failed', load.__name__)
+
+
+    # wait for the prefetch in flight, if any
+    async def wait(self) -> None:
+
+        if self._task is not None:
+
+            await self._task
+
+
+    def cancel(self) -> None:
+
+        self._loads.cancel()
@@ -0,0 +1,66 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+
+class LatestWins:
+
+
+    # debounced runner where only the newest call counts
+    # each run() cancels the call before it, whether it is still waiting out the
+    # debounce delay or already awaiting the db or a chart render
+    def __init__(self, delay: float = 0.15):
+
+        self.delay = delay
+        self.started = 0
+
+        self._task: asyncio.Task | None = None
+
+
+    # run fn(*args) after the debounce delay unless a newer call arrives first
+    # returns fn's result, or None if the call was superseded
+    async def run(self, fn: Callable[..., Awaitable[Any]], *args, delay: float | None = None) -> Any:
+
+        self.cancel()
+
+        task = asyncio.ensure_future(self._debounced(fn, args, self.delay if delay is None else delay))
+        self._task = task
+
+        try:
+
+            return await task
+
+        except asyncio.CancelledError:
+
+            # superseded by a newer call, anything else is a real cancellation
+            if task is not self._task and task.cancelled():
+
+                return None
+
+            raise
+
+        finally:
+
+            if self._task is task:
+
+                self._task = None
+
+
+    async def _debounced(self, fn: Callable[..., Awaitable[Any]], args: tuple, delay: float) -> Any:
+
+        if delay > 0:
+
+            await asyncio.sleep(delay)
+
+        self.started += 1
+
+        return await fn(*args)
+
+
+    # drop the pending or running call, e.g. when its screen is left
+    def cancel(self) -> None:
+
+        if self._task is not None and not self._task.done():
+
+            self._task.cancel()
+
+        self._task = None
@@ -0,0 +1,174 @@
+"""
+Lazy data sources for toga tables
+"""
+
+import asyncio
+import logging
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, Iterator
+
+from toga.sources import Source
+
+from wt25.async_db import AsyncWorkoutDB
+from wt25.database import SET_PAGE_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class SetRow:
+
+
+    # one row of the set table, blank until its page is loaded
+    def __init__(self, index: int):
+
+        self.index = index
+        self.exercise = ''
+        self.set = ''
+        self.reps = ''
+        self.weight = ''
+
+
+class WorkoutSetSource(Source):
+
+
+    # the sets of one workout for a toga.Table, read from WorkoutDB a page at a time.
+    # the row count comes from get_workout_overview, so the table sizes itself before
+    # any set is loaded. a row of a page not loaded yet comes back blank and starts
+    # loading the page, the table redraws the row once it arrives.
+    # backends that only draw the visible rows never load the rest
+    def __init__(self, adb: AsyncWorkoutDB, workout_id: int, exercises: list[dict[str, Any]]):
+
+        super().__init__()
+
+        self.adb = adb
+        self.workout_id = workout_id
+        self.pages_loaded = 0
+
+        # first row of each exercise, sets are numbered within their exercise
+        counts = [exercise['set_count'] for exercise in exercises]
+        self._starts = list(accumulate(counts, initial=0))[:-1]
+        self._total = sum(counts)
+
+        self._rows: dict[int, SetRow] = {}
+        self._pages: dict[int, list[dict[str, Any]]] = {}
+        self._loading: dict[int, asyncio.Task] = {}
+
+
+    def __len__(self) -> int:
+
+        return self._total
+
+
+    def __getitem__(self, index: int) -> SetRow:
+
+        if index < 0:
+
+            index += self._total
+
+        if not 0 <= index < self._total:
+
+            raise IndexError(index)
+
+        page = index // SET_PAGE_SIZE
+        row = self._rows.get(index)
+
+        if row is None:
+
+            row = self._rows[index] = SetRow(index)
+
+            if page in self._pages:
+
+                self._fill(row, self._pages[page])
+
+        if page not in self._pages:
+
+            # also retries a page whose load failed
+            self._request(page)
+
+        return row
+
+
+    def __iter__(self) -> Iterator[SetRow]:
+
+        for index in range(self._total):
+
+            yield self[index]
+
+
+    def index(self, row: SetRow) -> int:
+
+        return row.index
+
+
+    def _fill(self, row: SetRow, page: list[dict[str, Any]]) -> None:
+
+        offset = row.index % SET_PAGE_SIZE
+
+        if offset >= len(page):
+
+            # the workout lost sets since the overview was read, a refresh follows
+            return
+
+        set_data = page[offset]
+        start = self._starts[bisect_right(self._starts, row.index) - 1]
+
+        row.exercise = set_data['exercise_name']
+        row.set = row.index - start + 1
+        row.reps = set_data['reps']
+        row.weight = set_data['weight']
+
+
+    def _request(self, page: int) -> asyncio.Task:
+
+        if page not in self._loading:
+
+            self._loading[page] = asyncio.ensure_future(self._load(page))
+
+        return self._loading[page]
+
+
+    async def _load(self, page: int) -> None:
+
+        try:
+
+            sets = await self.adb.get_workout_sets(self.workout_id, page)
+
+        except Exception:
+
+            # the page's rows stay blank until the table asks for one of them again
+            del self._loading[page]
+            logger.exception('loading page %d of workout %d failed', page, self.workout_id)
+            return
+
+        self._pages[page] = sets
+        self.pages_loaded += 1
+
+        first = page * SET_PAGE_SIZE
+
+        for index in range(first, min(first + SET_PAGE_SIZE, self._total)):
+
+            row = self._rows.get(index)
+
+            if row is not None:
+
+                self._fill(row, sets)
+                self.notify('change', item=row)
+
+
+    # load a page ahead of the table asking for it, e.g. the first screenful
+    async def load_page(self, page: int) -> None:
+
+        if page not in self._pages and page * SET_PAGE_SIZE < self._total:
+
+            await self._request(page)
+
+
+    # stop loading and updating, once the table was given a newer source
+    def detach(self) -> None:
+
+        for task in self._loading.values():
+
+            task.cancel()
+
+        self._listeners.clear()
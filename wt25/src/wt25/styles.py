@@ -0,0 +1,180 @@
+"""
+Named widget styles, precomputed once per colour theme
+"""
+
+import weakref
+from typing import Any
+
+import toga
+from toga.style import Pack
+from toga.style.pack import COLUMN, ROW
+
+# style properties of every named style
+# colour properties hold a theme key ('primary', 'text', ...) resolved per theme
+STYLES = {
+
+    # screens and containers
+    'screen': {'direction': COLUMN, 'padding': 10, 'background_color': 'prime_background'},
+    'calendar_screen': {'direction': COLUMN, 'padding': 10, 'alignment': 'center', 'background_color': 'prime_background'},
+    'settings_screen': {'direction': COLUMN, 'padding': 10, 'align_items': 'center', 'background_color': 'prime_background'},
+    'header': {'direction': ROW, 'padding': 5, 'background_color': 'second_background'},
+    'wide_header': {'direction': ROW, 'padding': 10, 'background_color': 'second_background'},
+    'panel': {'direction': COLUMN, 'padding': 10, 'background_color': 'second_background'},
+    'centered_panel': {'direction': COLUMN, 'padding': 10, 'alignment': 'center', 'background_color': 'second_background'},
+    'list': {'direction': COLUMN, 'padding': 5, 'flex': 1, 'background_color': 'second_background'},
+    'column': {'direction': COLUMN},
+    'row': {'direction': ROW, 'padding': 5},
+    'button_row': {'direction': ROW, 'padding': 10},
+    'spacer': {'flex': 1},
+
+    # calendar
+    'calendar_frame': {'direction': COLUMN, 'width': 420, 'height': 400, 'padding': 5, 'background_color': 'second_background'},
+    'calendar_header': {'direction': ROW, 'padding': 2, 'background_color': 'second_background'},
+    'week_row': {'direction': ROW, 'padding': 2, 'alignment': 'center'},
+    'week_header': {'width': 40, 'padding': 2, 'font_weight': 'bold', 'color': 'text'},
+    'weekday': {'width': 50, 'padding': 2, 'text_align': 'center', 'font_weight': 'bold', 'color': 'text'},
+    'week_number': {'width': 40, 'padding': 2, 'text_align': 'center', 'color': 'text'},
+    'day': {'width': 50, 'height': 50, 'padding': 2, 'background_color': 'second_background', 'color': 'text'},
+    'workout_day': {'width': 50, 'height': 50, 'padding': 2, 'background_color': 'primary', 'color': 'text'},
+
+    # buttons
+    'nav_button': {'width': 50, 'padding': 5, 'background_color': 'primary', 'color': 'text'},
+    'back_button': {'width': 80, 'padding': 5, 'background_color': 'primary', 'color': 'text'},
+    'icon_button': {'width': 40, 'height': 40, 'background_color': 'accent', 'color': 'text'},
+    'delete_icon_button': {'width': 40, 'background_color': 'danger', 'color': 'text'},
+    'primary_button': {'padding': 10, 'background_color': 'primary', 'color': 'text'},
+    'danger_button': {'padding': 10, 'background_color': 'danger', 'color': 'text'},
+    'plain_button': {'background_color': 'primary', 'color': 'text'},
+    'form_button': {'padding': 5, 'width': 100, 'background_color': 'primary', 'color': 'text'},
+    'form_accent_button': {'padding': 5, 'width': 100, 'background_color': 'accent', 'color': 'text'},
+    'form_cancel_button': {'padding': 5, 'width': 100, 'background_color': 'danger', 'color': 'text'},
+    'wide_form_button': {'padding': 10, 'width': 100, 'background_color': 'primary', 'color': 'text'},
+    'workout_button': {'width': 300, 'padding': 5, 'background_color': 'accent', 'color': 'text'},
+
+    # inputs
+    'input': {'padding': 5, 'width': 300, 'background_color': 'second_background', 'color': 'text'},
+    'short_input': {'padding': 5, 'width': 200, 'background_color': 'second_background', 'color': 'text'},
+    'flex_input': {'flex': 1, 'padding': 5, 'background_color': 'second_background', 'color': 'text'},
+    'switch': {'padding': 5, 'color': 'text'},
+
+    # labels
+    'title': {'flex': 1, 'text_align': 'center', 'font_size': 16, 'padding': 5, 'color': 'text'},
+    'bold_title': {'flex': 1, 'text_align': 'center', 'font_size': 16, 'font_weight': 'bold', 'padding': 5, 'color': 'text'},
+    'form_title': {'padding': 10, 'font_size': 16, 'font_weight': 'bold', 'color': 'text'},
+    'centered_form_title': {'padding': 10, 'font_size': 16, 'font_weight': 'bold', 'text_align': 'center', 'color': 'text'},
+    'settings_title': {'padding': 10, 'font_size': 18, 'font_weight': 'bold', 'text_align': 'center', 'color': 'text'},
+    'label': {'padding': 5, 'color': 'text'},
+    'centered_label': {'padding': 5, 'text_align': 'center', 'color': 'text'},
+    'notice': {'padding': 10, 'color': 'text'},
+    'empty_notice': {'padding': 20, 'text_align': 'center', 'color': 'text'},
+    'exercise_name': {'padding': 5, 'font_size': 14, 'font_weight': 'bold', 'color': 'text'},
+    'empty_sets': {'padding_left': 20, 'text_align': 'center', 'color': 'text'},
+    'feedback_label': {'padding': 5, 'background_color': 'second_background', 'color': 'text'},
+
+    # tables
+    'table': {'flex': 1, 'padding': 5, 'background_color': 'second_background', 'color': 'text'},
+
+    # progress stats
+    'stat_tile': {'direction': COLUMN, 'padding': 10, 'flex': 1, 'alignment': 'center', 'background_color': 'prime_background'},
+    'stat_label': {'font_size': 10, 'padding': 5, 'color': 'text'},
+    'stat_value': {'font_size': 16, 'padding': 5, 'font_weight': 'bold', 'color': 'accent'},
+}
+
+
+# properties whose values are theme keys
+def _is_color(prop: str) -> bool:
+
+    return prop.endswith('color')
+
+
+class StyleRegistry:
+
+
+    # one Pack per named style and theme, built the first time the theme is used.
+    # toga copies the style into each widget, so nothing is parsed per widget.
+    # coloured widgets made by create() or restyled by apply() are remembered weakly,
+    # switch() recolours them in place without rebuilding any screen
+    def __init__(self, themes: dict[str, dict[str, str]], theme_name: str, styles: dict[str, dict[str, Any]] = STYLES):
+
+        self.themes = themes
+        self.styles = styles
+        self.theme_name = theme_name
+
+        self._packs: dict[str, dict[str, Pack]] = {}
+        self._widgets: weakref.WeakKeyDictionary[toga.Widget, str] = weakref.WeakKeyDictionary()
+
+        # only colours differ between themes, so only these are touched by switch()
+        self._color_props = {
+            name: tuple(prop for prop in spec if _is_color(prop))
+            for name, spec in styles.items()
+        }
+
+
+    def _theme_packs(self, theme_name: str) -> dict[str, Pack]:
+
+        if theme_name not in self._packs:
+
+            colors = self.themes[theme_name]
+            self._packs[theme_name] = {
+                name: Pack(**{prop: colors[value] if _is_color(prop) else value for prop, value in spec.items()})
+                for name, spec in self.styles.items()
+            }
+
+        return self._packs[theme_name]
+
+
+    # shared style of the current theme, must not be modified
+    def __getitem__(self, name: str) -> Pack:
+
+        return self._theme_packs(self.theme_name)[name]
+
+
+    # widget_class(*args, **kwargs) with the named style, kept in step with the theme
+    def create(self, widget_class: type[toga.Widget], name: str, *args, **kwargs) -> toga.Widget:
+
+        widget = widget_class(*args, style=self[name], **kwargs)
+
+        if self._color_props[name]:
+
+            self._widgets[widget] = name
+
+        return widget
+
+
+    # give a live widget another named style, e.g. a calendar day that got a workout
+    # only changed properties are set, each assignment can relayout the window
+    def apply(self, widget: toga.Widget, name: str) -> None:
+
+        style = self[name]
+
+        for prop in style.keys():
+
+            value = style[prop]
+
+            if widget.style[prop] != value:
+
+                widget.style[prop] = value
+
+        if self._color_props[name]:
+
+            self._widgets[widget] = name
+
+
+    # switch to another theme and recolour every live widget, returns how many were touched
+    def switch(self, theme_name: str) -> int:
+
+        self.theme_name = theme_name
+        packs = self._theme_packs(theme_name)
+        widgets = list(self._widgets.items())
+
+        for widget, name in widgets:
+
+            style = packs[name]
+
+            for prop in self._color_props[name]:
+
+                if widget.style[prop] != style[prop]:
+
+                    widget.style[prop] = style[prop]
+
+        return len(widgets)
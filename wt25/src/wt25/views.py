@@ -0,0 +1,99 @@
+from typing import Any, Awaitable, Callable, Hashable, Iterable
+
+from wt25.cache import LRUCache
+from wt25.events import ChangeEvent
+
+
+class Screen:
+
+
+    # a built screen kept alive between navigations
+    # topics are the ChangeEvent topics its data depends on, narrowed down by
+    # affected(event) for screens showing a single day or workout.
+    # refresh updates the data-driven parts in place (None rebuilds the screen)
+    def __init__(
+        self,
+        content: Any,
+        refresh: Callable[[], Awaitable[None]] | None = None,
+        topics: Iterable[str] = (),
+        affected: Callable[[ChangeEvent], bool] | None = None
+    ):
+
+        self.content = content
+        self.refresh = refresh
+        self.topics = frozenset(topics)
+        self.affected = affected
+        self.stale = False
+
+
+    # whether a committed change makes the screen out of date
+    def depends_on(self, event: ChangeEvent) -> bool:
+
+        return bool(self.topics & event.topics) and (self.affected is None or self.affected(event))
+
+
+class ViewController:
+
+
+    # shows screens in a window, reusing built ones until their data changes
+    # WorkoutDB change events go to invalidate(), which only marks screens stale,
+    # the work is done once the screen is shown again
+    def __init__(self, window: Any, max_screens: int = 12):
+
+        self.window = window
+        self.built = 0
+        self.refreshed = 0
+        self.reused = 0
+
+        self._screens = LRUCache(max_entries=max_screens)
+
+
+    # show the screen under key, building it with build() if it is not kept yet
+    async def show(self, key: Hashable, build: Callable[[], Awaitable[Screen]]) -> Screen:
+
+        found, screen = self._screens.lookup(key)
+
+        if not found or (screen.stale and screen.refresh is None):
+
+            screen = await build()
+            self._screens.put(key, screen)
+            self.built += 1
+
+        elif screen.stale:
+
+            # cleared first, a change during the refresh marks it again
+            screen.stale = False
+            await screen.refresh()
+            self.refreshed += 1
+
+        else:
+
+            self.reused += 1
+
+        self.window.content = screen.content
+
+        return screen
+
+
+    # mark screens depending on any of the events
+    def invalidate(self, events: Iterable[ChangeEvent]) -> None:
+
+        events = tuple(events)
+
+        for screen in self._screens.values():
+
+            if not screen.stale and any(screen.depends_on(event) for event in events):
+
+                screen.stale = True
+
+
+    # forget one screen, e.g. for a deleted workout
+    def discard(self, key: Hashable) -> None:
+
+        self._screens.discard(key)
+
+
+    # forget every screen, e.g. after a theme change
+    def clear(self) -> None:
+
+        self._screens.clear()
@@ -1,3 +1,157 @@
+import asyncio
+import os
+import sqlite3
+
+import pytest
+
+pytest.importorskip('toga_dummy')
+os.environ.setdefault('TOGA_BACKEND', 'toga_dummy')
+
+from wt25.app import THEMES, WorkoutTracker, log_exercise_sets
+from wt25.async_db import AsyncWorkoutDB
+from wt25.database import WorkoutDB
+from wt25.events import ExerciseAdded, ExerciseLinked, SetsAdded
+from wt25.styles import StyleRegistry
+
+
+class FakeWindow:
+    content = None
+
+
+class SetForm:
+    """The app's set entry flow, without a running toga app."""
+
+    add_sets = WorkoutTracker.add_sets
+    save_set = WorkoutTracker.save_set
+    log_sets = WorkoutTracker.log_sets
+    flush_pending_sets = WorkoutTracker.flush_pending_sets
+    finish_sets = WorkoutTracker.finish_sets
+    toggle_batch_sets = WorkoutTracker.toggle_batch_sets
+
+    def __init__(self, adb):
+        self.adb = adb
+        self.styles = StyleRegistry(THEMES, 'Dark')
+        self.main_window = FakeWindow()
+
+    async def show_workout_detail(self, workout):
+        self.shown = workout
+
+    async def enter(self, reps, weight):
+        self.reps_input.value = reps
+        self.weight_input.value = weight
+        await self.save_set(self.workout)
+
+
+@pytest.fixture
+def adb(tmp_path):
+
+    database = AsyncWorkoutDB(WorkoutDB(tmp_path / 'workouts.db'))
+    yield database
+    database.close()
+
+
+def _statements(adb, call):
+    """Run call() on the event loop and return the SQL the db thread executed meanwhile."""
+    statements = []
+
+    async def scenario():
+        conn = await adb.run(adb.db._get_connection)
+        await adb.run(conn.set_trace_callback, statements.append)
+        try:
+            return await call()
+        finally:
+            await adb.run(conn.set_trace_callback, None)
+
+    return asyncio.run(scenario()), statements
+
+
+def _sets(db, workout_id):
+    return [(s['reps'], s['weight']) for ex in db.get_workout_exercises(workout_id) for s in ex['sets']]
+
+
 def test_first():
     """An initial test for the app."""
     assert 1 + 1 == 2
+
+
+def test_log_exercise_sets_is_one_unit_of_work(adb):
+    """Creating, linking and logging several sets commits once."""
+    workout_id = adb.db.add_workout('Push', '2025-11-19')
+
+    link, statements = _statements(adb, lambda: adb.transaction(
+        log_exercise_sets, workout_id, 'Bench Press', None, [(5, 80.0), (5, 82.5), (3, 85.0)]
+    ))
+
+    assert statements.count('COMMIT') == 1
+    assert _sets(adb.db, workout_id) == [(5, 80.0), (5, 82.5), (3, 85.0)]
+    assert adb.db.get_workout_exercises(workout_id)[0]['workout_exercise_id'] == link
+
+
+def test_log_exercise_sets_publishes_after_commit(adb):
+    """The unit of work's events arrive in one call, once the rows are committed."""
+    workout_id = adb.db.add_workout('Push', '2025-11-19')
+    calls = []
+
+    def subscriber(events):
+        calls.append(([type(event) for event in events], adb.db._get_connection().in_transaction))
+
+    adb.db.subscribe(subscriber)
+    asyncio.run(adb.transaction(log_exercise_sets, workout_id, 'Bench Press', None, [(5, 80.0), (5, 82.5)]))
+
+    assert calls == [([ExerciseAdded, ExerciseLinked, SetsAdded], False)]
+
+
+def test_log_exercise_sets_invalid_set_leaves_nothing(adb):
+    """One bad set undoes the new exercise, its link and the other sets."""
+    workout_id = adb.db.add_workout('Push', '2025-11-19')
+    events = []
+    adb.db.subscribe(events.extend)
+
+    with pytest.raises(sqlite3.IntegrityError):
+        asyncio.run(adb.transaction(log_exercise_sets, workout_id, 'Bench Press', None, [(5, 80.0), (None, 80.0)]))
+
+    assert adb.db.get_workout_exercises(workout_id) == []
+    assert adb.db.get_all_exercises() == []
+    assert events == []
+
+
+def test_batch_entry_saves_on_done(adb):
+    """With batching on, sets are only queued and written in one commit on Done."""
+    adb.db.set_setting('batch_sets', 'on')
+    workout = {'id': adb.db.add_workout('Push', '2025-11-19')}
+    form = SetForm(adb)
+    form.workout = workout
+
+    async def enter_sets():
+        await form.add_sets(workout, 'Bench Press')
+        await form.enter(5, 80)
+        await form.enter(5, 82.5)
+
+    asyncio.run(enter_sets())
+
+    assert form.batch_switch.value
+    assert form.pending_sets == [(5, 80.0), (5, 82.5)]
+    assert adb.db.get_workout_exercises(workout['id']) == []
+
+    _, statements = _statements(adb, lambda: form.finish_sets(workout))
+
+    assert statements.count('COMMIT') == 1
+    assert form.pending_sets == []
+    assert form.shown is workout
+    assert _sets(adb.db, workout['id']) == [(5, 80.0), (5, 82.5)]
+
+
+def test_single_entry_saves_each_set(adb):
+    """With batching off, every set is written when it is entered."""
+    workout = {'id': adb.db.add_workout('Push', '2025-11-19')}
+    form = SetForm(adb)
+    form.workout = workout
+
+    async def enter_set():
+        await form.add_sets(workout, 'Bench Press')
+        await form.enter(5, 80)
+
+    asyncio.run(enter_set())
+
+    assert not form.batch_switch.value
+    assert _sets(adb.db, workout['id']) == [(5, 80.0)]
@@ -0,0 +1,113 @@
+import asyncio
+import threading
+
+import pytest
+
+from wt25.async_db import AsyncWorkoutDB
+from wt25.database import WorkoutDB
+
+
+class BlockingDB:
+    """Stands in for a WorkoutDB whose queries block until the event loop releases them."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.released = []
+        self.threads = set()
+
+    def get_workouts_by_date(self, date):
+        self.threads.add(threading.get_ident())
+        # a query run on the loop thread blocks the loop, nothing would set the event
+        self.released.append(self.release.wait(timeout=5))
+        self.release.clear()
+        return [{'id': 1, 'name': 'Push', 'date': date}]
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def adb(tmp_path):
+
+    database = AsyncWorkoutDB(WorkoutDB(tmp_path / 'workouts.db'))
+    yield database
+    database.close()
+
+
+def test_event_loop_keeps_running_during_queries():
+    """The event loop keeps running while a blocking query is awaited."""
+    blocking = BlockingDB()
+    adb = AsyncWorkoutDB(blocking)
+
+    async def scenario():
+        for _ in range(4):
+            query = asyncio.ensure_future(adb.get_workouts_by_date('2025-11-19'))
+            # let the query start, then release it from the loop
+            await asyncio.sleep(0)
+            blocking.release.set()
+            workouts = await query
+
+        return workouts
+
+    workouts = asyncio.run(scenario())
+    adb.close()
+
+    assert workouts[0]['date'] == '2025-11-19'
+    # every query was released by the loop while it waited
+    assert blocking.released == [True] * 4
+    # every call ran on the single worker thread, never on the loop thread
+    assert blocking.threads and threading.get_ident() not in blocking.threads
+    assert len(blocking.threads) == 1
+
+
+def test_calls_return_db_results(adb):
+    """Awaited calls return what the sync methods return."""
+    async def scenario():
+        workout_id = await adb.add_workout('Push', '2025-11-19')
+        workouts = await adb.get_workouts_by_date('2025-11-19')
+        return workout_id, workouts
+
+    workout_id, workouts = asyncio.run(scenario())
+
+    assert [w['id'] for w in workouts] == [workout_id]
+
+
+def test_private_methods_are_not_exposed(adb):
+    """Only the public WorkoutDB API is wrapped."""
+    with pytest.raises(AttributeError):
+        adb._get_connection
+
+
+def test_transaction_runs_as_one_unit(adb):
+    """A failing unit of work rolls back everything it wrote."""
+    def log(db, date):
+        db.add_workout('Push', date)
+        raise ValueError("boom")
+
+    async def scenario():
+        with pytest.raises(ValueError):
+            await adb.transaction(log, '2025-11-19')
+
+        return await adb.get_workouts_by_date('2025-11-19')
+
+    assert asyncio.run(scenario()) == []
+
+
+def test_transaction_returns_result(adb):
+    """The unit of work's return value comes back to the caller."""
+    def log(db, name):
+        exercise_id = db.add_new_exercise(name)
+        return exercise_id, db.add_new_exercise(name)
+
+    first, again = asyncio.run(adb.transaction(log, 'Bench Press'))
+
+    assert first == again
+
+
+def test_run_uses_db_thread(adb):
+    """run() executes arbitrary callables on the db worker thread."""
+    loop_thread = threading.get_ident()
+
+    worker_thread = asyncio.run(adb.run(threading.get_ident))
+
+    assert worker_thread != loop_thread
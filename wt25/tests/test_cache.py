@@ -0,0 +1,146 @@
+import pytest
+
+from wt25.cache import LRUCache
+from wt25.database import WorkoutDB
+
+
+@pytest.fixture
+def db(tmp_path):
+
+    database = WorkoutDB(tmp_path / 'workouts.db')
+    yield database
+    database.close()
+
+
+def _queries(db, call):
+    """Run call() and return the SELECT statements it sent to SQLite."""
+    statements = []
+    conn = db._get_connection()
+    conn.set_trace_callback(statements.append)
+
+    try:
+        call()
+    finally:
+        conn.set_trace_callback(None)
+
+    return [sql for sql in statements if sql.lstrip().upper().startswith(('SELECT', 'WITH'))]
+
+
+def _views(db):
+    """The reads screens repeat while the user navigates."""
+    db.get_all_exercises()
+    db.all_done_exercises()
+    db.get_setting('theme', 'Dark')
+    db.get_workouts_by_date('2025-11-19')
+    db.get_workout_counts('2025-11-01', '2025-11-30')
+    db.get_workout_exercises(1)
+    db.get_workout_overview(1)
+    db.get_workout_sets(1, 0)
+
+
+def test_lru_eviction():
+    """The least recently used entry is evicted first."""
+    cache = LRUCache(max_entries=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.lookup('a')
+    cache.put('c', 3)
+
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+    assert cache.lookup('b') == (False, None)
+    assert cache.info() == {'hits': 1, 'misses': 1, 'entries': 2, 'max_entries': 2}
+
+
+def test_cached_none_is_a_hit():
+    """A stored None is distinguishable from a miss."""
+    cache = LRUCache()
+    cache.put('missing setting', None)
+
+    assert cache.lookup('missing setting') == (True, None)
+
+
+def test_repeat_views_make_no_queries(db):
+    """Moving back and forth between screens is served from memory."""
+    db.add_workout('Push', '2025-11-19')
+    _views(db)
+
+    assert _queries(db, lambda: _views(db)) == []
+    assert db.cache_info()['hits'] == 8
+
+
+def test_results_are_copies(db):
+    """Mutating a returned result does not change the cache."""
+    db.add_workout('Push', '2025-11-19')
+    db.get_workouts_by_date('2025-11-19')[0]['name'] = 'Changed'
+
+    assert db.get_workouts_by_date('2025-11-19')[0]['name'] == 'Push'
+
+
+@pytest.mark.parametrize('write, stale', [
+    (lambda db: db.add_workout('Pull', '2025-11-19'), ['get_workouts_by_date', 'get_workout_counts']),
+    (lambda db: db.add_workout('Pull', '2025-12-01'), []),
+    (lambda db: db.delete_workout(1), ['get_workouts_by_date', 'get_workout_counts', 'get_workout_exercises', 'get_workout_overview', 'get_workout_sets', 'all_done_exercises']),
+    (lambda db: db.add_new_exercise('Squat'), ['get_all_exercises']),
+    (lambda db: db.add_new_exercise('bench press'), []),
+    (lambda db: db.link_exercise_to_workout(1, 1), ['get_workout_exercises', 'get_workout_overview', 'get_workout_sets', 'all_done_exercises']),
+    (lambda db: db.add_set(1, 5, 80.0), ['get_workout_exercises', 'get_workout_overview', 'get_workout_sets']),
+    (lambda db: db.add_sets_bulk(1, [(5, 80.0)]), ['get_workout_exercises', 'get_workout_overview', 'get_workout_sets']),
+    (lambda db: db.set_setting('theme', 'Light'), ['get_setting']),
+    (lambda db: db.set_setting('batch_sets', 'on'), []),
+    (lambda db: db.del_linked_exercise(1), ['get_workout_exercises', 'get_workout_overview', 'get_workout_sets', 'all_done_exercises']),
+])
+def test_writes_invalidate_exactly(db, write, stale):
+    """Each write drops the cached reads it changed and nothing else."""
+    workout_id = db.add_workout('Push', '2025-11-19')
+    db.link_exercise_to_workout(workout_id, db.add_new_exercise('Bench Press'))
+    _views(db)
+
+    write(db)
+
+    reloaded = {sql.split('FROM')[1].split()[0] for sql in _queries(db, lambda: _views(db))}
+    tables = {
+        'get_all_exercises': 'exercises',
+        'get_setting': 'settings',
+        'get_workout_counts': 'workouts',
+        'get_workouts_by_date': 'workouts',
+        'get_workout_exercises': 'workout_exercises',
+        'get_workout_overview': 'workout_exercises',
+        'get_workout_sets': 'sets',
+        'all_done_exercises': 'exercises',
+    }
+
+    assert reloaded == {tables[name] for name in stale}
+
+
+def test_fresh_values_after_write(db):
+    """Reads after a write see the new rows."""
+    assert db.get_setting('theme', 'Dark') == 'Dark'
+    db.set_setting('theme', 'Light')
+    assert db.get_setting('theme', 'Dark') == 'Light'
+
+    assert db.get_workout_counts('2025-11-01', '2025-11-30') == {}
+    db.add_workout('Push', '2025-11-19')
+    assert db.get_workout_counts('2025-11-01', '2025-11-30') == {'2025-11-19': 1}
+
+
+def test_unit_of_work_bypasses_cache(db):
+    """Uncommitted rows never reach the cache, rolled back writes leave no trace."""
+    with pytest.raises(ValueError):
+
+        with db.transaction():
+
+            db.add_workout('Push', '2025-11-19')
+            assert len(db.get_workouts_by_date('2025-11-19')) == 1
+            raise ValueError
+
+    assert db.get_workouts_by_date('2025-11-19') == []
+
+
+def test_cache_disabled(tmp_path):
+    """cache_size=0 sends every read to SQLite."""
+    with WorkoutDB(tmp_path / 'workouts.db', cache_size=0) as db:
+
+        db.get_all_exercises()
+
+        assert len(_queries(db, db.get_all_exercises)) == 1
+        assert db.cache_info()['entries'] == 0
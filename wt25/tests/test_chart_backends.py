@@ -0,0 +1,88 @@
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip('toga_dummy')
+os.environ.setdefault('TOGA_BACKEND', 'toga_dummy')
+
+from toga.colors import color
+
+from wt25.app import THEMES
+from wt25.async_db import AsyncWorkoutDB
+from wt25.chart_backends import DISPLAY_SIZE, CanvasChartBackend
+from wt25.database import WorkoutDB
+
+COLORS = THEMES['Dark']
+
+
+@pytest.fixture
+def adb(tmp_path):
+
+    database = AsyncWorkoutDB(WorkoutDB(tmp_path / 'workouts.db'))
+    yield database
+    database.close()
+
+
+def _exercise(db, weights):
+    """An exercise trained once a day with the given top weights."""
+    exercise_id = db.add_new_exercise('Bench Press')
+
+    for day, weight in enumerate(weights, start=1):
+        workout_id = db.add_workout('Push', f'2025-11-{day:02d}')
+        db.add_set(db.link_exercise_to_workout(workout_id, exercise_id), 5, weight)
+
+    return exercise_id
+
+
+def _draw(adb, exercise_id):
+    """Create the canvas chart and return it with its top level drawing contexts."""
+    placeholders = []
+
+    async def create():
+        return await CanvasChartBackend().create_widget(adb, exercise_id, 'Dark', COLORS, lambda: placeholders.append(1))
+
+    canvas = asyncio.run(create())
+
+    assert placeholders == []
+
+    return canvas, canvas.context.drawing_objects
+
+
+def _colored(contexts, key):
+    return [context for context in contexts if context.color == color(COLORS[key])]
+
+
+def _steps(context):
+    return [type(step).__name__ for step in context.drawing_objects]
+
+
+def test_canvas_draws_series_in_theme_colors(adb):
+    """Background, plot area, text and series use the theme's colours."""
+    canvas, contexts = _draw(adb, _exercise(adb.db, [80.0, 82.5, 90.0]))
+    line, markers = _colored(contexts, 'primary')
+
+    assert (canvas.style.width, canvas.style.height) == DISPLAY_SIZE
+    assert len(_colored(contexts, 'prime_background')) == 1
+    assert len(_colored(contexts, 'second_background')) == 1
+    assert _colored(contexts, 'text')
+    assert _steps(line) == ['MoveTo', 'LineTo', 'LineTo']
+    assert _steps(markers).count('Arc') == 3
+
+
+def test_canvas_single_point(adb):
+    """A single training day is drawn as one marker."""
+    _, contexts = _draw(adb, _exercise(adb.db, [80.0]))
+    line, markers = _colored(contexts, 'primary')
+
+    assert _steps(line) == ['MoveTo']
+    assert _steps(markers).count('Arc') == 1
+
+
+def test_canvas_empty_series(adb):
+    """An exercise without sets gets the empty frame and no series."""
+    exercise_id = adb.db.add_new_exercise('Bench Press')
+    _, contexts = _draw(adb, exercise_id)
+
+    assert len(_colored(contexts, 'prime_background')) == 1
+    assert _colored(contexts, 'primary') == []
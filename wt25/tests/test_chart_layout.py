@@ -0,0 +1,58 @@
+import pytest
+
+from wt25.chart_layout import (
+    MARGIN_LEFT, MARGIN_TOP, layout_progress_chart, nice_step, value_ticks
+)
+
+DATA_POINTS = [
+    {'date': '2025-11-03', 'max_weight': 80.0},
+    {'date': '2025-11-10', 'max_weight': 82.5},
+    {'date': '2025-12-01', 'max_weight': 90.0}
+]
+
+
+@pytest.mark.parametrize('raw, step', [(0.3, 0.5), (1.0, 1.0), (1.7, 2.0), (2.2, 2.5), (4.0, 5.0), (7.0, 10.0), (23.0, 25.0)])
+def test_nice_step(raw, step):
+    """Steps round up to 1, 2, 2.5 or 5 times a power of ten."""
+    assert nice_step(raw) == pytest.approx(step)
+
+
+def test_value_ticks_cover_range():
+    """Ticks are evenly spaced and stay inside the range."""
+    ticks = value_ticks(80.0, 90.0)
+
+    assert ticks == [80.0, 82.5, 85.0, 87.5, 90.0]
+
+
+def test_points_span_plot():
+    """The first and last day sit on the plot edges, heavier is higher."""
+    layout = layout_progress_chart(DATA_POINTS, 600, 400)
+    plot_x, plot_y, plot_width, plot_height = layout['plot']
+    points = layout['points']
+
+    assert (plot_x, plot_y) == (MARGIN_LEFT, MARGIN_TOP)
+    assert points[0][0] == pytest.approx(plot_x)
+    assert points[-1][0] == pytest.approx(plot_x + plot_width)
+    assert points[0][1] > points[1][1] > points[2][1]
+    assert all(plot_y <= y <= plot_y + plot_height for _, y in points)
+
+
+def test_ticks_fit_and_are_labelled():
+    """Date ticks are spaced so the labels do not overlap."""
+    layout = layout_progress_chart(DATA_POINTS, 600, 400)
+    x_positions = [x for x, _ in layout['x_ticks']]
+
+    assert layout['x_ticks'][0][1] == '2025-11-03'
+    assert min(b - a for a, b in zip(x_positions, x_positions[1:])) >= 80
+    assert [label for _, label in layout['y_ticks']] == ['80', '82.5', '85', '87.5', '90']
+
+
+def test_single_point_and_empty_series():
+    """One training day is drawn mid-plot, no data draws nothing."""
+    layout = layout_progress_chart(DATA_POINTS[:1], 600, 400)
+    plot_x, plot_y, plot_width, plot_height = layout['plot']
+    (x, y), = layout['points']
+
+    assert x == pytest.approx(plot_x + plot_width / 2)
+    assert plot_y <= y <= plot_y + plot_height
+    assert layout_progress_chart([], 600, 400)['points'] == []
@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from wt25.charts import ChartCache, ChartRenderer, render_progress_chart
+
+pytest.importorskip('matplotlib')
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+COLORS = {
+    'prime_background': '#1E1E1E',
+    'second_background': '#2D2D2D',
+    'text': '#E0E0E0',
+    'primary': '#BB86FC'
+}
+
+DATA_POINTS = [
+    {'date': '2025-11-03', 'max_weight': 80.0},
+    {'date': '2025-11-10', 'max_weight': 82.5},
+    {'date': '2025-11-17', 'max_weight': 85.0}
+]
+
+
+def test_render_returns_png():
+    """The renderer returns encoded PNG bytes."""
+    assert render_progress_chart(DATA_POINTS, COLORS).startswith(PNG_SIGNATURE)
+
+
+@pytest.mark.parametrize('use_processes', [False, True])
+def test_renderer_pools(use_processes):
+    """Charts render on a thread pool and on a process pool."""
+    renderer = ChartRenderer(use_processes=use_processes)
+
+    try:
+        chart = asyncio.run(renderer.render(DATA_POINTS, COLORS))
+    finally:
+        renderer.close()
+
+    assert renderer.uses_processes == use_processes
+    assert chart.startswith(PNG_SIGNATURE)
+
+
+def test_event_loop_runs_while_rendering():
+    """The event loop keeps running while a chart is being drawn."""
+    renderer = ChartRenderer(use_processes=False)
+    ticks = []
+
+    async def scenario():
+        render = asyncio.ensure_future(renderer.render(DATA_POINTS * 20, COLORS))
+
+        while not render.done():
+            ticks.append(1)
+            await asyncio.sleep(0.001)
+
+        return await render
+
+    try:
+        chart = asyncio.run(scenario())
+    finally:
+        renderer.close()
+
+    assert chart.startswith(PNG_SIGNATURE)
+    assert len(ticks) > 1
+
+
+def test_chart_cache_memory_and_disk(tmp_path):
+    """Cached charts survive a restart through the disk cache."""
+    key = (1, 'Dark', (800, 500), 3)
+    ChartCache(tmp_path).put(key, b'chart')
+
+    cache = ChartCache(tmp_path)
+    assert cache.get(key) == b'chart'
+    assert cache.get((1, 'Light', (800, 500), 3)) is None
+    assert cache.get((1, 'Dark', (800, 500), 4)) is None
+
+
+def test_chart_cache_drops_old_revisions(tmp_path):
+    """Storing a new revision removes the exercise's older charts."""
+    cache = ChartCache(tmp_path)
+    cache.put((1, 'Dark', (800, 500), 1), b'old')
+    cache.put((1, 'Light', (800, 500), 1), b'old')
+    cache.put((12, 'Dark', (800, 500), 1), b'other')
+    cache.put((1, 'Dark', (800, 500), 2), b'new')
+
+    assert cache.get((1, 'Dark', (800, 500), 1)) is None
+    assert cache.get((1, 'Light', (800, 500), 1)) is None
+    assert cache.get((12, 'Dark', (800, 500), 1)) == b'other'
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['1-Dark-800x500-r2.png', '12-Dark-800x500-r1.png']
+
+
+def test_chart_cache_disk_bound(tmp_path):
+    """The least recently used charts are evicted beyond max_disk_bytes."""
+    cache = ChartCache(tmp_path, max_disk_bytes=25)
+
+    for exercise_id in range(1, 4):
+        cache.put((exercise_id, 'Dark', (800, 500), 1), b'x' * 10)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['2-Dark-800x500-r1.png', '3-Dark-800x500-r1.png']
+
+
+def test_engine_reuses_figure_without_pyplot():
+    """Renders of one size share a figure and leave pyplot untouched."""
+    import sys
+
+    from wt25.chart_engine import get_engine
+
+    engine = get_engine((800, 500), 100)
+    first = render_progress_chart(DATA_POINTS, COLORS)
+    light = render_progress_chart(DATA_POINTS, dict(COLORS, prime_background='#FFFFFF'))
+
+    assert get_engine((800, 500), 100) is engine
+    assert len(engine.figure.axes) == 1 and len(engine.ax.lines) == 1
+    assert first != light
+    assert render_progress_chart(DATA_POINTS, COLORS) == first
+    assert 'matplotlib.pyplot' not in sys.modules
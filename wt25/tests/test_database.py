@@ -0,0 +1,490 @@
+import sqlite3
+import threading
+
+import pytest
+
+from wt25.database import SET_PAGE_SIZE, WorkoutDB
+from wt25.events import (
+    ExerciseAdded,
+    ExerciseLinked,
+    ExerciseUnlinked,
+    SetsAdded,
+    SettingChanged,
+    WorkoutAdded,
+    WorkoutDeleted,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+
+    database = WorkoutDB(tmp_path / 'workouts.db')
+    yield database
+    database.close()
+
+
+def test_connection_is_reused(db):
+    """Calls from the same thread share one connection."""
+    assert db._get_connection() is db._get_connection()
+
+
+def test_connection_per_thread(db):
+    """Each thread gets its own connection."""
+    main_conn = db._get_connection()
+    other = []
+
+    thread = threading.Thread(target=lambda: other.append(db._get_connection()))
+    thread.start()
+    thread.join()
+
+    assert other[0] is not main_conn
+    assert len(db._connections) == 2
+
+
+def test_close_and_reopen(db):
+    """close() drops all connections, the next call reopens lazily."""
+    db.add_workout('Leg Day', '2025-11-19')
+    conn = db._get_connection()
+
+    db.close()
+
+    assert db._connections == []
+    assert db._get_connection() is not conn
+    assert db.get_workouts_by_date('2025-11-19')[0]['name'] == 'Leg Day'
+
+
+def test_context_manager(tmp_path):
+    """Leaving the with block closes the database."""
+    with WorkoutDB(tmp_path / 'workouts.db') as database:
+
+        database.set_setting('theme', 'Light')
+        assert database.get_setting('theme') == 'Light'
+
+    assert database._connections == []
+
+
+def test_workout_counts_by_range(db):
+    """Only days inside the range are counted, bounds inclusive."""
+    db.add_workout('Push', '2025-10-31')
+    db.add_workout('Pull', '2025-11-01')
+    db.add_workout('Legs', '2025-11-01')
+    db.add_workout('Push', '2025-11-30')
+    db.add_workout('Pull', '2025-12-01')
+
+    counts = db.get_workout_counts('2025-11-01', '2025-11-30')
+
+    assert counts == {'2025-11-01': 2, '2025-11-30': 1}
+
+
+def test_workout_counts_uses_date_index(db):
+    """The range query is answered from the date index."""
+    plan = db._get_connection().execute("""
+    EXPLAIN QUERY PLAN
+    SELECT date, COUNT(*) FROM workouts
+    WHERE date BETWEEN '2025-11-01' AND '2025-11-30'
+    GROUP BY date
+    """).fetchall()
+
+    assert any('idx_workouts_date_name' in row['detail'] for row in plan)
+
+
+def _log_workout(db, date, name, exercises):
+    """Store a workout with {exercise name: [(reps, weight), ...]}."""
+    workout_id = db.add_workout(name, date)
+
+    for exercise_name, sets in exercises.items():
+
+        exercise_id = db.add_new_exercise(exercise_name)
+        workout_exercise_id = db.link_exercise_to_workout(workout_id, exercise_id)
+
+        for reps, weight in sets:
+
+            db.add_set(workout_exercise_id, reps, weight)
+
+    return workout_id
+
+
+def _trace(db, call):
+    """Run call() and return its result with the SQL statements it executed."""
+    statements = []
+    conn = db._get_connection()
+    conn.set_trace_callback(statements.append)
+
+    try:
+        result = call()
+    finally:
+        conn.set_trace_callback(None)
+
+    return result, statements
+
+
+def _count_statements(db, call):
+    """Run call() and return how many SQL statements it executed."""
+    result, statements = _trace(db, call)
+
+    return result, len(statements)
+
+
+def test_workout_exercises_grouped(db):
+    """Exercises keep link order, sets keep insert order, empty exercises have no sets."""
+    workout_id = _log_workout(db, '2025-11-19', 'Push', {
+        'Bench Press': [(5, 80.0), (5, 82.5)],
+        'Dips': [],
+        'Overhead Press': [(8, 40.0)]
+    })
+
+    exercises = db.get_workout_exercises(workout_id)
+
+    assert [ex['exercise_name'] for ex in exercises] == ['Bench Press', 'Dips', 'Overhead Press']
+    assert [(s['reps'], s['weight']) for s in exercises[0]['sets']] == [(5, 80.0), (5, 82.5)]
+    assert exercises[1]['sets'] == []
+    assert set(exercises[2]['sets'][0]) == {'id', 'reps', 'weight'}
+
+
+def test_workout_exercises_single_query(db):
+    """The number of queries does not grow with the number of exercises."""
+    workout_id = _log_workout(db, '2025-11-19', 'Volume', {
+        f'Exercise {i}': [(10, 20.0)] * 3 for i in range(20)
+    })
+
+    exercises, statements = _count_statements(db, lambda: db.get_workout_exercises(workout_id))
+
+    assert len(exercises) == 20
+    assert statements == 1
+
+
+def test_exercises_for_many_workouts(db):
+    """The bulk variant returns every requested workout, including empty ones."""
+    push = _log_workout(db, '2025-11-19', 'Push', {'Bench Press': [(5, 80.0)]})
+    pull = _log_workout(db, '2025-11-19', 'Pull', {'Row': [(8, 60.0)], 'Curl': [(12, 15.0)]})
+    empty = db.add_workout('Rest', '2025-11-20')
+
+    workouts, statements = _count_statements(
+        db, lambda: db.get_exercises_for_workouts([push, pull, empty])
+    )
+
+    assert statements == 1
+    assert [ex['exercise_name'] for ex in workouts[push]] == ['Bench Press']
+    assert [ex['exercise_name'] for ex in workouts[pull]] == ['Row', 'Curl']
+    assert workouts[empty] == []
+
+
+def test_pragma_profile_applied(db):
+    """New connections run with the tuned profile."""
+    conn = db._get_connection()
+
+    assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+    assert conn.execute('PRAGMA synchronous').fetchone()[0] == 1
+    assert conn.execute('PRAGMA foreign_keys').fetchone()[0] == 1
+    assert conn.execute('PRAGMA temp_store').fetchone()[0] == 2
+
+
+def test_sqlite_defaults(tmp_path):
+    """An empty profile leaves SQLite's defaults untouched."""
+    with WorkoutDB(tmp_path / 'workouts.db', pragmas={}) as database:
+
+        conn = database._get_connection()
+
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'delete'
+        assert conn.execute('PRAGMA foreign_keys').fetchone()[0] == 0
+
+
+def test_link_to_missing_workout_without_foreign_keys(tmp_path):
+    """Without foreign keys an orphan link is stored but publishes no event."""
+    with WorkoutDB(tmp_path / 'workouts.db', pragmas={}) as database:
+
+        events = []
+        database.subscribe(events.extend)
+
+        exercise_id = database.add_new_exercise('Bench Press')
+        database.link_exercise_to_workout(9999, exercise_id)
+
+        assert [type(event) for event in events] == [ExerciseAdded]
+
+
+def test_delete_workout_cascades(db):
+    """Deleting a workout removes its exercise links and sets."""
+    workout_id = _log_workout(db, '2025-11-19', 'Push', {'Bench Press': [(5, 80.0), (5, 82.5)]})
+
+    db.delete_workout(workout_id)
+
+    conn = db._get_connection()
+    assert conn.execute('SELECT COUNT(*) FROM workout_exercises').fetchone()[0] == 0
+    assert conn.execute('SELECT COUNT(*) FROM sets').fetchone()[0] == 0
+    assert db.all_done_exercises() == []
+
+
+def test_add_sets_bulk(db):
+    """Bulk inserted sets come back in order under the returned ids."""
+    workout_id = _log_workout(db, '2025-11-19', 'Push', {'Bench Press': [(5, 60.0)]})
+    workout_exercise_id = db.get_workout_exercises(workout_id)[0]['workout_exercise_id']
+
+    sets = [(10, 40.0 + i) for i in range(20)]
+    set_ids, statements = _trace(db, lambda: db.add_sets_bulk(workout_exercise_id, sets))
+
+    stored = db.get_workout_exercises(workout_id)[0]['sets'][1:]
+
+    assert [s['id'] for s in stored] == set_ids
+    assert [(s['reps'], s['weight']) for s in stored] == sets
+    assert statements.count('COMMIT') == 1
+
+
+def test_add_sets_bulk_is_atomic(db):
+    """A failing row rolls back the whole batch."""
+    workout_id = _log_workout(db, '2025-11-19', 'Push', {'Bench Press': []})
+    workout_exercise_id = db.get_workout_exercises(workout_id)[0]['workout_exercise_id']
+
+    with pytest.raises(sqlite3.IntegrityError):
+
+        db.add_sets_bulk(workout_exercise_id, [(5, 80.0), (None, 80.0)])
+
+    assert db.get_workout_exercises(workout_id)[0]['sets'] == []
+
+
+def test_add_sets_bulk_is_atomic_in_transaction(db):
+    """Inside a unit of work a failing batch is undone while the rest of the block commits."""
+    workout_id = _log_workout(db, '2025-11-19', 'Push', {'Bench Press': []})
+    workout_exercise_id = db.get_workout_exercises(workout_id)[0]['workout_exercise_id']
+
+    with db.transaction():
+
+        db.add_set(workout_exercise_id, 3, 90.0)
+
+        with pytest.raises(sqlite3.IntegrityError):
+
+            db.add_sets_bulk(workout_exercise_id, [(5, 80.0), (None, 80.0)])
+
+    sets = db.get_workout_exercises(workout_id)[0]['sets']
+
+    assert [(s['reps'], s['weight']) for s in sets] == [(3, 90.0)]
+
+
+def test_failed_write_releases_lock(db):
+    """A failing single write is rolled back instead of holding the write lock."""
+    with pytest.raises(sqlite3.IntegrityError):
+
+        db.add_set(9999, 5, 100.0)
+
+    assert not db._get_connection().in_transaction
+
+    with db.transaction():
+
+        db.add_workout('Push', '2025-11-19')
+
+    assert [w['name'] for w in db.get_workouts_by_date('2025-11-19')] == ['Push']
+
+
+def test_write_rolls_back_on_any_error(db):
+    """A non-sqlite error inside a single write is rolled back too."""
+    with pytest.raises(ValueError):
+
+        with db._write() as conn:
+
+            conn.execute("INSERT INTO workouts (name, date) VALUES ('Push', '2025-11-19')")
+            raise ValueError
+
+    assert not db._get_connection().in_transaction
+    assert db.get_workouts_by_date('2025-11-19') == []
+
+
+def test_transaction_commits_once(db):
+    """Writes inside a unit of work share a single commit."""
+    def log():
+        with db.transaction():
+
+            workout_id = db.add_workout('Push', '2025-11-19')
+            exercise_id = db.add_new_exercise('Bench Press')
+            workout_exercise_id = db.link_exercise_to_workout(workout_id, exercise_id)
+            db.add_sets_bulk(workout_exercise_id, [(5, 80.0), (5, 82.5)])
+            db.add_set(workout_exercise_id, 3, 85.0)
+
+        return workout_id
+
+    workout_id, statements = _trace(db, log)
+
+    assert statements.count('COMMIT') == 1
+    assert len(db.get_workout_exercises(workout_id)[0]['sets']) == 3
+
+
+def test_transaction_rolls_back(db):
+    """A failing step leaves nothing of the unit of work behind."""
+    with pytest.raises(sqlite3.IntegrityError):
+
+        with db.transaction():
+
+            workout_id = db.add_workout('Push', '2025-11-19')
+            exercise_id = db.add_new_exercise('Bench Press')
+            workout_exercise_id = db.link_exercise_to_workout(workout_id, exercise_id)
+            db.add_sets_bulk(workout_exercise_id, [(5, 80.0), (None, 80.0)])
+
+    assert db.get_workouts_by_date('2025-11-19') == []
+    assert db.get_all_exercises() == []
+
+
+def test_nested_transaction_is_savepoint(db):
+    """A failing inner block only undoes its own writes."""
+    with db.transaction():
+
+        db.add_workout('Push', '2025-11-19')
+
+        with pytest.raises(ValueError):
+
+            with db.transaction():
+
+                db.add_workout('Pull', '2025-11-19')
+                raise ValueError
+
+    assert [w['name'] for w in db.get_workouts_by_date('2025-11-19')] == ['Push']
+
+
+def test_add_existing_exercise(db):
+    """Adding a known name returns the existing id, ignoring case."""
+    exercise_id = db.add_new_exercise('Bench Press')
+
+    with db.transaction():
+
+        assert db.add_new_exercise('bench press') == exercise_id
+
+    assert len(db.get_all_exercises()) == 1
+
+
+def test_exercise_stats(db):
+    """Summary values follow the per-day max weights in date order."""
+    _log_workout(db, '2025-11-03', 'Push', {'Bench Press': [(5, 80.0), (3, 85.0)]})
+    _log_workout(db, '2025-11-01', 'Push', {'Bench Press': [(5, 75.0)]})
+    _log_workout(db, '2025-11-05', 'Push', {'Bench Press': [(5, 82.5)]})
+    _log_workout(db, '2025-11-05', 'Extra', {'Bench Press': [(1, 90.0)]})
+    exercise_id = db.add_new_exercise('Bench Press')
+
+    stats = db.get_exercise_stats(exercise_id)
+
+    assert stats['data_points'] == [
+        {'date': '2025-11-01', 'max_weight': 75.0},
+        {'date': '2025-11-03', 'max_weight': 85.0},
+        {'date': '2025-11-05', 'max_weight': 90.0},
+    ]
+    assert stats['stats'] == {
+        'start_weight': 75.0,
+        'personal_best': 90.0,
+        'last_weight': 90.0,
+        'average_weight': pytest.approx(250.0 / 3),
+        'training_days': 3,
+    }
+
+
+def test_exercise_summary_without_series(db):
+    """The summary alone is one query and skips the series."""
+    _log_workout(db, '2025-11-01', 'Push', {'Bench Press': [(5, 75.0)]})
+    exercise_id = db.add_new_exercise('Bench Press')
+
+    stats, statements = _count_statements(
+        db, lambda: db.get_exercise_stats(exercise_id, include_series=False)
+    )
+
+    assert statements == 1
+    assert stats['data_points'] is None
+    assert stats['stats']['personal_best'] == 75.0
+
+
+def test_exercise_stats_without_sets(db):
+    """Exercises without sets have no stats."""
+    exercise_id = db.add_new_exercise('Bench Press')
+
+    assert db.get_exercise_stats(exercise_id) is None
+    assert db.get_exercise_series(exercise_id) == []
+
+
+def test_events_after_commit(db):
+    """Subscribers get typed events with the affected ids after each committed write."""
+    published = []
+    db.subscribe(published.append)
+
+    workout_id = db.add_workout('Push', '2025-11-19')
+    exercise_id = db.add_new_exercise('Bench Press')
+    db.add_new_exercise('bench press')
+    link_id = db.link_exercise_to_workout(workout_id, exercise_id)
+    set_ids = db.add_sets_bulk(link_id, [(5, 80.0), (5, 82.5)])
+    db.set_setting('theme', 'Light')
+
+    assert published == [
+        (WorkoutAdded(workout_id, 'Push', '2025-11-19'),),
+        (ExerciseAdded(exercise_id, 'Bench Press'),),
+        (ExerciseLinked(link_id, workout_id, exercise_id, '2025-11-19'),),
+        (SetsAdded(tuple(set_ids), link_id, workout_id, exercise_id, '2025-11-19'),),
+        (SettingChanged('theme', 'Light'),),
+    ]
+
+    db.del_linked_exercise(link_id)
+    db.delete_workout(workout_id)
+
+    assert published[-2:] == [
+        (ExerciseUnlinked(link_id, workout_id, exercise_id, '2025-11-19'),),
+        (WorkoutDeleted(workout_id, '2025-11-19', ()),),
+    ]
+
+    db.unsubscribe(published.append)
+    db.add_workout('Pull', '2025-11-20')
+
+    assert len(published) == 7
+
+
+def test_events_filtered_by_type(db):
+    """Subscribers for some event types only hear about those."""
+    published = []
+    db.subscribe(published.append, WorkoutAdded, WorkoutDeleted)
+
+    workout_id = db.add_workout('Push', '2025-11-19')
+    db.set_setting('theme', 'Light')
+
+    with db.transaction():
+        db.link_exercise_to_workout(workout_id, db.add_new_exercise('Bench Press'))
+        db.delete_workout(workout_id)
+
+    assert published == [
+        (WorkoutAdded(workout_id, 'Push', '2025-11-19'),),
+        (WorkoutDeleted(workout_id, '2025-11-19', (1,)),),
+    ]
+
+
+def test_events_once_per_unit_of_work(db):
+    """A unit of work publishes once on commit, without rolled back savepoints."""
+    published = []
+    db.subscribe(published.append)
+
+    with db.transaction():
+        workout_id = db.add_workout('Push', '2025-11-19')
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.add_new_exercise('Bench Press')
+                raise RuntimeError("boom")
+        db.set_setting('theme', 'Light')
+        assert published == []
+
+    assert published == [
+        (WorkoutAdded(workout_id, 'Push', '2025-11-19'), SettingChanged('theme', 'Light')),
+    ]
+
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.add_workout('Pull', '2025-11-20')
+            raise RuntimeError("boom")
+
+    assert len(published) == 1
+
+
+def test_workout_sets_in_pages(db):
+    """Sets come in pages in overview order, each exercise's sets in the order logged."""
+    workout_id = db.add_workout('Log', '2025-11-19')
+    squat = db.link_exercise_to_workout(workout_id, db.add_new_exercise('Squat'))
+    db.link_exercise_to_workout(workout_id, db.add_new_exercise('Dips'))
+    bench = db.link_exercise_to_workout(workout_id, db.add_new_exercise('Bench Press'))
+    db.add_sets_bulk(squat, [(5, float(i)) for i in range(SET_PAGE_SIZE - 2)])
+    db.add_sets_bulk(bench, [(3, float(i)) for i in range(5)])
+
+    overview = db.get_workout_overview(workout_id)
+    pages = [db.get_workout_sets(workout_id, page) for page in range(3)]
+
+    assert [(e['exercise_name'], e['set_count']) for e in overview] == [('Squat', SET_PAGE_SIZE - 2), ('Dips', 0), ('Bench Press', 5)]
+    assert [len(page) for page in pages] == [SET_PAGE_SIZE, 3, 0]
+    assert [s['exercise_name'] for s in pages[0][-3:]] == ['Squat', 'Bench Press', 'Bench Press']
+    assert [s['weight'] for s in pages[1]] == [2.0, 3.0, 4.0]
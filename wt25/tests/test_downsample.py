@@ -0,0 +1,101 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from wt25.downsample import downsample_series, lttb_indices, personal_best_indices, target_points
+
+
+def _series(days, seed=1, rise=0.01):
+    """A noisy, slowly rising history, one point per training day."""
+    rng = random.Random(seed)
+    start = date(2015, 1, 1)
+
+    return [
+        {'date': (start + timedelta(days=i)).isoformat(), 'max_weight': 60.0 + i * rise + rng.uniform(-5, 5)}
+        for i in range(days)
+    ]
+
+
+def test_short_series_untouched():
+    """Series that already fit are returned as they are."""
+    series = _series(50)
+
+    assert downsample_series(series, 100) is series
+
+
+def test_long_series_is_bounded():
+    """Ten years of history shrink to the target, in order, ends included."""
+    series = _series(3650, rise=0)
+    reduced = downsample_series(series, 150)
+
+    assert len(reduced) <= 150
+    assert reduced[0] is series[0]
+    assert reduced[-1] is series[-1]
+    assert [d['date'] for d in reduced] == sorted(d['date'] for d in reduced)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_personal_best_is_kept(seed):
+    """The heaviest day always survives the reduction."""
+    series = _series(2000, seed)
+    best = max(series, key=lambda d: d['max_weight'])
+
+    assert best in downsample_series(series, 40)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_every_personal_best_is_kept(seed):
+    """Each day that set a new max survives, so the PR progression is intact."""
+    series = _series(2000, seed)
+    reduced = downsample_series(series, 40)
+    best = float('-inf')
+
+    for point in series:
+        if point['max_weight'] > best:
+            best = point['max_weight']
+            assert point in reduced
+
+
+def test_personal_bests_may_exceed_target():
+    """A history with more personal bests than the target keeps all of them."""
+    series = _series(3650)
+    weights = np.array([d['max_weight'] for d in series])
+    bests = len(personal_best_indices(weights))
+    reduced = downsample_series(series, 150)
+
+    assert bests > 150
+    assert bests <= len(reduced) <= bests + 3
+
+
+def test_personal_best_indices():
+    """Only the first day of each new max counts, ties and dips do not."""
+    weights = np.array([50.0, 55.0, 55.0, 52.0, 60.0, 60.0, 58.0, 61.0])
+
+    assert personal_best_indices(weights).tolist() == [0, 1, 4, 7]
+
+
+def test_lttb_keeps_spikes():
+    """A single spike in a flat series is picked over its neighbours."""
+    x = np.arange(1000, dtype=float)
+    y = np.zeros(1000)
+    y[437] = 10.0
+
+    assert 437 in lttb_indices(x, y, 20)
+
+
+def test_lttb_picks_one_point_per_bucket():
+    """Indices are unique, increasing and exactly threshold long."""
+    x = np.arange(500, dtype=float)
+    indices = lttb_indices(x, np.sin(x / 10), 60)
+
+    assert len(indices) == 60
+    assert (np.diff(indices) > 0).all()
+
+
+def test_target_points():
+    """The target follows the plot width."""
+    assert target_points(600) == 150
+    assert target_points(4) == 3
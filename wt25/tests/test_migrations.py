@@ -0,0 +1,122 @@
+import sqlite3
+
+import pytest
+
+from wt25.database import WorkoutDB
+from wt25.migrations import MIGRATIONS, SCHEMA_VERSION, get_schema_version, migrate
+
+
+# layout written by releases before schema versioning, including the duplicated settings table
+OLD_LAYOUT = '''
+CREATE TABLE IF NOT EXISTS workouts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS exercises (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE COLLATE NOCASE
+);
+CREATE TABLE IF NOT EXISTS workout_exercises (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    workout_id INTEGER NOT NULL,
+    exercise_id INTEGER NOT NULL,
+    FOREIGN KEY (workout_id) REFERENCES workouts(id) ON DELETE CASCADE,
+    FOREIGN KEY (exercise_id) REFERENCES exercises(id) ON DELETE CASCADE
+    );
+CREATE TABLE IF NOT EXISTS sets (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    workout_exercise_id INTEGER NOT NULL,
+    reps INTEGER NOT NULL,
+    weight REAL NOT NULL,
+    FOREIGN KEY (workout_exercise_id) REFERENCES workout_exercises(id) ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+    );
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+INSERT INTO workouts (date, name) VALUES ('2025-11-19', 'Push');
+INSERT INTO exercises (name) VALUES ('Bench Press');
+INSERT INTO workout_exercises (workout_id, exercise_id) VALUES (1, 1);
+INSERT INTO sets (workout_exercise_id, reps, weight) VALUES (1, 5, 80.0);
+INSERT INTO settings (key, value) VALUES ('theme', 'Navy');
+INSERT INTO workout_exercises (workout_id, exercise_id) VALUES (99, 1);
+INSERT INTO sets (workout_exercise_id, reps, weight) VALUES (2, 5, 60.0);
+'''
+
+
+def test_new_database_is_current(tmp_path):
+    """A fresh file is created at the latest schema version."""
+    with WorkoutDB(tmp_path / 'workouts.db') as db:
+
+        assert get_schema_version(db._get_connection()) == SCHEMA_VERSION
+
+
+def test_upgrade_old_layout(tmp_path):
+    """An unversioned database from an old release is upgraded in place."""
+    db_path = tmp_path / 'workouts.db'
+
+    conn = sqlite3.connect(db_path)
+    conn.executescript(OLD_LAYOUT)
+    conn.close()
+
+    with WorkoutDB(db_path) as db:
+
+        conn = db._get_connection()
+        indexes = {row['name'] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+        assert get_schema_version(conn) == SCHEMA_VERSION
+        assert 'idx_workouts_date' not in indexes
+        assert {'idx_workouts_date_name', 'idx_sets_workout_exercise'} <= indexes
+        assert db.get_setting('theme') == 'Navy'
+        assert db.get_workout_exercises(1)[0]['sets'][0]['weight'] == 80.0
+
+        # the rollup is backfilled from existing sets
+        assert db.get_exercise_series(1) == [{'date': '2025-11-19', 'max_weight': 80.0}]
+
+        # rows left behind by deleted workouts are gone
+        assert conn.execute('SELECT COUNT(*) FROM workout_exercises').fetchone()[0] == 1
+        assert conn.execute('SELECT COUNT(*) FROM sets').fetchone()[0] == 1
+
+
+def test_current_schema_fast_path(tmp_path):
+    """Reopening a current database only reads the version."""
+    with WorkoutDB(tmp_path / 'workouts.db') as db:
+
+        statements = []
+        conn = db._get_connection()
+        conn.set_trace_callback(statements.append)
+        migrate(conn)
+        conn.set_trace_callback(None)
+
+        assert statements == ['PRAGMA user_version']
+
+
+def test_migrations_are_idempotent(tmp_path):
+    """Every step can run again on a database that already has it applied."""
+    conn = sqlite3.connect(tmp_path / 'workouts.db')
+    migrate(conn)
+
+    for statements in MIGRATIONS:
+
+        for statement in statements:
+
+            conn.execute(statement)
+
+    conn.close()
+
+
+def test_newer_schema_rejected(tmp_path):
+    """A database written by a newer release is not silently downgraded."""
+    conn = sqlite3.connect(tmp_path / 'workouts.db')
+    conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION + 1}')
+
+    with pytest.raises(RuntimeError):
+
+        migrate(conn)
+
+    conn.close()
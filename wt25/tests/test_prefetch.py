@@ -0,0 +1,105 @@
+import asyncio
+import sqlite3
+from datetime import date
+
+import pytest
+
+from wt25.async_db import AsyncWorkoutDB
+from wt25.database import WorkoutDB
+from wt25.prefetch import Prefetcher, month_bounds, shift_month
+
+
+@pytest.fixture
+def adb(tmp_path):
+
+    database = AsyncWorkoutDB(WorkoutDB(tmp_path / 'workouts.db'))
+
+    for day in ('2025-11-18', '2025-11-19', '2025-11-20'):
+        workout_id = database.db.add_workout('Push', day)
+        link = database.db.link_exercise_to_workout(workout_id, database.db.add_new_exercise('Bench Press'))
+        database.db.add_set(link, 5, 80.0)
+
+    yield database
+    database.close()
+
+
+def test_month_helpers():
+    """Month arithmetic wraps around the year."""
+    assert month_bounds(2024, 2) == ('2024-02-01', '2024-02-29')
+    assert shift_month(2025, 12, 1) == (2026, 1)
+    assert shift_month(2025, 1, -1) == (2024, 12)
+    assert shift_month(2025, 6, -18) == (2023, 12)
+
+
+def test_neighbouring_days_are_cached(adb):
+    """After a prefetch, stepping to the next day and opening its workout hits the cache."""
+    db = adb.db
+    prefetch = Prefetcher(adb, delay=0, days=1)
+
+    async def scenario():
+        prefetch.around_day(date(2025, 11, 19))
+        await prefetch.wait()
+
+    asyncio.run(scenario())
+    misses = db.cache_info()['misses']
+
+    workout = db.get_workouts_by_date('2025-11-20')[0]
+    db.get_workout_overview(workout['id'])
+    db.get_workout_sets(workout['id'], 0)
+    db.get_workouts_by_date('2025-11-18')
+
+    assert prefetch.loaded == 3
+    assert db.cache_info()['misses'] == misses
+
+
+def test_neighbouring_months_are_cached(adb):
+    """Both months next to the one shown are cached."""
+    db = adb.db
+    prefetch = Prefetcher(adb, delay=0)
+
+    async def scenario():
+        prefetch.around_month(2026, 1)
+        await prefetch.wait()
+
+    asyncio.run(scenario())
+    misses = db.cache_info()['misses']
+
+    db.get_workout_counts(*month_bounds(2025, 12))
+    db.get_workout_counts(*month_bounds(2026, 2))
+
+    assert db.cache_info()['misses'] == misses
+
+
+def test_newer_prefetch_cancels_older(adb):
+    """Rapid stepping only prefetches around where it stops."""
+    prefetch = Prefetcher(adb, delay=0.05, days=1)
+
+    async def scenario():
+        prefetch.around_day(date(2025, 1, 1))
+        prefetch.around_day(date(2025, 1, 2))
+        prefetch.around_day(date(2025, 11, 19))
+        await prefetch.wait()
+
+    asyncio.run(scenario())
+
+    assert prefetch.loaded == 3
+    assert adb.db.get_workouts_by_date('2025-11-20')
+
+
+def test_failed_prefetch_is_swallowed(adb, caplog):
+    """A db error while prefetching is logged and never reaches the caller."""
+    prefetch = Prefetcher(adb, delay=0)
+
+    def broken(*args):
+        raise sqlite3.OperationalError('database is locked')
+
+    adb.db.get_workout_counts = broken
+
+    async def scenario():
+        prefetch.around_month(2026, 1)
+        await prefetch.wait()
+
+    asyncio.run(scenario())
+
+    assert prefetch.loaded == 0
+    assert 'prefetch with load_month failed' in caplog.text
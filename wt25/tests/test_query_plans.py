@@ -0,0 +1,153 @@
+import inspect
+import re
+
+import pytest
+
+from wt25.database import WorkoutDB
+
+
+# every public WorkoutDB method with arguments valid for the populated fixture,
+# run in order so writes come after the reads that need their rows
+CALLS = [
+    ('get_all_workouts', ()),
+    ('get_workouts_by_date', ('2025-11-19',)),
+    ('get_workout_counts', ('2025-11-01', '2025-11-30')),
+    ('get_all_exercises', ()),
+    ('all_done_exercises', ()),
+    ('get_workout_exercises', (1,)),
+    ('get_exercises_for_workouts', ([1, 2],)),
+    ('get_workout_overview', (1,)),
+    ('get_workout_sets', (1, 0)),
+    ('get_exercise_stats', (1,)),
+    ('get_exercise_summary', (1,)),
+    ('get_exercise_series', (1,)),
+    ('get_exercise_revision', (1,)),
+    ('get_setting', ('theme',)),
+    ('add_workout', ('Pull', '2025-11-20')),
+    ('add_new_exercise', ('Bench Press',)),
+    ('link_exercise_to_workout', (2, 1)),
+    ('add_set', (1, 5, 85.0)),
+    ('add_sets_bulk', (1, [(5, 87.5), (3, 90.0)])),
+    ('set_setting', ('theme', 'Light')),
+    ('del_linked_exercise', (2,)),
+    ('delete_workout', (2,)),
+]
+
+# lifecycle methods that run no queries of their own,
+# and maintenance that reads every row by design
+NOT_QUERIES = {'close', 'transaction', 'cache_info', 'rebuild_exercise_daily', 'subscribe', 'unsubscribe'}
+
+
+@pytest.fixture
+def db(tmp_path):
+
+    database = WorkoutDB(tmp_path / 'workouts.db')
+
+    workout_id = database.add_workout('Push', '2025-11-19')
+    exercise_id = database.add_new_exercise('Bench Press')
+    workout_exercise_id = database.link_exercise_to_workout(workout_id, exercise_id)
+    database.add_set(workout_exercise_id, 5, 80.0)
+    database.set_setting('theme', 'Dark')
+
+    yield database
+    database.close()
+
+
+# run every call and collect the expanded SQL of each statement
+def _captured_statements(db) -> list[str]:
+
+    statements = []
+    conn = db._get_connection()
+    conn.set_trace_callback(statements.append)
+
+    try:
+
+        for name, args in CALLS:
+
+            getattr(db, name)(*args)
+
+    finally:
+
+        conn.set_trace_callback(None)
+
+    return [
+        sql for sql in statements
+        if sql.lstrip().split(None, 1)[0].upper() in ('SELECT', 'UPDATE', 'DELETE', 'WITH')
+    ]
+
+
+def test_every_method_is_covered():
+    """New WorkoutDB methods must be added to CALLS so their plans get checked."""
+    public = {
+        name for name, _ in inspect.getmembers(WorkoutDB, inspect.isfunction)
+        if not name.startswith('_')
+    }
+
+    assert public - NOT_QUERIES == {name for name, _ in CALLS}
+
+
+# details of the plan steps that read a whole table
+def _full_scans(conn, sql: str, params: tuple = ()) -> list[str]:
+
+    # CTEs and subqueries are built first, reading their results back is not a table scan
+    derived = {'CONSTANT ROW'}
+    scans = []
+
+    for row in conn.execute('EXPLAIN QUERY PLAN ' + sql, params):
+
+        detail = row['detail']
+
+        if detail.startswith(('CO-ROUTINE ', 'MATERIALIZE ')):
+
+            derived.add(detail.split(' ', 1)[1])
+
+        # "SCAN t USING [COVERING] INDEX ..." walks an index, a bare "SCAN t" reads the table
+        if detail.startswith('SCAN') and 'USING' not in detail and detail[len('SCAN '):] not in derived:
+
+            scans.append(detail)
+
+    return scans
+
+
+# the statements of every trigger body, NEW.x and OLD.x turned into parameters.
+# the trace callback only reports a "-- TRIGGER" marker, and the plan of the
+# statement that fires a trigger does not include the trigger's own lookups
+def _trigger_statements(conn) -> list[tuple[str, str]]:
+
+    statements = []
+
+    for row in conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'trigger'"):
+
+        body = re.search(r'\bBEGIN\b(.*)\bEND\s*$', row['sql'], re.S | re.I).group(1)
+        body = re.sub(r'\b(?:NEW|OLD)\.\w+', '?', body)
+
+        statements += [(row['name'], sql.strip()) for sql in body.split(';') if sql.strip()]
+
+    return statements
+
+
+def test_no_full_table_scans(db):
+    """No query reads a table without using an index."""
+    statements = _captured_statements(db)
+    conn = db._get_connection()
+
+    assert statements
+
+    for sql in statements:
+
+        scans = _full_scans(conn, sql)
+        assert not scans, f"{scans}\n{sql}"
+
+
+def test_trigger_lookups_use_indexes(db):
+    """Per-row triggers on sets, links, workouts and rollups look rows up by index."""
+    conn = db._get_connection()
+    statements = _trigger_statements(conn)
+
+    assert {name for name, _ in statements} >= {'exercise_daily_set_insert', 'exercise_revisions_daily_insert'}
+
+    for name, sql in statements:
+
+        # planned with unknown values, like the trigger sees its row
+        scans = _full_scans(conn, sql, (None,) * sql.count('?'))
+        assert not scans, f"{name}: {scans}\n{sql}"
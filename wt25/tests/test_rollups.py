@@ -0,0 +1,166 @@
+import random
+
+import pytest
+
+from wt25.database import WorkoutDB
+from wt25.maintenance import main as maintenance
+
+
+@pytest.fixture
+def db(tmp_path):
+
+    database = WorkoutDB(tmp_path / 'workouts.db')
+    yield database
+    database.close()
+
+
+def _rollup(db):
+
+    rows = db._get_connection().execute('SELECT * FROM exercise_daily ORDER BY exercise_id, date')
+
+    return [tuple(row) for row in rows]
+
+
+# what a full rebuild produces from the base tables
+def _expected(db):
+
+    rows = db._get_connection().execute("""
+    SELECT we.exercise_id, w.date, MAX(s.weight), SUM(s.reps), SUM(s.reps * s.weight), COUNT(*)
+    FROM workouts w
+    JOIN workout_exercises we ON we.workout_id = w.id
+    JOIN sets s ON s.workout_exercise_id = we.id
+    GROUP BY we.exercise_id, w.date
+    ORDER BY we.exercise_id, w.date
+    """)
+
+    return [tuple(row) for row in rows]
+
+
+def test_insert_updates_day(db):
+    """Sets on the same day from two workouts roll up into one row."""
+    bench = db.add_new_exercise('Bench Press')
+
+    for name, sets in (('Push', [(5, 80.0), (3, 85.0)]), ('Extra', [(10, 60.0)])):
+
+        workout_id = db.add_workout(name, '2025-11-19')
+        workout_exercise_id = db.link_exercise_to_workout(workout_id, bench)
+        db.add_sets_bulk(workout_exercise_id, sets)
+
+    assert _rollup(db) == [(bench, '2025-11-19', 85.0, 18, 1255.0, 3)]
+
+
+def test_delete_recomputes_max(db):
+    """Removing the heaviest workout of a day lowers the day's max."""
+    bench = db.add_new_exercise('Bench Press')
+
+    light = db.add_workout('Push', '2025-11-19')
+    db.add_set(db.link_exercise_to_workout(light, bench), 5, 80.0)
+    heavy = db.add_workout('Extra', '2025-11-19')
+    heavy_link = db.link_exercise_to_workout(heavy, bench)
+    db.add_set(heavy_link, 1, 100.0)
+
+    db.del_linked_exercise(heavy_link)
+    assert _rollup(db) == [(bench, '2025-11-19', 80.0, 5, 400.0, 1)]
+
+    db.delete_workout(light)
+    assert _rollup(db) == []
+
+
+def test_delete_exercise_drops_rows(db):
+    """Rows of a deleted exercise go with it."""
+    bench = db.add_new_exercise('Bench Press')
+    db.add_set(db.link_exercise_to_workout(db.add_workout('Push', '2025-11-19'), bench), 5, 80.0)
+
+    db._get_connection().execute('DELETE FROM exercises WHERE id = ?', (bench,))
+
+    assert _rollup(db) == []
+
+
+def test_rollup_matches_rebuild(db):
+    """Random logging and deleting keeps the rollup equal to a full rebuild."""
+    rng = random.Random(25)
+    exercises = [db.add_new_exercise(name) for name in ('Bench Press', 'Squat', 'Row')]
+    links = []
+
+    for _ in range(300):
+
+        action = rng.random()
+
+        if action < 0.5 or not links:
+
+            workout_id = db.add_workout('W', f'2025-11-{rng.randint(1, 5):02d}')
+            links.append(db.link_exercise_to_workout(workout_id, rng.choice(exercises)))
+
+        elif action < 0.85:
+
+            db.add_set(rng.choice(links), rng.randint(1, 12), rng.choice([40.0, 60.0, 80.0, 100.0]))
+
+        elif action < 0.95:
+
+            db.del_linked_exercise(links.pop(rng.randrange(len(links))))
+
+        else:
+
+            conn = db._get_connection()
+            row = conn.execute('SELECT id FROM sets ORDER BY RANDOM() LIMIT 1').fetchone()
+
+            if row:
+
+                conn.execute('DELETE FROM sets WHERE id = ?', (row['id'],))
+                conn.commit()
+
+    assert _rollup(db) == _expected(db)
+
+    db.rebuild_exercise_daily()
+    assert _rollup(db) == _expected(db)
+
+
+def test_maintenance_rebuild(tmp_path, capsys):
+    """The maintenance command repairs a drifted rollup."""
+    db_path = tmp_path / 'workouts.db'
+
+    with WorkoutDB(db_path) as db:
+
+        bench = db.add_new_exercise('Bench Press')
+        db.add_set(db.link_exercise_to_workout(db.add_workout('Push', '2025-11-19'), bench), 5, 80.0)
+
+        conn = db._get_connection()
+        conn.execute('DELETE FROM exercise_daily')
+        conn.commit()
+
+    maintenance(['rebuild-rollups', str(db_path)])
+
+    with WorkoutDB(db_path) as db:
+
+        assert db.get_exercise_series(bench) == [{'date': '2025-11-19', 'max_weight': 80.0}]
+
+    assert 'rebuilt' in capsys.readouterr().out
+
+
+def test_revision_follows_chart_data(db):
+    """The exercise revision changes exactly when its plotted maxima change."""
+    bench = db.add_new_exercise('Bench Press')
+    squat = db.add_new_exercise('Squat')
+    assert db.get_exercise_revision(bench) == 0
+
+    workout_id = db.add_workout('Push', '2025-11-19')
+    bench_link = db.link_exercise_to_workout(workout_id, bench)
+    squat_link = db.link_exercise_to_workout(workout_id, squat)
+    db.add_set(bench_link, 5, 80.0)
+    first = db.get_exercise_revision(bench)
+    assert first > 0
+
+    # a lighter set leaves the day's max, and so the chart, unchanged
+    db.add_set(bench_link, 5, 70.0)
+    assert db.get_exercise_revision(bench) == first
+
+    db.add_set(bench_link, 1, 90.0)
+    heavier = db.get_exercise_revision(bench)
+    assert heavier > first
+
+    # other exercises are not affected
+    db.add_set(squat_link, 5, 120.0)
+    assert db.get_exercise_revision(bench) == heavier
+
+    db.delete_workout(workout_id)
+    assert db.get_exercise_revision(bench) > heavier
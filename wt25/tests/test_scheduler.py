@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from wt25.scheduler import LatestWins
+
+
+def test_flicking_runs_only_the_last_selection():
+    """50 quick selections lead to a single load, for the last one."""
+    # far longer than the 50 loop iterations between the selections take
+    scheduler = LatestWins(delay=0.5)
+    loaded = []
+
+    async def load(name):
+        loaded.append(name)
+        return name
+
+    async def scenario():
+        calls = []
+
+        for i in range(50):
+            calls.append(asyncio.ensure_future(scheduler.run(load, f"exercise {i}")))
+            await asyncio.sleep(0)
+
+        return await asyncio.gather(*calls)
+
+    results = asyncio.run(scenario())
+
+    assert loaded == ["exercise 49"]
+    assert results[:-1] == [None] * 49
+    assert results[-1] == "exercise 49"
+    assert scheduler.started == 1
+
+
+def test_running_load_is_cancelled():
+    """A load already past the debounce delay is cancelled by a newer one."""
+    scheduler = LatestWins(delay=0)
+    finished = []
+
+    async def scenario():
+        started = asyncio.Event()
+        never = asyncio.Event()
+
+        async def slow_load():
+            started.set()
+            await never.wait()
+            finished.append('slow')
+
+        async def fast_load():
+            finished.append('fast')
+            return 'fast'
+
+        slow = asyncio.ensure_future(scheduler.run(slow_load))
+        await started.wait()
+        fast = await scheduler.run(fast_load)
+        return await slow, fast
+
+    assert asyncio.run(scenario()) == (None, 'fast')
+    assert finished == ['fast']
+    assert scheduler.started == 2
+
+
+def test_cancel_drops_pending_load():
+    """cancel() discards the pending call."""
+    # cancelled long before the delay could run out
+    scheduler = LatestWins(delay=10)
+    loaded = []
+
+    async def load():
+        loaded.append(True)
+
+    async def scenario():
+        call = asyncio.ensure_future(scheduler.run(load))
+        await asyncio.sleep(0)
+        scheduler.cancel()
+        return await call
+
+    assert asyncio.run(scenario()) is None
+    assert loaded == []
+
+
+def test_errors_reach_the_caller():
+    """Exceptions of the current load are not swallowed."""
+    scheduler = LatestWins(delay=0)
+
+    async def load():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        asyncio.run(scheduler.run(load))
@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('toga')
+
+from wt25.async_db import AsyncWorkoutDB
+from wt25.database import SET_PAGE_SIZE, WorkoutDB
+from wt25.sources import WorkoutSetSource
+
+
+class Listener:
+    """Records the rows a source reports as changed."""
+
+    def __init__(self):
+        self.changed = []
+
+    def change(self, item):
+        self.changed.append(item.index)
+
+
+@pytest.fixture
+def adb(tmp_path):
+
+    database = AsyncWorkoutDB(WorkoutDB(tmp_path / 'workouts.db'))
+    db = database.db
+
+    workout_id = db.add_workout('Log', '2025-11-19')
+    squat = db.link_exercise_to_workout(workout_id, db.add_new_exercise('Squat'))
+    db.link_exercise_to_workout(workout_id, db.add_new_exercise('Dips'))
+    bench = db.link_exercise_to_workout(workout_id, db.add_new_exercise('Bench Press'))
+    db.add_sets_bulk(squat, [(5, 100.0)] * SET_PAGE_SIZE)
+    db.add_sets_bulk(bench, [(3, 80.0)] * 3)
+
+    yield database
+    database.close()
+
+
+def _source(adb):
+    return WorkoutSetSource(adb, 1, adb.db.get_workout_overview(1))
+
+
+def test_first_page_loaded_up_front(adb):
+    """Rows of a preloaded page are filled in, sets numbered within their exercise."""
+
+    async def scenario():
+        source = _source(adb)
+        await source.load_page(0)
+        return source
+
+    source = asyncio.run(scenario())
+    first, last = source[0], source[SET_PAGE_SIZE - 1]
+
+    assert len(source) == SET_PAGE_SIZE + 3
+    assert (first.exercise, first.set, first.reps, first.weight) == ('Squat', 1, 5, 100.0)
+    assert (last.exercise, last.set) == ('Squat', SET_PAGE_SIZE)
+    assert source.pages_loaded == 1
+
+
+def test_rows_of_later_pages_load_on_demand(adb):
+    """A row of an unloaded page is blank until its page arrives, then reported as changed."""
+    listener = Listener()
+
+    async def scenario():
+        source = _source(adb)
+        source.add_listener(listener)
+        row = source[-1]
+        blank = row.exercise
+        await source.load_page(1)
+        return source, row, blank
+
+    source, row, blank = asyncio.run(scenario())
+
+    assert blank == ''
+    assert (row.exercise, row.set, row.reps) == ('Bench Press', 3, 3)
+    assert source.index(row) == SET_PAGE_SIZE + 2
+    assert listener.changed == [SET_PAGE_SIZE + 2]
+    assert source.pages_loaded == 1
+
+    with pytest.raises(IndexError):
+        source[SET_PAGE_SIZE + 3]
+
+
+def test_detached_source_stops_notifying(adb):
+    """A replaced source no longer updates the table."""
+    listener = Listener()
+
+    async def scenario():
+        source = _source(adb)
+        source.add_listener(listener)
+        source[0]
+        source.detach()
+        await asyncio.sleep(0.05)
+        return source
+
+    source = asyncio.run(scenario())
+
+    assert listener.changed == []
+    assert source.pages_loaded == 0
+
+
+def test_failed_page_is_retried(adb):
+    """A page that failed to load is asked for again on the next read of one of its rows."""
+    listener = Listener()
+    get_workout_sets = adb.get_workout_sets
+    calls = []
+
+    async def flaky(workout_id, page):
+        calls.append(page)
+        if len(calls) == 1:
+            raise OSError('disk I/O error')
+        return await get_workout_sets(workout_id, page)
+
+    adb.get_workout_sets = flaky
+
+    async def scenario():
+        source = _source(adb)
+        source.add_listener(listener)
+        await source.load_page(0)
+        row = source[0]
+        await source.load_page(0)
+        return source, row
+
+    source, row = asyncio.run(scenario())
+
+    assert calls == [0, 0]
+    assert row.exercise == 'Squat'
+    assert listener.changed == [0]
+    assert source.pages_loaded == 1
@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('toga')
+
+SRC = Path(__file__).resolve().parent.parent / 'src'
+
+# cumulative import time of wt25.app, about 0.2 s on a dev machine without matplotlib
+IMPORT_BUDGET_US = 600_000
+
+# only the chart workers may load these
+HEAVY_MODULES = ('matplotlib', 'numpy', 'PIL')
+
+
+def _import_times(module):
+    """Run python -X importtime and return {module: cumulative microseconds}."""
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, env=env, check=True
+    )
+    times = {}
+
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def test_app_import_skips_plotting():
+    """Importing the app does not load matplotlib or its dependencies."""
+    loaded = _import_times('wt25.app')
+
+    assert 'wt25.app' in loaded
+    assert not [name for name in loaded if name.split('.')[0] in HEAVY_MODULES]
+
+
+def test_app_import_budget():
+    """Importing the app stays within the startup budget."""
+    # best of three, to keep noise from other processes out
+    cost = min(_import_times('wt25.app')['wt25.app'] for _ in range(3))
+
+    assert cost < IMPORT_BUDGET_US, f"wt25.app import took {cost / 1000:.0f} ms"
@@ -0,0 +1,68 @@
+import gc
+
+import pytest
+
+pytest.importorskip('toga')
+
+from toga.colors import color
+
+from wt25.styles import STYLES, StyleRegistry
+
+KEYS = ('prime_background', 'second_background', 'text', 'primary', 'accent', 'danger')
+
+THEMES = {
+    'Dark': dict(zip(KEYS, ('#1E1E1E', '#2D2D2D', '#E0E0E0', '#BB86FC', '#9575CD', '#CF6679'))),
+    'Light': dict(zip(KEYS, ('#FFFFFF', '#F5F5F5', '#000000', '#1976D2', '#2196F3', '#D32F2F'))),
+}
+
+
+class FakeWidget:
+    """Takes a copy of its style like toga widgets do."""
+
+    def __init__(self, *args, style, **kwargs):
+        self.style = style.copy()
+        self.style.update(**kwargs)
+
+
+def test_styles_use_theme_keys():
+    """Colour properties of every named style name a theme colour."""
+    for spec in STYLES.values():
+        for prop, value in spec.items():
+            if prop.endswith('color'):
+                assert value in KEYS
+
+
+def test_styles_are_shared_per_theme():
+    """A named style is built once and resolved against the current theme."""
+    styles = StyleRegistry(THEMES, 'Dark')
+
+    assert styles['nav_button'] is styles['nav_button']
+    assert styles['nav_button'].background_color == color('#BB86FC')
+
+
+def test_switch_recolours_live_widgets():
+    """Switching themes recolours widgets in place and keeps their other properties."""
+    styles = StyleRegistry(THEMES, 'Dark')
+    day = styles.create(FakeWidget, 'day', "1", visibility='hidden')
+    styles.apply(day, 'workout_day')
+
+    assert styles.switch('Light') == 1
+    assert day.style.background_color == color('#1976D2')
+    assert day.style.color == color('#000000')
+    assert day.style.visibility == 'hidden'
+    assert styles['day'].background_color == color('#F5F5F5')
+
+
+def test_only_live_coloured_widgets_are_tracked():
+    """Widgets without colours are not tracked, dropped widgets are forgotten."""
+    styles = StyleRegistry(THEMES, 'Dark')
+    row = styles.create(FakeWidget, 'row')
+    label = styles.create(FakeWidget, 'label')
+
+    assert styles.switch('Light') == 1
+
+    del label
+    gc.collect()
+
+    assert styles.switch('Dark') == 0
+    assert row.style.direction == 'row'
@@ -0,0 +1,125 @@
+import asyncio
+
+from wt25.events import SetsAdded, WorkoutAdded
+from wt25.views import Screen, ViewController
+
+
+SET_ADDED = SetsAdded((1,), 1, 1, 1, '2025-11-19')
+WORKOUT_ADDED = WorkoutAdded(2, 'Pull', '2025-11-20')
+
+
+class FakeWindow:
+    content = None
+
+
+class Counter:
+    """Screen builder that counts builds and refreshes."""
+
+    def __init__(self, topics=(), refreshable=True, affected=None):
+        self.topics = topics
+        self.refreshable = refreshable
+        self.affected = affected
+        self.builds = 0
+        self.refreshes = 0
+
+    async def build(self):
+        self.builds += 1
+        return Screen(
+            object(),
+            refresh=self.refresh if self.refreshable else None,
+            topics=self.topics,
+            affected=self.affected
+        )
+
+    async def refresh(self):
+        self.refreshes += 1
+
+
+def test_back_navigation_reuses_screens():
+    """Showing a kept screen again does not build it."""
+    views = ViewController(FakeWindow())
+    calendar, day = Counter(), Counter()
+
+    async def scenario():
+        first = await views.show('calendar', calendar.build)
+        await views.show('day', day.build)
+        again = await views.show('calendar', calendar.build)
+        return first, again
+
+    first, again = asyncio.run(scenario())
+
+    assert first is again
+    assert views.window.content is first.content
+    assert (calendar.builds, day.builds) == (1, 1)
+    assert views.reused == 1
+
+
+def test_changes_refresh_only_dependent_screens():
+    """A change refreshes screens depending on it, once, when shown."""
+    views = ViewController(FakeWindow())
+    calendar, workout = Counter({'workouts'}), Counter({'sets'})
+
+    async def scenario():
+        await views.show('calendar', calendar.build)
+        await views.show('workout', workout.build)
+        views.invalidate([SET_ADDED])
+        views.invalidate([SET_ADDED])
+        await views.show('calendar', calendar.build)
+        await views.show('workout', workout.build)
+        await views.show('workout', workout.build)
+
+    asyncio.run(scenario())
+
+    assert (calendar.builds, calendar.refreshes) == (1, 0)
+    assert (workout.builds, workout.refreshes) == (1, 1)
+
+
+def test_changes_narrowed_to_affected_screens():
+    """Screens of one day only go stale for changes on that day."""
+    views = ViewController(FakeWindow())
+    monday = Counter({'workouts', 'sets'}, affected=lambda event: event.date == '2025-11-19')
+    tuesday = Counter({'workouts', 'sets'}, affected=lambda event: event.date == '2025-11-20')
+
+    async def scenario():
+        await views.show('monday', monday.build)
+        await views.show('tuesday', tuesday.build)
+        views.invalidate([SET_ADDED])
+        await views.show('monday', monday.build)
+        await views.show('tuesday', tuesday.build)
+
+    asyncio.run(scenario())
+
+    assert (monday.refreshes, tuesday.refreshes) == (1, 0)
+
+
+def test_stale_screen_without_refresh_is_rebuilt():
+    """Screens without a refresh are built again after a change."""
+    views = ViewController(FakeWindow())
+    progress = Counter({'sets'}, refreshable=False)
+
+    async def scenario():
+        await views.show('progress', progress.build)
+        views.invalidate([SET_ADDED, WORKOUT_ADDED])
+        await views.show('progress', progress.build)
+
+    asyncio.run(scenario())
+
+    assert progress.builds == 2
+
+
+def test_discard_and_bound():
+    """Discarded and least recently used screens are built again."""
+    views = ViewController(FakeWindow(), max_screens=2)
+    screens = [Counter() for _ in range(3)]
+
+    async def scenario():
+        for i, screen in enumerate(screens):
+            await views.show(i, screen.build)
+        views.discard(2)
+        for i, screen in enumerate(screens):
+            await views.show(i, screen.build)
+
+    asyncio.run(scenario())
+
+    # 0 was evicted, 2 discarded, 1 kept
+    assert [screen.builds for screen in screens] == [2, 1, 2]